@@ -0,0 +1 @@
+"""Suite de benchmarks de rendimiento de CS-GradeCalculator."""
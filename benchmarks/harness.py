@@ -0,0 +1,196 @@
+"""Herramientas de medición, percentiles y comparación contra baselines."""
+
+import json
+import math
+import platform
+import time
+from array import array
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+DEFAULT_WARMUP = 1000
+
+
+class BenchmarkResult:
+    """Resultado de un benchmark: latencias por llamada en nanosegundos."""
+
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self, name: str, samples_ns: Sequence[int]):
+        """Inicializa el resultado a partir de las muestras medidas.
+
+        Args:
+            name: Nombre único del benchmark (incluye el tamaño de cohorte)
+            samples_ns: Latencia de cada llamada medida, en nanosegundos
+
+        Raises:
+            ValueError: Si no hay muestras
+        """
+        if not samples_ns:
+            raise ValueError("El benchmark debe tener al menos una muestra")
+
+        ordered = sorted(samples_ns)
+        self._name = name
+        self._iterations = len(ordered)
+        self._total_ns = sum(ordered)
+        self._percentiles = {
+            percentile: percentile_of_sorted(ordered, percentile)
+            for percentile in self.PERCENTILES
+        }
+
+    @property
+    def name(self) -> str:
+        """Obtiene el nombre del benchmark."""
+        return self._name
+
+    @property
+    def iterations(self) -> int:
+        """Obtiene la cantidad de llamadas medidas."""
+        return self._iterations
+
+    @property
+    def mean_ns(self) -> float:
+        """Obtiene la latencia media por llamada."""
+        return self._total_ns / self._iterations
+
+    @property
+    def p50_ns(self) -> int:
+        """Obtiene la mediana de latencia."""
+        return self._percentiles[50]
+
+    @property
+    def p95_ns(self) -> int:
+        """Obtiene el percentil 95 de latencia."""
+        return self._percentiles[95]
+
+    @property
+    def p99_ns(self) -> int:
+        """Obtiene el percentil 99 de latencia."""
+        return self._percentiles[99]
+
+    def to_dict(self) -> dict:
+        """Convierte el resultado a diccionario para el baseline JSON."""
+        return {
+            "iterations": self._iterations,
+            "mean_ns": round(self.mean_ns, 1),
+            "p50_ns": self.p50_ns,
+            "p95_ns": self.p95_ns,
+            "p99_ns": self.p99_ns,
+        }
+
+    def __repr__(self) -> str:
+        """Representación string del resultado."""
+        return (
+            f"BenchmarkResult({self._name}: p50={self.p50_ns}ns, "
+            f"p95={self.p95_ns}ns, p99={self.p99_ns}ns)"
+        )
+
+
+def percentile_of_sorted(ordered: Sequence[int], percentile: float) -> int:
+    """Obtiene un percentil por el método del rango más cercano.
+
+    Args:
+        ordered: Muestras ordenadas de menor a mayor
+        percentile: Percentil entre 0 y 100
+
+    Returns:
+        La muestra correspondiente al percentil
+    """
+    rank = max(1, math.ceil(percentile / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def measure(
+    name: str,
+    operation: Callable[[object], object],
+    inputs: Sequence[object],
+    warmup_inputs: Optional[Sequence[object]] = None
+) -> BenchmarkResult:
+    """Mide la latencia de operation(item) para cada elemento de inputs.
+
+    Antes de medir se ejecuta operation sobre warmup_inputs sin registrar
+    tiempos, para estabilizar cachés y el intérprete.
+
+    Args:
+        name: Nombre del benchmark
+        operation: Función a medir; recibe un elemento de inputs
+        inputs: Datos de entrada, uno por llamada medida
+        warmup_inputs: Datos de calentamiento; por defecto los primeros
+                       DEFAULT_WARMUP elementos de inputs
+
+    Returns:
+        BenchmarkResult con una muestra por elemento de inputs
+    """
+    if warmup_inputs is None:
+        warmup_inputs = inputs[:DEFAULT_WARMUP]
+    for item in warmup_inputs:
+        operation(item)
+
+    clock = time.perf_counter_ns
+    samples = array("q", bytes(8 * len(inputs)))
+    for index, item in enumerate(inputs):
+        start = clock()
+        operation(item)
+        samples[index] = clock() - start
+    return BenchmarkResult(name, samples)
+
+
+def save_baseline(path: Union[str, Path], results: Iterable[BenchmarkResult]) -> None:
+    """Guarda los resultados como baseline JSON.
+
+    Args:
+        path: Ruta del archivo de baseline
+        results: Resultados a guardar
+    """
+    payload = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "benchmarks": {result.name: result.to_dict() for result in results},
+    }
+    Path(path).write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def load_baseline(path: Union[str, Path]) -> Dict[str, dict]:
+    """Carga un baseline JSON.
+
+    Args:
+        path: Ruta del archivo de baseline
+
+    Returns:
+        Diccionario nombre -> métricas guardadas
+    """
+    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    return payload["benchmarks"]
+
+
+def find_regressions(
+    results: Iterable[BenchmarkResult],
+    baseline: Dict[str, dict],
+    threshold: float,
+    metric: str = "p50_ns"
+) -> List[str]:
+    """Compara los resultados contra el baseline.
+
+    Args:
+        results: Resultados actuales
+        baseline: Métricas guardadas por nombre de benchmark
+        threshold: Empeoramiento relativo tolerado (0.2 = 20%)
+        metric: Métrica a comparar (p50_ns, p95_ns, p99_ns o mean_ns)
+
+    Returns:
+        Descripción de cada benchmark que superó el umbral; vacía si no hay
+        regresiones. Los benchmarks ausentes del baseline se ignoran.
+    """
+    regressions = []
+    for result in results:
+        stored = baseline.get(result.name)
+        if stored is None or not stored.get(metric):
+            continue
+        current = result.to_dict()[metric]
+        ratio = current / stored[metric]
+        if ratio > 1.0 + threshold:
+            regressions.append(
+                f"{result.name}: {metric} {stored[metric]} -> {current} "
+                f"(+{(ratio - 1.0) * 100:.1f}%, umbral {threshold * 100:.0f}%)"
+            )
+    return regressions
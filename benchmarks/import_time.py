@@ -0,0 +1,116 @@
+"""Medición del tiempo de importación con -X importtime."""
+
+import subprocess
+import sys
+from pathlib import Path
+from typing import List, Optional, Set
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_IMPORT_MODULE = "src.services.grade_calculator"
+DEFAULT_IMPORT_BUDGET_MS = 75.0
+DEFAULT_IMPORT_RUNS = 5
+
+# Módulos pesados u opcionales que importar el calculador no debe cargar
+FORBIDDEN_MODULES = ("asyncio", "multiprocessing", "concurrent.futures", "numpy")
+
+
+def parse_importtime(output: str, module: str) -> int:
+    """Obtiene el tiempo acumulado de un módulo en la salida de -X importtime.
+
+    Args:
+        output: Texto de stderr con líneas "import time: self | cumulative | name"
+        module: Nombre completo del módulo buscado
+
+    Returns:
+        Tiempo acumulado en microsegundos
+
+    Raises:
+        ValueError: Si el módulo no aparece en la salida
+    """
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1])
+    raise ValueError(f"El módulo {module} no aparece en la salida de importtime")
+
+
+def measure_import_time(
+    module: str = DEFAULT_IMPORT_MODULE,
+    runs: int = DEFAULT_IMPORT_RUNS
+) -> float:
+    """Mide el tiempo de importación en frío de un módulo.
+
+    Cada medición usa un intérprete nuevo; se devuelve la mejor de las
+    ejecuciones para reducir el ruido del sistema.
+
+    Args:
+        module: Módulo a importar
+        runs: Cantidad de intérpretes a lanzar
+
+    Returns:
+        Tiempo acumulado de importación en milisegundos
+    """
+    samples = []
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+        )
+        samples.append(parse_importtime(completed.stderr, module))
+    return min(samples) / 1000
+
+
+def loaded_modules(module: str = DEFAULT_IMPORT_MODULE) -> Set[str]:
+    """Obtiene los módulos cargados tras importar un módulo en un intérprete nuevo."""
+    completed = subprocess.run(
+        [sys.executable, "-c", f"import sys, {module}; print('\\n'.join(sys.modules))"],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    )
+    return set(completed.stdout.split())
+
+
+def check_import_budget(
+    module: str = DEFAULT_IMPORT_MODULE,
+    budget_ms: float = DEFAULT_IMPORT_BUDGET_MS,
+    runs: int = DEFAULT_IMPORT_RUNS
+) -> List[str]:
+    """Verifica el presupuesto de importación de un módulo.
+
+    Args:
+        module: Módulo a importar
+        budget_ms: Tiempo máximo de importación permitido
+        runs: Cantidad de intérpretes a lanzar
+
+    Returns:
+        Descripción de cada incumplimiento; vacía si se cumple el presupuesto
+    """
+    problems = []
+    elapsed_ms = measure_import_time(module, runs)
+    print(f"Importación de {module}: {elapsed_ms:.1f} ms (presupuesto {budget_ms:.1f} ms)")
+    if elapsed_ms > budget_ms:
+        problems.append(
+            f"import {module} tarda {elapsed_ms:.1f} ms, presupuesto {budget_ms:.1f} ms"
+        )
+
+    forbidden = sorted(set(FORBIDDEN_MODULES) & loaded_modules(module))
+    if forbidden:
+        problems.append(f"import {module} carga módulos pesados: {', '.join(forbidden)}")
+    return problems
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Punto de entrada: python -m benchmarks.import_time [módulo] [presupuesto_ms]."""
+    args = sys.argv[1:] if argv is None else argv
+    module = args[0] if args else DEFAULT_IMPORT_MODULE
+    budget_ms = float(args[1]) if len(args) > 1 else DEFAULT_IMPORT_BUDGET_MS
+
+    problems = check_import_budget(module, budget_ms)
+    for problem in problems:
+        print(f"✗ {problem}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
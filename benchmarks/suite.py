@@ -0,0 +1,196 @@
+"""Suite de benchmarks con percentiles y control de regresiones.
+
+Uso:
+    python -m benchmarks.suite --sizes 1000 10000 --save-baseline baseline.json
+    python -m benchmarks.suite --baseline baseline.json --threshold 0.2
+
+Termina con código 1 si algún benchmark empeora más que el umbral respecto
+del baseline guardado, o si importar GradeCalculator supera el presupuesto
+de --import-budget-ms (medido con -X importtime).
+"""
+
+import argparse
+import sys
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.instrumentation import InMemoryMetricsSink
+from src.models.evaluation import Evaluation
+from src.models.grade_detail import GradeDetail
+from src.models.student import Student
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+from src.services.grade_calculator import GradeCalculator
+
+from .harness import (
+    DEFAULT_WARMUP,
+    BenchmarkResult,
+    find_regressions,
+    load_baseline,
+    measure,
+    save_baseline,
+)
+from .import_time import DEFAULT_IMPORT_BUDGET_MS, check_import_budget
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+DEFAULT_THRESHOLD = 0.20
+INPUT_POOL_SIZE = 10_000
+
+# Cada caso recibe el tamaño de cohorte y devuelve (operación, entradas, calentamiento)
+BenchmarkCase = Callable[[int], Tuple[Callable[[object], object], Sequence, Sequence]]
+
+
+def _cycle(pool: Sequence, size: int) -> List:
+    """Repite un conjunto acotado de objetos hasta completar size entradas."""
+    return [pool[index % len(pool)] for index in range(size)]
+
+
+def _build_student(index: int, evaluations: int) -> Student:
+    """Construye un estudiante válido con la cantidad de evaluaciones pedida."""
+    weight = 100.0 / evaluations
+    return Student(
+        f"S{index:07d}",
+        [Evaluation((index + position) % 21, weight) for position in range(evaluations)],
+        has_reached_minimum_classes=index % 10 != 0
+    )
+
+
+def _calculator(metrics_sink: Optional[InMemoryMetricsSink] = None) -> GradeCalculator:
+    """Calculador con las políticas por defecto."""
+    return GradeCalculator(
+        AttendancePolicy(),
+        ExtraPointsPolicy(all_years_teachers=[True] * 3),
+        metrics_sink=metrics_sink
+    )
+
+
+def evaluation_construction(size: int):
+    """Construcción de Evaluation con validación de rangos."""
+    pool = [((index % 21), 10.0) for index in range(min(size, INPUT_POOL_SIZE))]
+    return (lambda pair: Evaluation(pair[0], pair[1])), _cycle(pool, size), None
+
+
+def student_add_evaluation(size: int):
+    """Student.add_evaluation hasta completar MAX_EVALUATIONS por estudiante."""
+    evaluation = Evaluation(15.0, 10.0)
+    per_student = Student.MAX_EVALUATIONS
+    students = [Student(f"S{index:07d}") for index in range(-(-size // per_student))]
+    warmup = [Student(f"W{index:07d}") for index in range(DEFAULT_WARMUP // per_student)]
+    inputs = [students[index // per_student] for index in range(size)]
+    warmup_inputs = [warmup[index // per_student] for index in range(len(warmup) * per_student)]
+    return (lambda student: student.add_evaluation(evaluation)), inputs, warmup_inputs
+
+
+def _calculate_case(evaluations: int) -> BenchmarkCase:
+    """Crea el caso de calculate_final_grade con n evaluaciones por estudiante."""
+    def case(size: int):
+        pool = [_build_student(index, evaluations) for index in range(min(size, INPUT_POOL_SIZE))]
+        return _calculator().calculate_final_grade, _cycle(pool, size), None
+    case.__doc__ = f"GradeCalculator.calculate_final_grade con {evaluations} evaluación(es)."
+    return case
+
+
+def calculate_final_grade_instrumented(size: int):
+    """GradeCalculator.calculate_final_grade con InMemoryMetricsSink y 10 evaluaciones."""
+    pool = [
+        _build_student(index, Student.MAX_EVALUATIONS)
+        for index in range(min(size, INPUT_POOL_SIZE))
+    ]
+    return _calculator(InMemoryMetricsSink()).calculate_final_grade, _cycle(pool, size), None
+
+
+def grade_detail_to_dict(size: int):
+    """GradeDetail.to_dict con redondeo de los cuatro componentes."""
+    pool = [
+        GradeDetail(index % 21 + 0.123, -1.5, 1.0, index % 20 + 0.456)
+        for index in range(min(size, INPUT_POOL_SIZE))
+    ]
+    return GradeDetail.to_dict, _cycle(pool, size), None
+
+
+CASES: Dict[str, BenchmarkCase] = {
+    "evaluation_construction": evaluation_construction,
+    "student_add_evaluation": student_add_evaluation,
+    "calculate_final_grade_1_eval": _calculate_case(1),
+    "calculate_final_grade_10_evals": _calculate_case(Student.MAX_EVALUATIONS),
+    "calculate_final_grade_instrumented": calculate_final_grade_instrumented,
+    "grade_detail_to_dict": grade_detail_to_dict,
+}
+
+
+def run_suite(sizes: Sequence[int], case_names: Sequence[str] = ()) -> List[BenchmarkResult]:
+    """Ejecuta los casos seleccionados para cada tamaño de cohorte.
+
+    Args:
+        sizes: Tamaños de cohorte (llamadas medidas por caso)
+        case_names: Casos a ejecutar; por defecto todos
+
+    Returns:
+        Un BenchmarkResult por caso y tamaño, nombrado "caso@tamaño"
+    """
+    results = []
+    for case_name in case_names or CASES:
+        for size in sizes:
+            operation, inputs, warmup_inputs = CASES[case_name](size)
+            results.append(measure(f"{case_name}@{size}", operation, inputs, warmup_inputs))
+            del inputs, warmup_inputs
+    return results
+
+
+def print_report(results: Sequence[BenchmarkResult]) -> None:
+    """Imprime la tabla de percentiles en microsegundos."""
+    print("=" * 86)
+    print(f"{'BENCHMARK':<44}{'N':>10}{'p50 µs':>10}{'p95 µs':>10}{'p99 µs':>10}")
+    print("=" * 86)
+    for result in results:
+        print(
+            f"{result.name:<44}{result.iterations:>10}"
+            f"{result.p50_ns / 1000:>10.2f}{result.p95_ns / 1000:>10.2f}"
+            f"{result.p99_ns / 1000:>10.2f}"
+        )
+    print("=" * 86)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Punto de entrada de la línea de comandos."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=[])
+    parser.add_argument("--baseline", help="Baseline JSON contra el cual comparar")
+    parser.add_argument("--save-baseline", help="Ruta donde guardar los resultados")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument(
+        "--metric", choices=("p50_ns", "p95_ns", "p99_ns", "mean_ns"), default="p50_ns"
+    )
+    parser.add_argument(
+        "--import-budget-ms", type=float, default=DEFAULT_IMPORT_BUDGET_MS,
+        help="Tiempo máximo de importación de GradeCalculator; 0 omite la verificación"
+    )
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.sizes, args.cases)
+    print_report(results)
+
+    import_problems = []
+    if args.import_budget_ms > 0:
+        import_problems = check_import_budget(budget_ms=args.import_budget_ms)
+        for problem in import_problems:
+            print(f"✗ {problem}")
+
+    if args.save_baseline:
+        save_baseline(args.save_baseline, results)
+        print(f"Baseline guardado en {args.save_baseline}")
+
+    if args.baseline:
+        regressions = find_regressions(
+            results, load_baseline(args.baseline), args.threshold, args.metric
+        )
+        for regression in regressions:
+            print(f"✗ REGRESIÓN {regression}")
+        if regressions:
+            return 1
+        print(f"✓ Sin regresiones sobre {args.metric} (umbral {args.threshold * 100:.0f}%)")
+    return 1 if import_problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,47 @@
 """Test de rendimiento para validar RNF04 (< 300ms por cálculo)."""
 
+import csv
+import math
+import os
+import sqlite3
+import statistics
+import sys
+import tempfile
 import time
+import tracemalloc
+from array import array
+from benchmarks.harness import measure
+from src.analytics import GradeDistribution
+from src.instrumentation import InMemoryMetricsSink
+from src.models.compact_student import CompactStudent
+from src.models.evaluation import Evaluation
+from src.models.grade_detail import GradeDetail
 from src.models.student import Student
+from src.services.bulk_validator import BulkValidator
+from src.services.checkpointed_grading_run import CheckpointedGradingRun
+from src.services.course_scheme import CourseScheme
 from src.services.grade_calculator import GradeCalculator
+from src.services.gradebook import Gradebook
+from src.services.incremental_regrader import IncrementalRegrader
+from src.services.parallel_grade_calculator import ParallelGradeCalculator
+from src.services.scenario_engine import Scenario, ScenarioEngine
+from src.services.shard_coordinator import ShardCoordinator
+from src.services.shared_memory_grade_calculator import SharedMemoryGradeCalculator
+from src.streaming.binary_gradebook import BinaryGradebook, convert_to_gradebook
+from src.streaming.grade_reader import GradeReader
+from src.streaming.result_writer import ResultWriter
+from src.streaming.sqlite_result_store import SqliteResultStore
 from src.policies.attendance_policy import AttendancePolicy
 from src.policies.extra_points_policy import ExtraPointsPolicy
 
+RNF04_LIMIT_MS = 300
 
-def test_performance():
-    """Valida que el cálculo de nota sea menor a 300ms (RNF04)."""
+
+def test_performance(num_calls: int = 10_000):
+    """Valida que el p99 del cálculo de nota sea menor a 300ms (RNF04).
+
+    La suite completa con baselines está en benchmarks/suite.py.
+    """
     # Configurar políticas
     attendance_policy = AttendancePolicy()
     extra_points_policy = ExtraPointsPolicy(all_years_teachers=[True, True, True])
@@ -19,24 +52,26 @@ def test_performance():
     for i in range(10):
         calculator.register_evaluation(student, grade=10.0 + i, weight=10.0)
 
-    # Medir tiempo de cálculo
-    start_time = time.time()
+    # Medir la latencia de muchas llamadas con calentamiento (perf_counter_ns)
+    result = measure(
+        "calculate_final_grade_rnf04", calculator.calculate_final_grade, [student] * num_calls
+    )
     grade_detail = calculator.calculate_final_grade(student)
-    end_time = time.time()
-
-    calculation_time_ms = (end_time - start_time) * 1000
+    p99_ms = result.p99_ns / 1e6
 
     print("=" * 60)
     print("TEST DE RENDIMIENTO - RNF04")
     print("=" * 60)
-    print(f"\nNúmero de evaluaciones: {len(student.evaluations)}")
-    print(f"Tiempo de cálculo: {calculation_time_ms:.2f} ms")
-    print(f"Límite RNF04: 300 ms")
-    print(f"\nResultado: {'✓ APROBADO' if calculation_time_ms < 300 else '✗ REPROBADO'}")
+    print(f"\nNúmero de evaluaciones: {student.evaluation_count}")
+    print(f"Llamadas medidas: {result.iterations}")
+    print(f"Latencia p50/p95/p99: {result.p50_ns / 1000:.2f} / "
+          f"{result.p95_ns / 1000:.2f} / {result.p99_ns / 1000:.2f} µs")
+    print(f"Límite RNF04: {RNF04_LIMIT_MS} ms (sobre p99)")
+    print(f"\nResultado: {'✓ APROBADO' if p99_ms < RNF04_LIMIT_MS else '✗ REPROBADO'}")
     print(f"Nota final calculada: {grade_detail.final_grade}")
     print("=" * 60)
 
-    return calculation_time_ms < 300
+    return p99_ms < RNF04_LIMIT_MS
 
 
 def test_concurrent_simulation():
@@ -104,11 +139,899 @@ def test_determinism():
     return all_equal
 
 
+def _legacy_calculate_final_grade(
+    attendance_policy: AttendancePolicy,
+    extra_points_policy: ExtraPointsPolicy,
+    student: Student
+) -> GradeDetail:
+    """Réplica del cálculo original: tres copias de la lista y dos pasadas."""
+    if not student.evaluations:
+        raise ValueError("El estudiante debe tener al menos una evaluación")
+    total_weight = sum(evaluation.weight for evaluation in student.evaluations)
+    if abs(total_weight - GradeCalculator.MINIMUM_WEIGHT_SUM) > 0.01:
+        raise ValueError("Los pesos de las evaluaciones deben sumar 100.0%")
+
+    weighted_average = sum(
+        evaluation.grade * (evaluation.weight / 100.0)
+        for evaluation in student.evaluations
+    )
+    grade_after_attendance = attendance_policy.apply_penalty(
+        student.has_reached_minimum_classes, weighted_average
+    )
+    attendance_penalty = attendance_policy.calculate_penalty_amount(
+        student.has_reached_minimum_classes, weighted_average
+    )
+    extra_points = extra_points_policy.calculate_extra_points(student_meets_criteria=True)
+    final_grade = max(
+        GradeCalculator.MIN_FINAL_GRADE,
+        min(grade_after_attendance + extra_points, GradeCalculator.MAX_FINAL_GRADE)
+    )
+    return GradeDetail(weighted_average, attendance_penalty, extra_points, final_grade)
+
+
+def test_calculation_latency(num_calls: int = 1_000_000):
+    """Compara la latencia por llamada del cálculo original y la pasada única."""
+    print("\n" + "=" * 60)
+    print("TEST DE LATENCIA - calculate_final_grade")
+    print("=" * 60)
+
+    attendance_policy = AttendancePolicy()
+    extra_points_policy = ExtraPointsPolicy(all_years_teachers=[True, True, True])
+    calculator = GradeCalculator(attendance_policy, extra_points_policy)
+
+    student = Student(student_id="20210001", has_reached_minimum_classes=True)
+    for i in range(Student.MAX_EVALUATIONS):
+        calculator.register_evaluation(student, grade=10.0 + i, weight=10.0)
+
+    start_ns = time.perf_counter_ns()
+    for _ in range(num_calls):
+        legacy_detail = _legacy_calculate_final_grade(
+            attendance_policy, extra_points_policy, student
+        )
+    legacy_ns = (time.perf_counter_ns() - start_ns) / num_calls
+
+    calculate = calculator.calculate_final_grade
+    start_ns = time.perf_counter_ns()
+    for _ in range(num_calls):
+        grade_detail = calculate(student)
+    single_pass_ns = (time.perf_counter_ns() - start_ns) / num_calls
+
+    # Hasta Python 3.11 sum() acumula en orden y coincide bit a bit con la
+    # pasada única; desde 3.12 usa suma compensada y puede diferir en el
+    # último bit, así que se compara con tolerancia relativa.
+    exact = sys.version_info < (3, 12)
+    tolerance = 0.0 if exact else 1e-12
+    identical = all(
+        math.isclose(legacy_value, value, rel_tol=tolerance, abs_tol=0.0)
+        for legacy_value, value in (
+            (legacy_detail.weighted_average, grade_detail.weighted_average),
+            (legacy_detail.final_grade, grade_detail.final_grade),
+        )
+    )
+    python_version = f"{sys.version_info.major}.{sys.version_info.minor}"
+
+    print(f"\nLlamadas: {num_calls}")
+    print(f"Cálculo original: {legacy_ns / 1000:.2f} µs/llamada")
+    print(f"Pasada única:     {single_pass_ns / 1000:.2f} µs/llamada")
+    print(f"Mejora: {legacy_ns / single_pass_ns:.2f}x")
+    print(
+        f"Coincide con sum() en Python {python_version} "
+        f"({'bit a bit' if exact else f'tolerancia {tolerance}'}): "
+        f"{'✓' if identical else '✗'}"
+    )
+    print("=" * 60)
+
+    return identical and single_pass_ns < legacy_ns
+
+
+class _LegacyEvaluation:
+    """Réplica de Evaluation con __dict__ por instancia (antes de __slots__)."""
+
+    def __init__(self, grade: float, weight: float):
+        self._grade = float(grade)
+        self._weight = float(weight)
+
+
+class _LegacyStudent:
+    """Réplica de Student con __dict__ y lista de evaluaciones."""
+
+    def __init__(self, student_id: str, evaluations: list):
+        self._student_id = student_id
+        self._evaluations = evaluations
+        self._has_reached_minimum_classes = True
+
+
+def _measure_bytes_per_student(build_student, num_students: int) -> float:
+    """Mide con tracemalloc los bytes retenidos por estudiante construido."""
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    students = [build_student(index) for index in range(num_students)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del students
+    return (current - baseline) / num_students
+
+
+def test_memory_footprint(num_students: int = 10_000):
+    """Compara los bytes por estudiante de cada representación (10 notas)."""
+    print("\n" + "=" * 60)
+    print("TEST DE MEMORIA - REPRESENTACIÓN COMPACTA")
+    print("=" * 60)
+
+    grades = [10.0 + i for i in range(Student.MAX_EVALUATIONS)]
+    weight = 100.0 / Student.MAX_EVALUATIONS
+
+    def build_legacy(index):
+        return _LegacyStudent(
+            f"S{index:07d}", [_LegacyEvaluation(grade, weight) for grade in grades]
+        )
+
+    def build_slotted(index):
+        return Student(
+            f"S{index:07d}",
+            [Evaluation(grade, weight) for grade in grades],
+            has_reached_minimum_classes=True
+        )
+
+    def build_compact(index):
+        return CompactStudent(
+            f"S{index:07d}",
+            [Evaluation(grade, weight) for grade in grades],
+            has_reached_minimum_classes=True
+        )
+
+    legacy_bytes = _measure_bytes_per_student(build_legacy, num_students)
+    slotted_bytes = _measure_bytes_per_student(build_slotted, num_students)
+    compact_bytes = _measure_bytes_per_student(build_compact, num_students)
+
+    print(f"\nEstudiantes medidos: {num_students}")
+    print(f"Antes (__dict__ + lista): {legacy_bytes:.0f} bytes/estudiante")
+    print(f"Student con __slots__:    {slotted_bytes:.0f} bytes/estudiante")
+    print(f"CompactStudent:           {compact_bytes:.0f} bytes/estudiante")
+    print(f"Reducción: {legacy_bytes / compact_bytes:.1f}x")
+    print("=" * 60)
+
+    return compact_bytes < slotted_bytes < legacy_bytes
+
+
+def _build_population(num_students: int) -> list:
+    """Construye una población de estudiantes con 10 evaluaciones cada uno."""
+    weight = 100.0 / Student.MAX_EVALUATIONS
+    return [
+        Student(
+            f"S{index:07d}",
+            [
+                Evaluation((index + position) % 21, weight)
+                for position in range(Student.MAX_EVALUATIONS)
+            ],
+            has_reached_minimum_classes=index % 10 != 0
+        )
+        for index in range(num_students)
+    ]
+
+
+def test_parallel_scaling(num_students: int = 200_000, chunk_size: int = 5_000):
+    """Mide el escalamiento del cálculo paralelo con 1, 2, 4 y 8 procesos."""
+    print("\n" + "=" * 60)
+    print("TEST DE ESCALAMIENTO PARALELO - RNF02")
+    print("=" * 60)
+
+    attendance_policy = AttendancePolicy()
+    extra_points_policy = ExtraPointsPolicy(all_years_teachers=[True, True])
+    calculator = GradeCalculator(attendance_policy, extra_points_policy)
+    students = _build_population(num_students)
+
+    start_ns = time.perf_counter_ns()
+    serial_results = [calculator.calculate_final_grade(student) for student in students]
+    serial_ms = (time.perf_counter_ns() - start_ns) / 1e6
+    print(f"\nEstudiantes: {num_students} (bloques de {chunk_size})")
+    print(f"Serial:      {serial_ms:8.1f} ms")
+
+    all_identical = True
+    for workers in (1, 2, 4, 8):
+        with ParallelGradeCalculator(
+            attendance_policy, extra_points_policy, max_workers=workers, chunk_size=chunk_size
+        ) as parallel:
+            start_ns = time.perf_counter_ns()
+            results = parallel.calculate_final_grades(students)
+            elapsed_ms = (time.perf_counter_ns() - start_ns) / 1e6
+
+        identical = all(
+            result.final_grade == expected.final_grade
+            and result.weighted_average == expected.weighted_average
+            for result, expected in zip(results, serial_results)
+        )
+        all_identical = all_identical and identical
+        print(
+            f"{workers} proceso(s): {elapsed_ms:8.1f} ms  "
+            f"speedup {serial_ms / elapsed_ms:5.2f}x  "
+            f"idéntico {'✓' if identical else '✗'}"
+        )
+
+    print("=" * 60)
+    return all_identical
+
+
+def test_instrumentation_overhead(num_calls: int = 200_000):
+    """Mide el costo de la instrumentación desactivada y activada."""
+    print("\n" + "=" * 60)
+    print("TEST DE OVERHEAD - instrumentación de calculate_final_grade")
+    print("=" * 60)
+
+    attendance_policy = AttendancePolicy()
+    extra_points_policy = ExtraPointsPolicy(all_years_teachers=[True, True, True])
+    calculator = GradeCalculator(attendance_policy, extra_points_policy)
+    instrumented = GradeCalculator(
+        attendance_policy, extra_points_policy, metrics_sink=InMemoryMetricsSink()
+    )
+    student = Student(student_id="20210001", has_reached_minimum_classes=True)
+    for i in range(Student.MAX_EVALUATIONS):
+        calculator.register_evaluation(student, grade=10.0 + i, weight=10.0)
+
+    def reference(target):
+        # Mismo cálculo sin la comprobación del destino de métricas
+        return calculator._build_grade_detail(
+            calculator._accumulate_evaluations(target), target.has_reached_minimum_classes
+        )
+
+    inputs = [student] * num_calls
+    timings = [
+        measure("sin instrumentación", reference, inputs),
+        measure("destino desactivado", calculator.calculate_final_grade, inputs),
+        measure("InMemoryMetricsSink", instrumented.calculate_final_grade, inputs),
+    ]
+    baseline_ns = timings[0].p50_ns
+
+    print(f"\nLlamadas: {num_calls}")
+    for result in timings:
+        print(
+            f"{result.name:<22} p50 {result.p50_ns / 1000:6.2f} µs  "
+            f"media {result.mean_ns / 1000:6.2f} µs  "
+            f"overhead {(result.p50_ns / baseline_ns - 1) * 100:+6.1f}%"
+        )
+
+    disabled_overhead = timings[1].p50_ns / baseline_ns - 1
+    print(f"Overhead desactivado < 5%: {'✓' if disabled_overhead < 0.05 else '✗'}")
+    print("=" * 60)
+
+    return disabled_overhead < 0.05
+
+
+def test_bulk_validation(num_students: int = 100_000):
+    """Compara la validación por objeto con BulkValidator sobre columnas."""
+    print("\n" + "=" * 60)
+    print("TEST DE VALIDACIÓN MASIVA - importación de cohortes")
+    print("=" * 60)
+
+    width = Student.MAX_EVALUATIONS
+    student_ids = [f"S{index:07d}" for index in range(num_students)]
+    grades = array("d", [(index % 21) * 1.0 for index in range(num_students * width)])
+    weights = array("d", [10.0]) * (num_students * width)
+
+    start_ns = time.perf_counter_ns()
+    per_object_errors = 0
+    for row, student_id in enumerate(student_ids):
+        try:
+            start = row * width
+            Student(student_id, [
+                Evaluation(grades[position], weights[position])
+                for position in range(start, start + width)
+            ])
+        except ValueError:
+            per_object_errors += 1
+    per_object_ms = (time.perf_counter_ns() - start_ns) / 1e6
+
+    start_ns = time.perf_counter_ns()
+    report = BulkValidator().validate_batch_flat(student_ids, grades, weights, width)
+    bulk_ms = (time.perf_counter_ns() - start_ns) / 1e6
+
+    print(f"\nEstudiantes: {num_students} x {width} evaluaciones")
+    print(f"Validación por objeto: {per_object_ms:8.1f} ms")
+    print(f"BulkValidator:         {bulk_ms:8.1f} ms")
+    print(f"Mejora: {per_object_ms / bulk_ms:.2f}x")
+    print(f"Lote válido: {'✓' if report.is_valid and per_object_errors == 0 else '✗'}")
+    print("=" * 60)
+
+    return report.is_valid and bulk_ms < per_object_ms
+
+
+def test_gradebook_load(num_students: int = 100_000):
+    """Compara la carga desde CSV con la apertura del libro de notas binario."""
+    print("\n" + "=" * 60)
+    print("TEST DE CARGA - CSV vs libro de notas binario (mmap)")
+    print("=" * 60)
+
+    calculator = GradeCalculator(
+        AttendancePolicy(), ExtraPointsPolicy(all_years_teachers=[True, True])
+    )
+    width = Student.MAX_EVALUATIONS
+
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, "cohorte.csv")
+        gradebook_path = os.path.join(directory, "cohorte.grdb")
+        with open(csv_path, "w", newline="", encoding="utf-8") as target:
+            writer = csv.writer(target)
+            writer.writerow(["student_id", "grade", "weight", "has_reached_minimum_classes"])
+            for index in range(num_students):
+                for position in range(width):
+                    writer.writerow([
+                        f"S{index:07d}", (index + position) % 21, 10.0, index % 10 != 0
+                    ])
+        convert_to_gradebook(csv_path, gradebook_path)
+
+        start_ns = time.perf_counter_ns()
+        reader = GradeReader(csv_path)
+        csv_results = [
+            calculator.calculate_final_grade(student)
+            for _, student in reader.iter_students(lambda *rejected: None)
+        ]
+        csv_ms = (time.perf_counter_ns() - start_ns) / 1e6
+
+        start_ns = time.perf_counter_ns()
+        with BinaryGradebook(gradebook_path) as gradebook:
+            open_ms = (time.perf_counter_ns() - start_ns) / 1e6
+            results = calculator.calculate_batch_flat(
+                gradebook.student_ids, gradebook.grades, gradebook.weights,
+                gradebook.attendance, gradebook.evaluations_per_student,
+                gradebook.evaluation_counts
+            )
+            binary_ms = (time.perf_counter_ns() - start_ns) / 1e6
+            identical = all(
+                results.final_grades[index] == detail.final_grade
+                for index, detail in enumerate(csv_results)
+            )
+
+    print(f"\nEstudiantes: {num_students} x {width} evaluaciones")
+    print(f"CSV (parseo + cálculo):     {csv_ms:10.1f} ms")
+    print(f"Binario (apertura):         {open_ms:10.3f} ms")
+    print(f"Binario (apertura + lote):  {binary_ms:10.1f} ms")
+    print(f"Mejora: {csv_ms / binary_ms:.2f}x")
+    print(f"Resultados idénticos: {'✓' if identical else '✗'}")
+    print("=" * 60)
+
+    return identical
+
+
+def test_result_set_export(num_students: int = 200_000):
+    """Compara el cálculo y la exportación por objeto con GradeDetailSet."""
+    print("\n" + "=" * 60)
+    print("TEST DE EXPORTACIÓN - GradeDetail por fila vs GradeDetailSet")
+    print("=" * 60)
+
+    calculator = GradeCalculator(
+        AttendancePolicy(), ExtraPointsPolicy(all_years_teachers=[True, True])
+    )
+    students = _build_population(num_students)
+
+    with tempfile.TemporaryDirectory() as directory:
+        rows_path = os.path.join(directory, "filas.csv")
+        bulk_path = os.path.join(directory, "bloque.csv")
+
+        start_ns = time.perf_counter_ns()
+        with ResultWriter(rows_path) as writer:
+            for student in students:
+                writer.write(student.student_id, calculator.calculate_final_grade(student))
+        rows_ms = (time.perf_counter_ns() - start_ns) / 1e6
+
+        start_ns = time.perf_counter_ns()
+        with ResultWriter(bulk_path) as writer:
+            writer.write_set(calculator.calculate_final_grades(students))
+        bulk_ms = (time.perf_counter_ns() - start_ns) / 1e6
+
+        with open(rows_path, encoding="utf-8") as rows_file, \
+                open(bulk_path, encoding="utf-8") as bulk_file:
+            identical = rows_file.read() == bulk_file.read()
+
+    print(f"\nEstudiantes: {num_students}")
+    print(f"GradeDetail + to_dict por fila: {rows_ms:8.1f} ms")
+    print(f"GradeDetailSet + write_set:     {bulk_ms:8.1f} ms")
+    print(f"Mejora: {rows_ms / bulk_ms:.2f}x")
+    print(f"Archivos idénticos: {'✓' if identical else '✗'}")
+    print("=" * 60)
+
+    return identical
+
+
+def test_scenario_sweep(num_students: int = 100_000, num_scenarios: int = 200):
+    """Compara recalcular la cohorte por escenario con ScenarioEngine."""
+    print("\n" + "=" * 60)
+    print("TEST DE ESCENARIOS - variantes de políticas")
+    print("=" * 60)
+
+    students = _build_population(num_students)
+    scenarios = [
+        Scenario(
+            f"penalidad_{index % 20}_extra_{index // 20}",
+            AttendancePolicy(float(index % 20)),
+            ExtraPointsPolicy([True], float(index // 20) / 2)
+        )
+        for index in range(num_scenarios)
+    ]
+
+    rebuilt = scenarios[:10]
+    start_ns = time.perf_counter_ns()
+    expected = [
+        GradeCalculator(scenario.attendance_policy, scenario.extra_points_policy)
+        .calculate_final_grades(students).final_grades
+        for scenario in rebuilt
+    ]
+    rebuild_ms = (time.perf_counter_ns() - start_ns) / 1e6 / len(rebuilt)
+
+    start_ns = time.perf_counter_ns()
+    result = ScenarioEngine().run(students, scenarios)
+    engine_ms = (time.perf_counter_ns() - start_ns) / 1e6 / num_scenarios
+
+    identical = all(
+        result.final_grades(scenario.name) == column
+        for scenario, column in zip(rebuilt, expected)
+    )
+
+    print(f"\nEstudiantes: {num_students}, escenarios: {num_scenarios}")
+    print(f"Recalcular por escenario: {rebuild_ms:8.1f} ms/escenario")
+    print(f"ScenarioEngine:           {engine_ms:8.1f} ms/escenario")
+    print(f"Mejora: {rebuild_ms / engine_ms:.2f}x")
+    print(f"Resultados idénticos: {'✓' if identical else '✗'}")
+    print("=" * 60)
+
+    return identical
+
+
+def test_course_scheme(num_students: int = 200_000):
+    """Compara calculate_batch_flat con un CourseScheme precompilado."""
+    print("\n" + "=" * 60)
+    print("TEST DE ESQUEMA FIJO - pesos por fila vs CourseScheme")
+    print("=" * 60)
+
+    weights_row = [10.0, 15.0, 20.0, 25.0, 30.0]
+    width = len(weights_row)
+    calculator = GradeCalculator(
+        AttendancePolicy(), ExtraPointsPolicy(all_years_teachers=[True, True])
+    )
+    student_ids = [f"S{index:06d}" for index in range(num_students)]
+    grades = array("d", ((index * 7 + 3) % 201 / 10.0 for index in range(num_students * width)))
+    weights = array("d", weights_row * num_students)
+    attendance = [index % 9 != 0 for index in range(num_students)]
+
+    start_ns = time.perf_counter_ns()
+    expected = calculator.calculate_batch_flat(student_ids, grades, weights, attendance, width)
+    flat_ms = (time.perf_counter_ns() - start_ns) / 1e6
+
+    start_ns = time.perf_counter_ns()
+    scheme = CourseScheme(weights_row)
+    result = calculator.calculate_course(scheme, student_ids, grades, attendance)
+    scheme_ms = (time.perf_counter_ns() - start_ns) / 1e6
+
+    identical = result.final_grades == expected.final_grades
+
+    print(f"\nEstudiantes: {num_students}, evaluaciones: {width}")
+    print(f"calculate_batch_flat: {flat_ms:8.1f} ms")
+    print(f"CourseScheme:         {scheme_ms:8.1f} ms")
+    print(f"Mejora: {flat_ms / scheme_ms:.2f}x")
+    print(f"Resultados idénticos: {'✓' if identical else '✗'}")
+    print("=" * 60)
+
+    return identical
+
+
+def test_sharded_job(num_students: int = 200_000, shard_count: int = 64):
+    """Mide un trabajo repartido en shards frente al cálculo serial."""
+    print("\n" + "=" * 60)
+    print("TEST DE TRABAJO EN SHARDS - coordinador local")
+    print("=" * 60)
+
+    attendance_policy = AttendancePolicy()
+    extra_points_policy = ExtraPointsPolicy(all_years_teachers=[True, True])
+    calculator = GradeCalculator(attendance_policy, extra_points_policy)
+    students = _build_population(num_students)
+
+    start_ns = time.perf_counter_ns()
+    serial_results = [calculator.calculate_final_grade(student) for student in students]
+    serial_ms = (time.perf_counter_ns() - start_ns) / 1e6
+    print(f"\nEstudiantes: {num_students}, shards: {shard_count}")
+    print(f"Serial:          {serial_ms:8.1f} ms")
+
+    all_identical = True
+    for workers in (2, 4, 8):
+        coordinator = ShardCoordinator(
+            attendance_policy, extra_points_policy,
+            shard_count=shard_count, worker_count=workers
+        )
+        start_ns = time.perf_counter_ns()
+        results = coordinator.calculate_final_grades(students)
+        elapsed_ms = (time.perf_counter_ns() - start_ns) / 1e6
+
+        identical = all(
+            result.to_dict() == expected.to_dict()
+            and result.final_grade == expected.final_grade
+            for result, expected in zip(results, serial_results)
+        )
+        all_identical = all_identical and identical
+        print(
+            f"{workers} trabajador(es): {elapsed_ms:8.1f} ms  "
+            f"speedup {serial_ms / elapsed_ms:5.2f}x  "
+            f"idéntico {'✓' if identical else '✗'}"
+        )
+
+    print("=" * 60)
+    return all_identical
+
+
+def test_checkpoint_overhead(num_students: int = 100_000):
+    """Mide el costo de los checkpoints según el intervalo elegido."""
+    print("\n" + "=" * 60)
+    print("TEST DE CHECKPOINTS - costo de E/S vs trabajo repetido")
+    print("=" * 60)
+
+    calculator = GradeCalculator(
+        AttendancePolicy(), ExtraPointsPolicy(all_years_teachers=[True, True])
+    )
+    students = _build_population(num_students)
+
+    start_ns = time.perf_counter_ns()
+    expected = [calculator.calculate_final_grade(student) for student in students]
+    plain_ms = (time.perf_counter_ns() - start_ns) / 1e6
+    print(f"\nEstudiantes: {num_students}")
+    print(f"Sin checkpoints:        {plain_ms:8.1f} ms")
+
+    all_identical = True
+    with tempfile.TemporaryDirectory() as directory:
+        for interval in (100, 1_000, 10_000):
+            path = os.path.join(directory, f"checkpoints_{interval}.db")
+            with CheckpointedGradingRun(calculator, path, interval) as run:
+                start_ns = time.perf_counter_ns()
+                results = run.run(students)
+                elapsed_ms = (time.perf_counter_ns() - start_ns) / 1e6
+                resumed = run.run(students)
+
+            identical = all(
+                result.final_grade == detail.final_grade == reference.final_grade
+                for result, detail, reference in zip(results, resumed, expected)
+            )
+            all_identical = all_identical and identical
+            print(
+                f"Intervalo {interval:6d}:       {elapsed_ms:8.1f} ms  "
+                f"sobrecosto {elapsed_ms / plain_ms - 1:6.1%}  "
+                f"idéntico {'✓' if identical else '✗'}"
+            )
+
+    print("=" * 60)
+    return all_identical
+
+
+def test_grade_distribution(num_students: int = 200_000):
+    """Compara las estadísticas por pasadas sobre listas con GradeDistribution."""
+    print("\n" + "=" * 60)
+    print("TEST DE DISTRIBUCIÓN - varias pasadas vs una pasada en streaming")
+    print("=" * 60)
+
+    calculator = GradeCalculator(
+        AttendancePolicy(), ExtraPointsPolicy(all_years_teachers=[True, True])
+    )
+    students = _build_population(num_students)
+
+    def with_lists():
+        details = [calculator.calculate_final_grade(student) for student in students]
+        report = {}
+        for name in ("final_grade", "weighted_average"):
+            values = [getattr(detail, name) for detail in details]
+            histogram = [0] * 40
+            for value in values:
+                histogram[min(int(value / 0.5), 39)] += 1
+            report[name] = (
+                statistics.fmean(values), statistics.pvariance(values),
+                min(values), max(values), statistics.quantiles(values, n=4), histogram
+            )
+        passed = sum(1 for detail in details if detail.final_grade >= 10.5)
+        return report, passed
+
+    def with_stream():
+        return GradeDistribution().update(
+            calculator.calculate_final_grade(student) for student in students
+        )
+
+    measurements = {}
+    for name, run in (("lists", with_lists), ("stream", with_stream)):
+        start_ns = time.perf_counter_ns()
+        result = run()
+        elapsed_ms = (time.perf_counter_ns() - start_ns) / 1e6
+        tracemalloc.start()
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        measurements[name] = (result, elapsed_ms, peak)
+
+    (report, passed), lists_ms, lists_peak = measurements["lists"]
+    distribution, stream_ms, stream_peak = measurements["stream"]
+    mean, variance = report["final_grade"][:2]
+    consistent = (
+        distribution.passed == passed
+        and abs(distribution.final_grade.mean - mean) < 1e-9
+        and abs(distribution.final_grade.variance - variance) < 1e-9
+        and distribution.final_grade.histogram == report["final_grade"][5]
+    )
+
+    print(f"\nEstudiantes: {num_students}")
+    print(f"Listas + varias pasadas: {lists_ms:8.1f} ms  pico {lists_peak / 1e6:7.1f} MB")
+    print(f"GradeDistribution:       {stream_ms:8.1f} ms  pico {stream_peak / 1e6:7.1f} MB")
+    print(f"Mejora: {lists_ms / stream_ms:.2f}x")
+    print(f"Estadísticas consistentes: {'✓' if consistent else '✗'}")
+    print("=" * 60)
+
+    return consistent
+
+
+def test_gradebook_lookup(num_students: int = 50_000, num_requests: int = 2_000):
+    """Compara buscar estudiantes recorriendo una lista con Gradebook."""
+    print("\n" + "=" * 60)
+    print("TEST DE GRADEBOOK - búsqueda lineal vs índice por ID")
+    print("=" * 60)
+
+    calculator = GradeCalculator(
+        AttendancePolicy(), ExtraPointsPolicy(all_years_teachers=[True, True])
+    )
+    students = _build_population(num_students)
+    requested = [
+        students[(index * 7919) % num_students].student_id for index in range(num_requests)
+    ]
+
+    gradebook = Gradebook()
+    for index, student in enumerate(students):
+        gradebook.add_student(student, f"SEC{index % 50:02d}")
+
+    start_ns = time.perf_counter_ns()
+    scanned = [
+        calculator.calculate_final_grade(
+            next(student for student in students if student.student_id == student_id)
+        )
+        for student_id in requested
+    ]
+    scan_ms = (time.perf_counter_ns() - start_ns) / 1e6
+
+    start_ns = time.perf_counter_ns()
+    indexed = [gradebook.grade_student(student_id, calculator) for student_id in requested]
+    index_ms = (time.perf_counter_ns() - start_ns) / 1e6
+
+    section_ids = gradebook.section_student_ids("SEC00")
+    start_ns = time.perf_counter_ns()
+    per_student = [calculator.calculate_final_grade(gradebook.get(sid)) for sid in section_ids]
+    per_student_ms = (time.perf_counter_ns() - start_ns) / 1e6
+    start_ns = time.perf_counter_ns()
+    section = gradebook.grade_section("SEC00", calculator)
+    section_ms = (time.perf_counter_ns() - start_ns) / 1e6
+
+    identical = all(
+        left.to_dict() == right.to_dict() for left, right in zip(scanned, indexed)
+    ) and list(section.final_grades) == [detail.final_grade for detail in per_student]
+
+    print(f"\nEstudiantes: {num_students}, consultas: {num_requests}")
+    print(f"Búsqueda lineal:   {scan_ms:8.1f} ms  ({scan_ms * 1000 / num_requests:8.1f} µs/consulta)")
+    print(f"Gradebook:         {index_ms:8.1f} ms  ({index_ms * 1000 / num_requests:8.1f} µs/consulta)")
+    print(f"Mejora: {scan_ms / index_ms:.1f}x")
+    print(f"Sección de {len(section_ids)}: por estudiante {per_student_ms:.1f} ms, "
+          f"grade_section {section_ms:.1f} ms")
+    print(f"Resultados idénticos: {'✓' if identical else '✗'}")
+    print("=" * 60)
+
+    return identical
+
+
+def test_incremental_regrade(num_students: int = 200_000, changed_ratio: float = 0.05):
+    """Compara recalcular toda la cohorte con recalcular solo los cambios."""
+    print("\n" + "=" * 60)
+    print("TEST DE RECÁLCULO INCREMENTAL - seguimiento de cambios")
+    print("=" * 60)
+
+    calculator = GradeCalculator(
+        AttendancePolicy(), ExtraPointsPolicy(all_years_teachers=[True, True])
+    )
+    students = _build_population(num_students)
+    regrader = IncrementalRegrader(calculator)
+    regrader.regrade(students)
+
+    step = int(1 / changed_ratio)
+    for student in students[::step]:
+        student.set_attendance_status(not student.has_reached_minimum_classes)
+
+    start_ns = time.perf_counter_ns()
+    full = [calculator.calculate_final_grade(student) for student in students]
+    full_ms = (time.perf_counter_ns() - start_ns) / 1e6
+
+    start_ns = time.perf_counter_ns()
+    summary = regrader.regrade(students)
+    incremental_ms = (time.perf_counter_ns() - start_ns) / 1e6
+
+    identical = all(
+        regrader.grade_detail(student.student_id).to_dict() == detail.to_dict()
+        for student, detail in zip(students, full)
+    )
+
+    print(f"\nEstudiantes: {num_students}, modificados: {summary.recomputed}")
+    print(f"Recálculo completo:    {full_ms:8.1f} ms")
+    print(f"IncrementalRegrader:   {incremental_ms:8.1f} ms  (omitidos {summary.skipped})")
+    print(f"Mejora: {full_ms / incremental_ms:.2f}x")
+    print(f"Resultados idénticos: {'✓' if identical else '✗'}")
+    print("=" * 60)
+
+    return identical
+
+
+def test_sqlite_result_store(num_students: int = 100_000, num_row_inserts: int = 2_000):
+    """Compara insertar to_dict() fila por fila con SqliteResultStore."""
+    print("\n" + "=" * 60)
+    print("TEST DE PERSISTENCIA - inserción por fila vs lotes en SQLite")
+    print("=" * 60)
+
+    calculator = GradeCalculator(
+        AttendancePolicy(), ExtraPointsPolicy(all_years_teachers=[True, True])
+    )
+    detail_set = calculator.calculate_final_grades(_build_population(num_students))
+    fingerprint = calculator.policy_fingerprint
+
+    with tempfile.TemporaryDirectory() as directory:
+        connection = sqlite3.connect(os.path.join(directory, "filas.db"))
+        connection.execute(
+            "CREATE TABLE results (student_id TEXT PRIMARY KEY, weighted_average REAL, "
+            "attendance_penalty REAL, extra_points REAL, final_grade REAL, "
+            "policy_fingerprint TEXT, graded_at REAL)"
+        )
+        start_ns = time.perf_counter_ns()
+        for index in range(num_row_inserts):
+            row = detail_set[index].to_dict()
+            connection.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (detail_set.student_id_at(index), row["weighted_average"],
+                 row["attendance_penalty"], row["extra_points"], row["final_grade"],
+                 fingerprint, time.time())
+            )
+            connection.commit()
+        row_us = (time.perf_counter_ns() - start_ns) / 1e3 / num_row_inserts
+        connection.close()
+
+        with SqliteResultStore(os.path.join(directory, "lotes.db")) as store:
+            start_ns = time.perf_counter_ns()
+            store.upsert_set(detail_set, fingerprint)
+            bulk_ms = (time.perf_counter_ns() - start_ns) / 1e6
+
+            start_ns = time.perf_counter_ns()
+            loaded = store.load_set()
+            load_ms = (time.perf_counter_ns() - start_ns) / 1e6
+
+    identical = (
+        loaded.student_ids == detail_set.student_ids
+        and loaded.final_grades == detail_set.final_grades
+        and loaded.weighted_averages == detail_set.weighted_averages
+    )
+
+    print(f"\nEstudiantes: {num_students}")
+    print(f"Fila por fila:      {row_us:8.1f} µs/estudiante "
+          f"(~{row_us * num_students / 1e6:.1f} s estimados)")
+    print(f"SqliteResultStore:  {bulk_ms * 1000 / num_students:8.1f} µs/estudiante "
+          f"({bulk_ms:.1f} ms)")
+    print(f"Mejora: {row_us * num_students / 1000 / bulk_ms:.1f}x")
+    print(f"Carga en columnas:  {load_ms:8.1f} ms")
+    print(f"Resultados idénticos: {'✓' if identical else '✗'}")
+    print("=" * 60)
+
+    return identical
+
+
+def test_buffer_input(num_students: int = 100_000, width: int = 4):
+    """Compara construir Student/Evaluation desde un buffer con leerlo en el lugar."""
+    print("\n" + "=" * 60)
+    print("TEST DE ENTRADA POR BUFFER - objetos por evaluación vs memoryview")
+    print("=" * 60)
+
+    calculator = GradeCalculator(
+        AttendancePolicy(), ExtraPointsPolicy(all_years_teachers=[True, True])
+    )
+    student_ids = [f"S{index:06d}" for index in range(num_students)]
+    grades = array("d", ((index * 7 + slot * 3) % 21 for index in range(num_students)
+                         for slot in range(width)))
+    weights = array("d", [100.0 / width]) * (num_students * width)
+    raw_grades, raw_weights = grades.tobytes(), weights.tobytes()
+    attendance = bytes(index % 10 != 0 for index in range(num_students))
+
+    start_ns = time.perf_counter_ns()
+    grade_view = memoryview(raw_grades).cast("d")
+    weight_view = memoryview(raw_weights).cast("d")
+    students = [
+        Student(
+            student_ids[row],
+            [Evaluation(grade_view[position], weight_view[position])
+             for position in range(row * width, (row + 1) * width)],
+            bool(attendance[row])
+        )
+        for row in range(num_students)
+    ]
+    objects_result = calculator.calculate_final_grades(students)
+    objects_ms = (time.perf_counter_ns() - start_ns) / 1e6
+    del students, grade_view, weight_view
+
+    start_ns = time.perf_counter_ns()
+    buffer_result = calculator.calculate_buffers(
+        student_ids, raw_grades, raw_weights, attendance, width
+    )
+    buffer_ms = (time.perf_counter_ns() - start_ns) / 1e6
+
+    identical = (
+        buffer_result.final_grades == objects_result.final_grades
+        and buffer_result.weighted_averages == objects_result.weighted_averages
+        and buffer_result.attendance_penalties == objects_result.attendance_penalties
+    )
+
+    print(f"\nEstudiantes: {num_students} x {width} evaluaciones")
+    print(f"Student/Evaluation: {objects_ms:8.1f} ms")
+    print(f"calculate_buffers:  {buffer_ms:8.1f} ms")
+    print(f"Mejora: {objects_ms / buffer_ms:.1f}x")
+    print(f"Resultados idénticos: {'✓' if identical else '✗'}")
+    print("=" * 60)
+
+    return identical
+
+
+def test_shared_memory_exchange(num_students: int = 200_000, workers: int = 2):
+    """Compara devolver resultados serializados con escribirlos en memoria compartida."""
+    print("\n" + "=" * 60)
+    print("TEST DE MEMORIA COMPARTIDA - pickle vs shared_memory")
+    print("=" * 60)
+
+    attendance_policy = AttendancePolicy()
+    extra_points_policy = ExtraPointsPolicy(all_years_teachers=[True, True])
+    students = _build_population(num_students)
+
+    with ParallelGradeCalculator(
+        attendance_policy, extra_points_policy, max_workers=workers, chunk_size=5_000
+    ) as parallel:
+        start_ns = time.perf_counter_ns()
+        pickled_results = parallel.calculate_final_grades(students)
+        pickled_ms = (time.perf_counter_ns() - start_ns) / 1e6
+
+    with SharedMemoryGradeCalculator(
+        attendance_policy, extra_points_policy, max_workers=workers
+    ) as shared:
+        start_ns = time.perf_counter_ns()
+        shared_results = shared.calculate_final_grades(students)
+        shared_ms = (time.perf_counter_ns() - start_ns) / 1e6
+
+    identical = all(
+        result.final_grade == expected.final_grade
+        and result.weighted_average == expected.weighted_average
+        and result.attendance_penalty == expected.attendance_penalty
+        for result, expected in zip(shared_results, pickled_results)
+    )
+
+    print(f"\nEstudiantes: {num_students} ({workers} procesos)")
+    print(f"ParallelGradeCalculator (pickle): {pickled_ms:8.1f} ms")
+    print(f"SharedMemoryGradeCalculator:      {shared_ms:8.1f} ms")
+    print(f"Mejora: {pickled_ms / shared_ms:.1f}x")
+    print(f"Resultados idénticos: {'✓' if identical else '✗'}")
+    print("=" * 60)
+
+    return identical
+
+
 if __name__ == "__main__":
     # Ejecutar todos los tests de validación de RNF
     performance_ok = test_performance()
     test_concurrent_simulation()
     determinism_ok = test_determinism()
+    test_memory_footprint()
+    test_calculation_latency()
+    test_parallel_scaling()
+    test_instrumentation_overhead()
+    test_bulk_validation()
+    test_gradebook_load()
+    test_result_set_export()
+    test_scenario_sweep()
+    test_course_scheme()
+    test_sharded_job()
+    test_checkpoint_overhead()
+    test_grade_distribution()
+    test_gradebook_lookup()
+    test_incremental_regrade()
+    test_sqlite_result_store()
+    test_buffer_input()
+    test_shared_memory_exchange()
 
     print("\n" + "=" * 60)
     print("RESUMEN DE VALIDACIÓN DE RNF")
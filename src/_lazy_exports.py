@@ -0,0 +1,36 @@
+"""Carga perezosa de los nombres exportados por los paquetes (PEP 562)."""
+
+from importlib import import_module
+from typing import Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    package_name: str,
+    exports: Dict[str, str]
+) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """Crea __getattr__ y __dir__ de un paquete que importa sus módulos bajo demanda.
+
+    Cada nombre se importa desde su submódulo la primera vez que se accede
+    y luego se guarda en el paquete, por lo que los accesos siguientes no
+    pasan por __getattr__.
+
+    Args:
+        package_name: __name__ del paquete
+        exports: Nombre exportado -> submódulo relativo que lo define
+
+    Returns:
+        Funciones (__getattr__, __dir__) para el módulo del paquete
+    """
+    def __getattr__(name: str) -> object:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        package = import_module(package_name)
+        value = getattr(import_module(module_name, package_name), name)
+        setattr(package, name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(import_module(package_name))) | set(exports))
+
+    return __getattr__, __dir__
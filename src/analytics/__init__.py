@@ -0,0 +1,23 @@
+"""Análisis estadístico de los resultados de notas.
+
+Los nombres exportados se importan de forma perezosa al primer acceso,
+de modo que importar un submódulo no carga el resto del paquete.
+"""
+
+from typing import TYPE_CHECKING
+from .._lazy_exports import lazy_exports
+
+_EXPORTS = {
+    "GradeDistribution": ".grade_distribution",
+    "RunningDistribution": ".grade_distribution",
+}
+
+__all__ = [
+    "GradeDistribution",
+    "RunningDistribution",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from .grade_distribution import GradeDistribution, RunningDistribution
@@ -0,0 +1,348 @@
+"""Estadísticas de distribución de notas calculadas en una sola pasada."""
+
+import math
+from typing import Dict, Iterable, List, Optional, Tuple
+from ..models.grade_detail import GradeDetail
+from ..models.grade_detail_set import GradeDetailSet
+from ..services.grade_calculator import GradeCalculator
+
+# Escala de notas vigesimal
+SCALE_MIN = 0.0
+SCALE_MAX = 20.0
+DEFAULT_BIN_WIDTH = 0.5
+DEFAULT_QUANTILES = (0.25, 0.5, 0.75)
+
+
+class RunningDistribution:
+    """Distribución de un valor acumulada en memoria constante.
+
+    Media y varianza se actualizan con el algoritmo de Welford, que evita la
+    cancelación numérica de sumar cuadrados. Los cuantiles se estiman a
+    partir de un histograma de ancho fijo sobre la escala 0-20, con un error
+    máximo de un ancho de barra. Dos distribuciones con la misma
+    configuración se pueden combinar con merge.
+    """
+
+    def __init__(self, bin_width: float = DEFAULT_BIN_WIDTH):
+        """Inicializa una distribución vacía.
+
+        Args:
+            bin_width: Ancho de cada barra del histograma
+
+        Raises:
+            ValueError: Si el ancho no es positivo o no divide la escala
+        """
+        if bin_width <= 0:
+            raise ValueError("El ancho de barra debe ser mayor que cero")
+        bin_count = (SCALE_MAX - SCALE_MIN) / bin_width
+        if abs(bin_count - round(bin_count)) > 1e-9:
+            raise ValueError(
+                f"El ancho de barra debe dividir la escala {SCALE_MIN}-{SCALE_MAX}"
+            )
+
+        self._bin_width = bin_width
+        self._bins = [0] * int(round(bin_count))
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._minimum = math.inf
+        self._maximum = -math.inf
+
+    @property
+    def bin_width(self) -> float:
+        """Obtiene el ancho de barra del histograma."""
+        return self._bin_width
+
+    @property
+    def count(self) -> int:
+        """Obtiene la cantidad de valores acumulados."""
+        return self._count
+
+    @property
+    def mean(self) -> float:
+        """Obtiene la media; 0.0 si no hay valores."""
+        return self._mean
+
+    @property
+    def variance(self) -> float:
+        """Obtiene la varianza poblacional; 0.0 si no hay valores."""
+        return self._m2 / self._count if self._count else 0.0
+
+    @property
+    def sample_variance(self) -> float:
+        """Obtiene la varianza muestral; 0.0 con menos de dos valores."""
+        return self._m2 / (self._count - 1) if self._count > 1 else 0.0
+
+    @property
+    def std_dev(self) -> float:
+        """Obtiene la desviación estándar poblacional."""
+        return math.sqrt(self.variance)
+
+    @property
+    def minimum(self) -> Optional[float]:
+        """Obtiene el valor mínimo; None si no hay valores."""
+        return self._minimum if self._count else None
+
+    @property
+    def maximum(self) -> Optional[float]:
+        """Obtiene el valor máximo; None si no hay valores."""
+        return self._maximum if self._count else None
+
+    @property
+    def histogram(self) -> List[int]:
+        """Obtiene una copia de los conteos por barra, de menor a mayor."""
+        return self._bins.copy()
+
+    def bin_edges(self) -> List[Tuple[float, float]]:
+        """Obtiene los límites [inicio, fin) de cada barra; la última incluye 20."""
+        return [
+            (SCALE_MIN + index * self._bin_width, SCALE_MIN + (index + 1) * self._bin_width)
+            for index in range(len(self._bins))
+        ]
+
+    def add(self, value: float) -> None:
+        """Acumula un valor.
+
+        Args:
+            value: Valor en la escala 0-20; los valores fuera de rango se
+                   cuentan en la barra del extremo más cercano
+        """
+        self._count += 1
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (value - self._mean)
+        if value < self._minimum:
+            self._minimum = value
+        if value > self._maximum:
+            self._maximum = value
+
+        index = int((value - SCALE_MIN) / self._bin_width)
+        self._bins[max(0, min(index, len(self._bins) - 1))] += 1
+
+    def merge(self, other: "RunningDistribution") -> "RunningDistribution":
+        """Combina en esta distribución los valores acumulados en otra.
+
+        Usa la combinación de Chan et al. para media y varianza, por lo que
+        el resultado equivale a haber acumulado ambos conjuntos en uno.
+
+        Args:
+            other: Distribución parcial, por ejemplo de otro proceso
+
+        Returns:
+            Esta misma distribución, para encadenar llamadas
+
+        Raises:
+            ValueError: Si los histogramas tienen distinto ancho de barra
+        """
+        if other._bin_width != self._bin_width:
+            raise ValueError("Solo se pueden combinar distribuciones con el mismo ancho de barra")
+        if not other._count:
+            return self
+
+        count = self._count + other._count
+        delta = other._mean - self._mean
+        self._m2 += other._m2 + delta * delta * self._count * other._count / count
+        self._mean += delta * other._count / count
+        self._count = count
+        self._minimum = min(self._minimum, other._minimum)
+        self._maximum = max(self._maximum, other._maximum)
+        self._bins = [mine + theirs for mine, theirs in zip(self._bins, other._bins)]
+        return self
+
+    def quantile(self, q: float) -> float:
+        """Estima un cuantil interpolando dentro de la barra que lo contiene.
+
+        Args:
+            q: Cuantil en [0, 1]
+
+        Returns:
+            Valor estimado, acotado por el mínimo y el máximo observados
+
+        Raises:
+            ValueError: Si q está fuera de rango o no hay valores
+        """
+        if q < 0.0 or q > 1.0:
+            raise ValueError("El cuantil debe estar entre 0.0 y 1.0")
+        if not self._count:
+            raise ValueError("La distribución no tiene valores")
+
+        target = q * self._count
+        cumulative = 0
+        estimate = self._maximum
+        for index, bin_count in enumerate(self._bins):
+            if bin_count and cumulative + bin_count >= target:
+                fraction = (target - cumulative) / bin_count
+                estimate = SCALE_MIN + (index + fraction) * self._bin_width
+                break
+            cumulative += bin_count
+        return max(self._minimum, min(estimate, self._maximum))
+
+    def to_dict(self, quantiles: Iterable[float] = DEFAULT_QUANTILES) -> dict:
+        """Convierte la distribución a diccionario para reportes.
+
+        Args:
+            quantiles: Cuantiles a estimar; se omiten si no hay valores
+
+        Returns:
+            Diccionario con conteo, momentos, extremos, cuantiles e histograma
+        """
+        return {
+            "count": self._count,
+            "mean": self._mean,
+            "variance": self.variance,
+            "std_dev": self.std_dev,
+            "min": self.minimum,
+            "max": self.maximum,
+            "quantiles": (
+                {q: self.quantile(q) for q in quantiles} if self._count else {}
+            ),
+            "histogram": self.histogram,
+        }
+
+    def __repr__(self) -> str:
+        """Representación string de la distribución."""
+        return (
+            f"RunningDistribution(count={self._count}, mean={self._mean:.4f}, "
+            f"std_dev={self.std_dev:.4f})"
+        )
+
+
+class GradeDistribution:
+    """Estadísticas de una sección acumuladas a medida que se calculan notas.
+
+    Acumula en una sola pasada y en memoria constante la distribución de
+    final_grade y weighted_average, además de la cantidad de aprobados. Los
+    agregados parciales de distintos trabajadores se combinan con merge.
+    """
+
+    def __init__(
+        self,
+        passing_grade: float = GradeCalculator.PASSING_GRADE,
+        bin_width: float = DEFAULT_BIN_WIDTH
+    ):
+        """Inicializa una distribución vacía.
+
+        Args:
+            passing_grade: Nota final mínima para considerar aprobado
+            bin_width: Ancho de barra de los histogramas
+
+        Raises:
+            ValueError: Si el ancho de barra es inválido
+        """
+        self._passing_grade = passing_grade
+        self._final_grade = RunningDistribution(bin_width)
+        self._weighted_average = RunningDistribution(bin_width)
+        self._passed = 0
+
+    @property
+    def passing_grade(self) -> float:
+        """Obtiene la nota mínima aprobatoria."""
+        return self._passing_grade
+
+    @property
+    def count(self) -> int:
+        """Obtiene la cantidad de resultados acumulados."""
+        return self._final_grade.count
+
+    @property
+    def passed(self) -> int:
+        """Obtiene la cantidad de aprobados."""
+        return self._passed
+
+    @property
+    def pass_rate(self) -> float:
+        """Obtiene la proporción de aprobados; 0.0 si no hay resultados."""
+        count = self._final_grade.count
+        return self._passed / count if count else 0.0
+
+    @property
+    def final_grade(self) -> RunningDistribution:
+        """Obtiene la distribución de notas finales."""
+        return self._final_grade
+
+    @property
+    def weighted_average(self) -> RunningDistribution:
+        """Obtiene la distribución de promedios ponderados."""
+        return self._weighted_average
+
+    def add(self, grade_detail: GradeDetail) -> None:
+        """Acumula un resultado de GradeCalculator."""
+        self.add_values(grade_detail.weighted_average, grade_detail.final_grade)
+
+    def add_values(self, weighted_average: float, final_grade: float) -> None:
+        """Acumula un resultado a partir de sus valores.
+
+        Args:
+            weighted_average: Promedio ponderado del estudiante
+            final_grade: Nota final del estudiante
+        """
+        self._weighted_average.add(weighted_average)
+        self._final_grade.add(final_grade)
+        if final_grade >= self._passing_grade:
+            self._passed += 1
+
+    def update(self, grade_details: Iterable[GradeDetail]) -> "GradeDistribution":
+        """Acumula varios resultados, consumiendo el iterable una sola vez.
+
+        Returns:
+            Esta misma distribución, para encadenar llamadas
+        """
+        add_values = self.add_values
+        for grade_detail in grade_details:
+            add_values(grade_detail.weighted_average, grade_detail.final_grade)
+        return self
+
+    def update_set(self, detail_set: GradeDetailSet) -> "GradeDistribution":
+        """Acumula un GradeDetailSet leyendo sus columnas sin crear vistas.
+
+        Returns:
+            Esta misma distribución, para encadenar llamadas
+        """
+        add_values = self.add_values
+        for weighted_average, final_grade in zip(
+            detail_set.column("weighted_average"), detail_set.column("final_grade")
+        ):
+            add_values(weighted_average, final_grade)
+        return self
+
+    def merge(self, other: "GradeDistribution") -> "GradeDistribution":
+        """Combina en esta distribución un agregado parcial.
+
+        Returns:
+            Esta misma distribución, para encadenar llamadas
+
+        Raises:
+            ValueError: Si las distribuciones no tienen la misma configuración
+        """
+        if other._passing_grade != self._passing_grade:
+            raise ValueError("Solo se pueden combinar distribuciones con la misma nota aprobatoria")
+        self._final_grade.merge(other._final_grade)
+        self._weighted_average.merge(other._weighted_average)
+        self._passed += other._passed
+        return self
+
+    def to_dict(self, quantiles: Iterable[float] = DEFAULT_QUANTILES) -> Dict[str, object]:
+        """Convierte las estadísticas de la sección a diccionario.
+
+        Args:
+            quantiles: Cuantiles a estimar para cada distribución
+
+        Returns:
+            Diccionario con conteo, aprobados y ambas distribuciones
+        """
+        quantiles = tuple(quantiles)
+        return {
+            "count": self.count,
+            "passing_grade": self._passing_grade,
+            "passed": self._passed,
+            "pass_rate": self.pass_rate,
+            "final_grade": self._final_grade.to_dict(quantiles),
+            "weighted_average": self._weighted_average.to_dict(quantiles),
+        }
+
+    def __repr__(self) -> str:
+        """Representación string de la distribución de notas."""
+        return (
+            f"GradeDistribution(count={self.count}, "
+            f"pass_rate={self.pass_rate:.4f})"
+        )
@@ -0,0 +1,29 @@
+"""Instrumentación opcional del cálculo de notas.
+
+Los nombres exportados se importan de forma perezosa al primer acceso,
+de modo que importar un submódulo no carga el resto del paquete.
+"""
+
+from typing import TYPE_CHECKING
+from .._lazy_exports import lazy_exports
+
+_EXPORTS = {
+    "MetricsSink": ".metrics_sink",
+    "InMemoryMetricsSink": ".metrics_sink",
+    "LoggingMetricsSink": ".logging_sink",
+    "PrometheusTextFileSink": ".prometheus_sink",
+}
+
+__all__ = [
+    "MetricsSink",
+    "InMemoryMetricsSink",
+    "LoggingMetricsSink",
+    "PrometheusTextFileSink",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from .metrics_sink import MetricsSink, InMemoryMetricsSink
+    from .logging_sink import LoggingMetricsSink
+    from .prometheus_sink import PrometheusTextFileSink
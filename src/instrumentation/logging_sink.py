@@ -0,0 +1,31 @@
+"""Destino de métricas que emite registros del módulo logging."""
+
+import logging
+from typing import Optional
+from .metrics_sink import MetricsSink
+
+
+class LoggingMetricsSink(MetricsSink):
+    """Emite cada métrica como un registro del módulo logging."""
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.DEBUG):
+        """Inicializa el destino.
+
+        Args:
+            logger: Logger a utilizar; por defecto el de este módulo
+            level: Nivel de los registros emitidos
+        """
+        self._logger = logger or logging.getLogger(__name__)
+        self._level = level
+
+    def record_duration(self, stage: str, duration_ns: int) -> None:
+        """Registra la duración de la etapa."""
+        self._logger.log(self._level, "grade_calculator stage=%s duration_ns=%d", stage, duration_ns)
+
+    def increment(self, counter: str, label: str) -> None:
+        """Registra el incremento del contador."""
+        self._logger.log(self._level, "grade_calculator counter=%s label=%s", counter, label)
+
+    def observe(self, histogram: str, value: float) -> None:
+        """Registra la observación del histograma."""
+        self._logger.log(self._level, "grade_calculator histogram=%s value=%s", histogram, value)
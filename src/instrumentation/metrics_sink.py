@@ -0,0 +1,92 @@
+"""Destinos de métricas para la instrumentación de GradeCalculator."""
+
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import Dict, Tuple
+
+STAGE_VALIDATION = "validation"
+STAGE_WEIGHTED_AVERAGE = "weighted_average"
+STAGE_ATTENDANCE_POLICY = "attendance_policy"
+STAGE_EXTRA_POINTS = "extra_points"
+STAGE_CLAMP = "clamp"
+
+VALIDATION_FAILURES = "validation_failures"
+FAILURE_NO_EVALUATIONS = "no_evaluations"
+FAILURE_WEIGHT_SUM = "weight_sum"
+
+EVALUATIONS_PER_STUDENT = "evaluations_per_student"
+
+
+class MetricsSink(ABC):
+    """Interfaz de los destinos de métricas.
+
+    GradeCalculator informa tres tipos de métricas: duración por etapa del
+    cálculo, contadores etiquetados (fallos de validación por motivo) e
+    histogramas (evaluaciones por estudiante).
+    """
+
+    @abstractmethod
+    def record_duration(self, stage: str, duration_ns: int) -> None:
+        """Registra la duración de una etapa del cálculo, en nanosegundos."""
+
+    @abstractmethod
+    def increment(self, counter: str, label: str) -> None:
+        """Incrementa en uno un contador con la etiqueta indicada."""
+
+    @abstractmethod
+    def observe(self, histogram: str, value: float) -> None:
+        """Registra una observación en un histograma."""
+
+
+class InMemoryMetricsSink(MetricsSink):
+    """Acumula las métricas en memoria para consultarlas o exportarlas."""
+
+    def __init__(self):
+        """Inicializa los acumuladores vacíos."""
+        self._durations: Dict[str, list] = {}
+        self._counters: Counter = Counter()
+        self._histograms: Dict[str, Counter] = {}
+
+    def record_duration(self, stage: str, duration_ns: int) -> None:
+        """Acumula cantidad, total y máximo de la duración de la etapa."""
+        stats = self._durations.get(stage)
+        if stats is None:
+            self._durations[stage] = [1, duration_ns, duration_ns]
+            return
+        stats[0] += 1
+        stats[1] += duration_ns
+        if duration_ns > stats[2]:
+            stats[2] = duration_ns
+
+    def increment(self, counter: str, label: str) -> None:
+        """Incrementa el contador (counter, label)."""
+        self._counters[(counter, label)] += 1
+
+    def observe(self, histogram: str, value: float) -> None:
+        """Cuenta la observación del valor en el histograma."""
+        self._histograms.setdefault(histogram, Counter())[value] += 1
+
+    def stage_durations(self) -> Dict[str, Dict[str, int]]:
+        """Obtiene por etapa la cantidad, el total y el máximo en nanosegundos."""
+        return {
+            stage: {"count": count, "total_ns": total, "max_ns": maximum}
+            for stage, (count, total, maximum) in self._durations.items()
+        }
+
+    def counter_value(self, counter: str, label: str) -> int:
+        """Obtiene el valor de un contador etiquetado."""
+        return self._counters[(counter, label)]
+
+    def counters(self) -> Dict[Tuple[str, str], int]:
+        """Obtiene una copia de todos los contadores."""
+        return dict(self._counters)
+
+    def histogram(self, histogram: str) -> Dict[float, int]:
+        """Obtiene la cantidad de observaciones por valor de un histograma."""
+        return dict(self._histograms.get(histogram, {}))
+
+    def reset(self) -> None:
+        """Descarta todas las métricas acumuladas."""
+        self._durations.clear()
+        self._counters.clear()
+        self._histograms.clear()
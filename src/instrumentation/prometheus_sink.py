@@ -0,0 +1,71 @@
+"""Destino de métricas en formato de texto Prometheus."""
+
+import os
+from pathlib import Path
+from typing import Sequence, Union
+from .metrics_sink import InMemoryMetricsSink
+
+
+class PrometheusTextFileSink(InMemoryMetricsSink):
+    """Acumula métricas en memoria y las vuelca en formato de texto Prometheus.
+
+    El archivo generado es compatible con el textfile collector de
+    node_exporter; se escribe de forma atómica en cada dump().
+    """
+
+    DEFAULT_BUCKETS = tuple(range(1, 11))
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        namespace: str = "grade_calculator",
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        """Inicializa el destino.
+
+        Args:
+            path: Archivo .prom donde volcar las métricas
+            namespace: Prefijo de los nombres de métricas
+            buckets: Límites superiores de los histogramas
+        """
+        super().__init__()
+        self._path = Path(path)
+        self._namespace = namespace
+        self._buckets = tuple(sorted(buckets))
+
+    def render(self) -> str:
+        """Genera el texto en formato de exposición de Prometheus."""
+        prefix = self._namespace
+        lines = [
+            f"# HELP {prefix}_stage_seconds Duración de cada etapa del cálculo.",
+            f"# TYPE {prefix}_stage_seconds summary",
+        ]
+        for stage, stats in sorted(self.stage_durations().items()):
+            seconds = stats["total_ns"] / 1e9
+            lines.append(f'{prefix}_stage_seconds_sum{{stage="{stage}"}} {seconds:.9f}')
+            lines.append(f'{prefix}_stage_seconds_count{{stage="{stage}"}} {stats["count"]}')
+
+        counter_names = sorted({name for name, _ in self._counters})
+        for name in counter_names:
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            for (counter, label), value in sorted(self._counters.items()):
+                if counter == name:
+                    lines.append(f'{prefix}_{name}_total{{reason="{label}"}} {value}')
+
+        for name, observations in sorted(self._histograms.items()):
+            lines.append(f"# TYPE {prefix}_{name} histogram")
+            for bucket in self._buckets:
+                count = sum(n for value, n in observations.items() if value <= bucket)
+                lines.append(f'{prefix}_{name}_bucket{{le="{bucket}"}} {count}')
+            total = sum(observations.values())
+            lines.append(f'{prefix}_{name}_bucket{{le="+Inf"}} {total}')
+            lines.append(f"{prefix}_{name}_sum {sum(v * n for v, n in observations.items())}")
+            lines.append(f"{prefix}_{name}_count {total}")
+
+        return "\n".join(lines) + "\n"
+
+    def dump(self) -> None:
+        """Escribe las métricas en el archivo de forma atómica."""
+        temporary = self._path.with_name(self._path.name + ".tmp")
+        temporary.write_text(self.render(), encoding="utf-8")
+        os.replace(temporary, self._path)
@@ -1,7 +1,35 @@
-"""Modelos de dominio del sistema."""
+"""Modelos de dominio del sistema.
 
-from .evaluation import Evaluation
-from .student import Student
-from .grade_detail import GradeDetail
+Los nombres exportados se importan de forma perezosa al primer acceso,
+de modo que importar un submódulo no carga el resto del paquete.
+"""
 
-__all__ = ["Evaluation", "Student", "GradeDetail"]
+from typing import TYPE_CHECKING
+from .._lazy_exports import lazy_exports
+
+_EXPORTS = {
+    "Evaluation": ".evaluation",
+    "Student": ".student",
+    "CompactStudent": ".compact_student",
+    "GradeDetail": ".grade_detail",
+    "GradeDetailSet": ".grade_detail_set",
+    "GradeDetailView": ".grade_detail_set",
+}
+
+__all__ = [
+    "Evaluation",
+    "Student",
+    "CompactStudent",
+    "GradeDetail",
+    "GradeDetailSet",
+    "GradeDetailView",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from .evaluation import Evaluation
+    from .student import Student
+    from .compact_student import CompactStudent
+    from .grade_detail import GradeDetail
+    from .grade_detail_set import GradeDetailSet, GradeDetailView
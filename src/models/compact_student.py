@@ -0,0 +1,93 @@
+"""Modelo de Estudiante con almacenamiento compacto."""
+
+from array import array
+from typing import Iterator, List, Optional
+from .evaluation import Evaluation
+from .student import Student
+
+
+class CompactStudent(Student):
+    """Variante de Student que guarda sus evaluaciones en un array('d') fijo.
+
+    En lugar de una lista de objetos Evaluation reserva un único bloque de
+    2 * MAX_EVALUATIONS flotantes: las notas ocupan la primera mitad y los
+    pesos la segunda. Mantiene las mismas propiedades públicas y validaciones
+    que Student; las evaluaciones se reconstruyen solo al consultarlas.
+    """
+
+    __slots__ = ("_scores", "_count")
+
+    def __init__(
+        self,
+        student_id: str,
+        evaluations: Optional[List[Evaluation]] = None,
+        has_reached_minimum_classes: bool = False
+    ):
+        """Inicializa un estudiante compacto.
+
+        Args:
+            student_id: Código o identificador del estudiante
+            evaluations: Lista de evaluaciones del estudiante
+            has_reached_minimum_classes: Si cumplió asistencia mínima (RF02)
+
+        Raises:
+            ValueError: Si el ID es inválido o excede el límite de evaluaciones
+        """
+        self._validate_student_id(student_id)
+
+        evaluations = evaluations or []
+        if len(evaluations) > self.MAX_EVALUATIONS:
+            raise ValueError(
+                f"No se pueden tener más de {self.MAX_EVALUATIONS} evaluaciones"
+            )
+
+        self._student_id = student_id
+        self._has_reached_minimum_classes = has_reached_minimum_classes
+        self._scores = array("d", bytes(16 * self.MAX_EVALUATIONS))
+        self._count = 0
+        self._weight_total = 0.0
+        self._weighted_sum = 0.0
+
+        for evaluation in evaluations:
+            self._store_evaluation(evaluation)
+
+        self._dirty = True
+
+    @property
+    def evaluations(self) -> List[Evaluation]:
+        """Obtiene la lista de evaluaciones, reconstruida desde el arreglo."""
+        return list(self.iter_evaluations())
+
+    def iter_evaluations(self) -> Iterator[Evaluation]:
+        """Itera sobre las evaluaciones reconstruyéndolas desde el arreglo."""
+        weights_offset = self.MAX_EVALUATIONS
+        for index in range(self._count):
+            yield Evaluation(self._scores[index], self._scores[weights_offset + index])
+
+    @property
+    def evaluation_count(self) -> int:
+        """Obtiene la cantidad de evaluaciones registradas."""
+        return self._count
+
+    def add_evaluation(self, evaluation: Evaluation) -> None:
+        """Agrega una evaluación al estudiante.
+
+        Args:
+            evaluation: Evaluación a agregar
+
+        Raises:
+            ValueError: Si se excede el límite de evaluaciones (RNF01)
+        """
+        if self._count >= self.MAX_EVALUATIONS:
+            raise ValueError(
+                f"No se pueden agregar más de {self.MAX_EVALUATIONS} evaluaciones"
+            )
+        self._store_evaluation(evaluation)
+        self._dirty = True
+
+    def _store_evaluation(self, evaluation: Evaluation) -> None:
+        """Copia la nota y el peso de la evaluación en el arreglo."""
+        self._scores[self._count] = evaluation.grade
+        self._scores[self.MAX_EVALUATIONS + self._count] = evaluation.weight
+        self._count += 1
+        self._accumulate_totals(evaluation)
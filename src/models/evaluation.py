@@ -7,6 +7,8 @@ class Evaluation:
     Implementa RF01: Registro de evaluaciones con nota y porcentaje de peso.
     """
 
+    __slots__ = ("_grade", "_weight")
+
     MIN_GRADE = 0.0
     MAX_GRADE = 20.0
     MIN_WEIGHT = 0.0
@@ -56,6 +58,10 @@ class Evaluation:
                 f"El peso debe estar entre {self.MIN_WEIGHT} y {self.MAX_WEIGHT}"
             )
 
+    def __reduce__(self):
+        """Serializa la evaluación de forma compacta para pickle."""
+        return (Evaluation, (self._grade, self._weight))
+
     def __repr__(self) -> str:
         """Representación string de la evaluación."""
         return f"Evaluation(grade={self._grade}, weight={self._weight})"
@@ -7,6 +7,13 @@ class GradeDetail:
     Implementa RF05: Visualización del detalle del cálculo.
     """
 
+    __slots__ = (
+        "_weighted_average",
+        "_attendance_penalty",
+        "_extra_points",
+        "_final_grade",
+    )
+
     def __init__(
         self,
         weighted_average: float,
@@ -60,6 +67,18 @@ class GradeDetail:
             "final_grade": round(self._final_grade, 2)
         }
 
+    def __reduce__(self):
+        """Serializa el detalle de forma compacta para pickle."""
+        return (
+            GradeDetail,
+            (
+                self._weighted_average,
+                self._attendance_penalty,
+                self._extra_points,
+                self._final_grade,
+            ),
+        )
+
     def __repr__(self) -> str:
         """Representación string del detalle."""
         return (
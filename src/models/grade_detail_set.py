@@ -0,0 +1,235 @@
+"""Conjunto columnar de detalles de cálculo - RF05 en lote."""
+
+from array import array
+from itertools import repeat
+from typing import Dict, Iterator, List, Sequence
+
+from .grade_detail import GradeDetail
+
+COLUMN_NAMES = ("weighted_average", "attendance_penalty", "extra_points", "final_grade")
+
+
+class GradeDetailView(GradeDetail):
+    """Vista perezosa de una fila de GradeDetailSet con la interfaz de GradeDetail.
+
+    No copia los valores: cada propiedad lee la columna correspondiente del
+    conjunto al momento de consultarla.
+    """
+
+    __slots__ = ("_detail_set", "_index")
+
+    def __init__(self, detail_set: "GradeDetailSet", index: int):
+        """Inicializa la vista.
+
+        Args:
+            detail_set: Conjunto al que pertenece la fila
+            index: Posición de la fila en el conjunto
+        """
+        self._detail_set = detail_set
+        self._index = index
+
+    @property
+    def weighted_average(self) -> float:
+        """Obtiene el promedio ponderado."""
+        return self._detail_set.weighted_averages[self._index]
+
+    @property
+    def attendance_penalty(self) -> float:
+        """Obtiene la penalización por asistencia."""
+        return self._detail_set.attendance_penalties[self._index]
+
+    @property
+    def extra_points(self) -> float:
+        """Obtiene los puntos extra aplicados."""
+        return self._detail_set.extra_points[self._index]
+
+    @property
+    def final_grade(self) -> float:
+        """Obtiene la nota final."""
+        return self._detail_set.final_grades[self._index]
+
+    def materialize(self) -> GradeDetail:
+        """Copia la fila en un GradeDetail independiente del conjunto."""
+        return self._detail_set.detail_at(self._index)
+
+    def to_dict(self) -> dict:
+        """Convierte la fila a diccionario, igual que GradeDetail.to_dict."""
+        return self.materialize().to_dict()
+
+    def __reduce__(self):
+        """Serializa la fila como un GradeDetail independiente."""
+        return self.materialize().__reduce__()
+
+    def __repr__(self) -> str:
+        """Representación string de la fila."""
+        return repr(self.materialize())
+
+    def __str__(self) -> str:
+        """Representación legible de la fila para el usuario."""
+        return str(self.materialize())
+
+
+class GradeDetailSet:
+    """Resultado columnar del cálculo de notas de una cohorte completa.
+
+    Almacena cada componente de GradeDetail (RF05) como un arreglo paralelo
+    de flotantes en lugar de un objeto por estudiante.
+    """
+
+    def __init__(
+        self,
+        student_ids: Sequence[str],
+        weighted_averages: array,
+        attendance_penalties: array,
+        extra_points: array,
+        final_grades: array
+    ):
+        """Inicializa el conjunto de resultados.
+
+        Args:
+            student_ids: Identificadores de los estudiantes, en orden
+            weighted_averages: Promedios ponderados por estudiante
+            attendance_penalties: Penalizaciones por asistencia por estudiante
+            extra_points: Puntos extra aplicados por estudiante
+            final_grades: Notas finales por estudiante
+
+        Raises:
+            ValueError: Si las columnas no tienen la misma longitud
+        """
+        size = len(student_ids)
+        for column in (weighted_averages, attendance_penalties, extra_points, final_grades):
+            if len(column) != size:
+                raise ValueError("Todas las columnas deben tener la misma longitud")
+
+        self._student_ids = student_ids
+        self._weighted_averages = weighted_averages
+        self._attendance_penalties = attendance_penalties
+        self._extra_points = extra_points
+        self._final_grades = final_grades
+
+    @property
+    def student_ids(self) -> Sequence[str]:
+        """Obtiene los identificadores de los estudiantes."""
+        return self._student_ids
+
+    @property
+    def weighted_averages(self) -> array:
+        """Obtiene la columna de promedios ponderados."""
+        return self._weighted_averages
+
+    @property
+    def attendance_penalties(self) -> array:
+        """Obtiene la columna de penalizaciones por asistencia."""
+        return self._attendance_penalties
+
+    @property
+    def extra_points(self) -> array:
+        """Obtiene la columna de puntos extra."""
+        return self._extra_points
+
+    @property
+    def final_grades(self) -> array:
+        """Obtiene la columna de notas finales."""
+        return self._final_grades
+
+    def detail_at(self, index: int) -> GradeDetail:
+        """Construye el GradeDetail de una fila del conjunto.
+
+        Args:
+            index: Posición del estudiante en el conjunto
+
+        Returns:
+            GradeDetail con los componentes de esa fila
+        """
+        return GradeDetail(
+            weighted_average=self._weighted_averages[index],
+            attendance_penalty=self._attendance_penalties[index],
+            extra_points=self._extra_points[index],
+            final_grade=self._final_grades[index]
+        )
+
+    def student_id_at(self, index: int) -> str:
+        """Obtiene el identificador del estudiante de una fila."""
+        return self._student_ids[index]
+
+    def column(self, name: str) -> array:
+        """Obtiene una columna por su nombre en GradeDetail.to_dict.
+
+        Raises:
+            ValueError: Si el nombre no corresponde a una columna
+        """
+        if name not in COLUMN_NAMES:
+            raise ValueError(f"Columna desconocida: '{name}'")
+        return self._columns()[COLUMN_NAMES.index(name)]
+
+    def rounded(self, ndigits: int = 2) -> "GradeDetailSet":
+        """Redondea todas las columnas de una vez, como GradeDetail.to_dict.
+
+        Args:
+            ndigits: Cantidad de decimales
+
+        Returns:
+            Nuevo conjunto con las columnas redondeadas
+        """
+        size = len(self)
+        rounded_columns = [
+            array("d", map(round, column, repeat(ndigits, size)))
+            for column in self._columns()
+        ]
+        return GradeDetailSet(self._student_ids, *rounded_columns)
+
+    def to_columns(self, ndigits: int = 2) -> Dict[str, list]:
+        """Exporta el conjunto como un diccionario de columnas redondeadas.
+
+        Es la forma de exportación a JSON sin crear un diccionario por fila.
+
+        Args:
+            ndigits: Cantidad de decimales
+
+        Returns:
+            Diccionario con student_id y una lista por componente
+        """
+        columns = {"student_id": list(self._student_ids)}
+        rounded = self.rounded(ndigits)
+        for name, column in zip(COLUMN_NAMES, rounded._columns()):
+            columns[name] = column.tolist()
+        return columns
+
+    def _columns(self) -> tuple:
+        """Obtiene las cuatro columnas en el orden de COLUMN_NAMES."""
+        return (
+            self._weighted_averages,
+            self._attendance_penalties,
+            self._extra_points,
+            self._final_grades,
+        )
+
+    def to_details(self) -> List[GradeDetail]:
+        """Convierte el conjunto en una lista de GradeDetail.
+
+        Returns:
+            Lista de detalles en el mismo orden que los estudiantes
+        """
+        return [self.detail_at(index) for index in range(len(self))]
+
+    def __getitem__(self, index: int) -> GradeDetailView:
+        """Obtiene una vista perezosa de la fila indicada."""
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("Índice de estudiante fuera de rango")
+        return GradeDetailView(self, index)
+
+    def __iter__(self) -> Iterator[GradeDetailView]:
+        """Itera vistas perezosas de cada fila en orden."""
+        for index in range(len(self)):
+            yield GradeDetailView(self, index)
+
+    def __len__(self) -> int:
+        """Cantidad de estudiantes en el conjunto."""
+        return len(self._student_ids)
+
+    def __repr__(self) -> str:
+        """Representación string del conjunto."""
+        return f"GradeDetailSet(students={len(self)})"
@@ -1,6 +1,6 @@
 """Modelo de Estudiante."""
 
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 from .evaluation import Evaluation
 
 
@@ -10,6 +10,15 @@ class Student:
     Agrupa la información del estudiante necesaria para el cálculo de notas.
     """
 
+    __slots__ = (
+        "_student_id",
+        "_evaluations",
+        "_has_reached_minimum_classes",
+        "_weight_total",
+        "_weighted_sum",
+        "_dirty",
+    )
+
     MAX_EVALUATIONS = 10  # RNF01: Máximo 10 evaluaciones por estudiante
 
     def __init__(
@@ -31,11 +40,19 @@ class Student:
         self._validate_student_id(student_id)
 
         self._student_id = student_id
-        self._evaluations = evaluations or []
+        self._evaluations = list(evaluations or [])
         self._has_reached_minimum_classes = has_reached_minimum_classes
 
         self._validate_evaluations_limit()
 
+        self._weight_total = 0.0
+        self._weighted_sum = 0.0
+        for evaluation in self._evaluations:
+            self._accumulate_totals(evaluation)
+
+        # Un estudiante nuevo nunca fue calculado
+        self._dirty = True
+
     @property
     def student_id(self) -> str:
         """Obtiene el ID del estudiante."""
@@ -46,6 +63,52 @@ class Student:
         """Obtiene la lista de evaluaciones."""
         return self._evaluations.copy()
 
+    def iter_evaluations(self) -> Iterator[Evaluation]:
+        """Itera sobre las evaluaciones sin copiar la lista interna.
+
+        Vista de solo lectura pensada para el cálculo; para obtener una lista
+        modificable se debe usar la propiedad evaluations.
+        """
+        return iter(self._evaluations)
+
+    @property
+    def evaluation_count(self) -> int:
+        """Obtiene la cantidad de evaluaciones registradas."""
+        return len(self._evaluations)
+
+    @property
+    def weight_total(self) -> float:
+        """Obtiene la suma acumulada de pesos de las evaluaciones."""
+        return self._weight_total
+
+    @property
+    def weighted_sum(self) -> float:
+        """Obtiene la suma ponderada acumulada (promedio ponderado parcial)."""
+        return self._weighted_sum
+
+    @property
+    def fingerprint(self) -> Tuple[int, float, float, bool]:
+        """Obtiene una huella O(1) del estado que determina la nota final.
+
+        Combina la cantidad de evaluaciones, los totales acumulados y la
+        asistencia; cambia con cada add_evaluation o set_attendance_status.
+        """
+        return (
+            self.evaluation_count,
+            self._weight_total,
+            self._weighted_sum,
+            self._has_reached_minimum_classes,
+        )
+
+    @property
+    def is_dirty(self) -> bool:
+        """Obtiene si sus datos cambiaron desde el último mark_clean."""
+        return self._dirty
+
+    def mark_clean(self) -> None:
+        """Marca que la nota calculada refleja los datos actuales."""
+        self._dirty = False
+
     @property
     def has_reached_minimum_classes(self) -> bool:
         """Obtiene si el estudiante cumplió la asistencia mínima (RF02)."""
@@ -65,14 +128,29 @@ class Student:
                 f"No se pueden agregar más de {self.MAX_EVALUATIONS} evaluaciones"
             )
         self._evaluations.append(evaluation)
+        self._accumulate_totals(evaluation)
+        self._dirty = True
 
     def set_attendance_status(self, has_reached_minimum: bool) -> None:
         """Establece el estado de asistencia del estudiante (RF02).
 
+        Solo marca al estudiante como modificado si el estado cambia.
+
         Args:
             has_reached_minimum: Si cumplió la asistencia mínima
         """
-        self._has_reached_minimum_classes = has_reached_minimum
+        if has_reached_minimum != self._has_reached_minimum_classes:
+            self._has_reached_minimum_classes = has_reached_minimum
+            self._dirty = True
+
+    def _accumulate_totals(self, evaluation: Evaluation) -> None:
+        """Actualiza los totales acumulados con una nueva evaluación.
+
+        Suma en el mismo orden que GradeCalculator._accumulate_evaluations.
+        """
+        weight = evaluation.weight
+        self._weight_total += weight
+        self._weighted_sum += evaluation.grade * (weight / 100.0)
 
     def _validate_student_id(self, student_id: str) -> None:
         """Valida el ID del estudiante."""
@@ -88,10 +166,17 @@ class Student:
                 f"No se pueden tener más de {self.MAX_EVALUATIONS} evaluaciones"
             )
 
+    def __reduce__(self):
+        """Serializa el estudiante de forma compacta para pickle."""
+        return (
+            type(self),
+            (self._student_id, self.evaluations, self._has_reached_minimum_classes),
+        )
+
     def __repr__(self) -> str:
         """Representación string del estudiante."""
         return (
             f"Student(id={self._student_id}, "
-            f"evaluations={len(self._evaluations)}, "
+            f"evaluations={self.evaluation_count}, "
             f"attendance={self._has_reached_minimum_classes})"
         )
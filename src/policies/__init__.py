@@ -1,6 +1,24 @@
-"""Políticas del sistema."""
+"""Políticas del sistema.
 
-from .attendance_policy import AttendancePolicy
-from .extra_points_policy import ExtraPointsPolicy
+Los nombres exportados se importan de forma perezosa al primer acceso,
+de modo que importar un submódulo no carga el resto del paquete.
+"""
 
-__all__ = ["AttendancePolicy", "ExtraPointsPolicy"]
+from typing import TYPE_CHECKING
+from .._lazy_exports import lazy_exports
+
+_EXPORTS = {
+    "AttendancePolicy": ".attendance_policy",
+    "ExtraPointsPolicy": ".extra_points_policy",
+}
+
+__all__ = [
+    "AttendancePolicy",
+    "ExtraPointsPolicy",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from .attendance_policy import AttendancePolicy
+    from .extra_points_policy import ExtraPointsPolicy
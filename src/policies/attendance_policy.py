@@ -55,6 +55,22 @@ class AttendancePolicy:
         """Obtiene la nota de penalización."""
         return self._penalty_grade
 
+    def set_penalty_grade(self, penalty_grade: float) -> None:
+        """Actualiza la nota de penalización.
+
+        El cambio se refleja en fingerprint, por lo que los resultados
+        calculados con la nota anterior dejan de ser válidos.
+
+        Args:
+            penalty_grade: Nota aplicada si no se cumple asistencia mínima
+        """
+        self._penalty_grade = penalty_grade
+
+    @property
+    def fingerprint(self) -> str:
+        """Obtiene una huella de la configuración que afecta el cálculo."""
+        return f"attendance(penalty_grade={self._penalty_grade!r})"
+
     def __repr__(self) -> str:
         """Representación string de la política."""
         return f"AttendancePolicy(penalty_grade={self._penalty_grade})"
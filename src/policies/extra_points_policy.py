@@ -8,6 +8,9 @@ class ExtraPointsPolicy:
 
     Implementa RF03: Consulta de política de puntos extra definida
     colectivamente por los docentes del año académico (allYearsTeachers).
+
+    El acuerdo docente se calcula una sola vez y se recalcula solo cuando
+    cambia un voto, ya que la lista es fija durante el uso normal.
     """
 
     DEFAULT_EXTRA_POINTS = 0.0
@@ -29,8 +32,9 @@ class ExtraPointsPolicy:
             ValueError: Si la lista de docentes está vacía
         """
         self._validate_teachers_list(all_years_teachers)
-        self._all_years_teachers = all_years_teachers
+        self._all_years_teachers = list(all_years_teachers)
         self._extra_points_amount = extra_points_amount
+        self._refresh_agreement()
 
     def should_apply_extra_points(self, student_meets_criteria: bool = True) -> bool:
         """Determina si se deben aplicar puntos extra.
@@ -45,8 +49,7 @@ class ExtraPointsPolicy:
         Returns:
             True si se deben aplicar puntos extra, False en caso contrario
         """
-        all_teachers_agree = all(self._all_years_teachers)
-        return all_teachers_agree and student_meets_criteria
+        return self._all_teachers_agree and student_meets_criteria
 
     def calculate_extra_points(self, student_meets_criteria: bool = True) -> float:
         """Calcula los puntos extra a aplicar.
@@ -61,6 +64,34 @@ class ExtraPointsPolicy:
             return self._extra_points_amount
         return self.DEFAULT_EXTRA_POINTS
 
+    def set_teacher_vote(self, teacher_index: int, agrees: bool) -> None:
+        """Actualiza el voto de un docente e invalida el acuerdo precalculado.
+
+        Args:
+            teacher_index: Posición del docente en all_years_teachers
+            agrees: Si el docente está de acuerdo en otorgar puntos extra
+
+        Raises:
+            ValueError: Si el índice no existe o el voto no es booleano
+        """
+        if not isinstance(agrees, bool):
+            raise ValueError("Todos los elementos deben ser booleanos")
+        if not 0 <= teacher_index < len(self._all_years_teachers):
+            raise ValueError(
+                f"El índice de docente debe estar entre 0 y "
+                f"{len(self._all_years_teachers) - 1}"
+            )
+        self._all_years_teachers[teacher_index] = agrees
+        self._refresh_agreement()
+
+    def _refresh_agreement(self) -> None:
+        """Recalcula el acuerdo docente y los puntos extra precalculados."""
+        self._all_teachers_agree = all(self._all_years_teachers)
+        self._granted_extra_points = (
+            self._extra_points_amount if self._all_teachers_agree
+            else self.DEFAULT_EXTRA_POINTS
+        )
+
     def _validate_teachers_list(self, teachers: List[bool]) -> None:
         """Valida la lista de docentes.
 
@@ -82,14 +113,33 @@ class ExtraPointsPolicy:
         """Obtiene la lista de acuerdos de docentes."""
         return self._all_years_teachers.copy()
 
+    @property
+    def all_teachers_agree(self) -> bool:
+        """Obtiene si todos los docentes están de acuerdo (valor precalculado)."""
+        return self._all_teachers_agree
+
     @property
     def extra_points_amount(self) -> float:
         """Obtiene la cantidad de puntos extra."""
         return self._extra_points_amount
 
+    @property
+    def granted_extra_points(self) -> float:
+        """Obtiene los puntos extra precalculados para un estudiante que cumple los criterios."""
+        return self._granted_extra_points
+
+    @property
+    def fingerprint(self) -> str:
+        """Obtiene una huella de la configuración que afecta el cálculo.
+
+        Solo depende de los puntos extra efectivamente otorgados: dos
+        políticas que otorgan lo mismo producen las mismas notas.
+        """
+        return f"extra_points(granted={self._granted_extra_points!r})"
+
     def __repr__(self) -> str:
         """Representación string de la política."""
-        agreement_status = "all agree" if all(self._all_years_teachers) else "not all agree"
+        agreement_status = "all agree" if self._all_teachers_agree else "not all agree"
         return (
             f"ExtraPointsPolicy(teachers={len(self._all_years_teachers)}, "
             f"{agreement_status}, points={self._extra_points_amount})"
@@ -1,5 +1,72 @@
-"""Servicios del sistema."""
+"""Servicios del sistema.
 
-from .grade_calculator import GradeCalculator
+Los nombres exportados se importan de forma perezosa al primer acceso,
+de modo que importar un submódulo no carga el resto del paquete.
+"""
 
-__all__ = ["GradeCalculator"]
+from typing import TYPE_CHECKING
+from .._lazy_exports import lazy_exports
+
+_EXPORTS = {
+    "GradeCalculator": ".grade_calculator",
+    "BulkValidator": ".bulk_validator",
+    "ValidationReport": ".bulk_validator",
+    "Violation": ".bulk_validator",
+    "CachedGradeCalculator": ".cached_grade_calculator",
+    "CheckpointedGradingRun": ".checkpointed_grading_run",
+    "CourseScheme": ".course_scheme",
+    "AsyncGradingService": ".async_grading_service",
+    "GradingHttpServer": ".grading_http_server",
+    "Gradebook": ".gradebook",
+    "GradePipeline": ".grade_pipeline",
+    "PipelineSummary": ".grade_pipeline",
+    "IncrementalRegrader": ".incremental_regrader",
+    "RegradeSummary": ".incremental_regrader",
+    "ParallelGradeCalculator": ".parallel_grade_calculator",
+    "Scenario": ".scenario_engine",
+    "ScenarioEngine": ".scenario_engine",
+    "ScenarioResult": ".scenario_engine",
+    "ShardCoordinator": ".shard_coordinator",
+    "SharedMemoryGradeCalculator": ".shared_memory_grade_calculator",
+}
+
+__all__ = [
+    "GradeCalculator",
+    "BulkValidator",
+    "ValidationReport",
+    "Violation",
+    "CachedGradeCalculator",
+    "CheckpointedGradingRun",
+    "CourseScheme",
+    "AsyncGradingService",
+    "GradingHttpServer",
+    "Gradebook",
+    "GradePipeline",
+    "PipelineSummary",
+    "IncrementalRegrader",
+    "RegradeSummary",
+    "ParallelGradeCalculator",
+    "Scenario",
+    "ScenarioEngine",
+    "ScenarioResult",
+    "ShardCoordinator",
+    "SharedMemoryGradeCalculator",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from .grade_calculator import GradeCalculator
+    from .bulk_validator import BulkValidator, ValidationReport, Violation
+    from .cached_grade_calculator import CachedGradeCalculator
+    from .checkpointed_grading_run import CheckpointedGradingRun
+    from .course_scheme import CourseScheme
+    from .async_grading_service import AsyncGradingService
+    from .grading_http_server import GradingHttpServer
+    from .gradebook import Gradebook
+    from .grade_pipeline import GradePipeline, PipelineSummary
+    from .incremental_regrader import IncrementalRegrader, RegradeSummary
+    from .parallel_grade_calculator import ParallelGradeCalculator
+    from .scenario_engine import Scenario, ScenarioEngine, ScenarioResult
+    from .shard_coordinator import ShardCoordinator
+    from .shared_memory_grade_calculator import SharedMemoryGradeCalculator
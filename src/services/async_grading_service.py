@@ -0,0 +1,185 @@
+"""Servicio asíncrono de cálculo de notas con agrupación de solicitudes - RNF02."""
+
+import asyncio
+from typing import Dict, List, Optional, Tuple
+from ..models.grade_detail import GradeDetail
+from ..models.student import Student
+from .grade_calculator import GradeCalculator
+
+_PendingRequest = Tuple[tuple, Student, "asyncio.Future[GradeDetail]"]
+
+
+class AsyncGradingService:
+    """Expone GradeCalculator como servicio asyncio para el portal estudiantil.
+
+    Las solicitudes concurrentes se agrupan en micro-lotes limitados por
+    tamaño y por tiempo máximo de espera, y cada lote se calcula en una sola
+    pasada. Las solicitudes duplicadas en vuelo (mismo estudiante con los
+    mismos datos) comparten un único cálculo. Así se absorben picos de miles
+    de consultas simultáneas al publicar notas (RNF02).
+    """
+
+    DEFAULT_MAX_BATCH_SIZE = 256
+    DEFAULT_MAX_WAIT_SECONDS = 0.002
+
+    def __init__(
+        self,
+        calculator: GradeCalculator,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_seconds: float = DEFAULT_MAX_WAIT_SECONDS
+    ):
+        """Inicializa el servicio.
+
+        Args:
+            calculator: Calculador de notas a utilizar
+            max_batch_size: Máximo de solicitudes por lote
+            max_wait_seconds: Espera máxima para completar un lote
+
+        Raises:
+            ValueError: Si max_batch_size no es positivo o la espera es negativa
+        """
+        if max_batch_size < 1:
+            raise ValueError("El tamaño máximo de lote debe ser mayor que cero")
+        if max_wait_seconds < 0:
+            raise ValueError("La espera máxima no puede ser negativa")
+
+        self._calculator = calculator
+        self._max_batch_size = max_batch_size
+        self._max_wait_seconds = max_wait_seconds
+        self._queue: Optional[asyncio.Queue] = None
+        self._batch_ready: Optional[asyncio.Event] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._stopping = False
+        self._in_flight: Dict[tuple, asyncio.Future] = {}
+        self._requests_received = 0
+        self._requests_coalesced = 0
+        self._batches_processed = 0
+        self._calculations = 0
+
+    @property
+    def requests_received(self) -> int:
+        """Obtiene la cantidad de solicitudes recibidas."""
+        return self._requests_received
+
+    @property
+    def requests_coalesced(self) -> int:
+        """Obtiene las solicitudes resueltas con un cálculo ya en vuelo."""
+        return self._requests_coalesced
+
+    @property
+    def batches_processed(self) -> int:
+        """Obtiene la cantidad de lotes calculados."""
+        return self._batches_processed
+
+    @property
+    def calculations(self) -> int:
+        """Obtiene la cantidad de cálculos efectivamente realizados."""
+        return self._calculations
+
+    async def start(self) -> None:
+        """Inicia la tarea que procesa los lotes."""
+        if self._worker is None:
+            self._stopping = False
+            self._queue = asyncio.Queue()
+            self._batch_ready = asyncio.Event()
+            self._worker = asyncio.get_running_loop().create_task(self._process_batches())
+
+    async def stop(self) -> None:
+        """Detiene el servicio tras calcular las solicitudes pendientes."""
+        if self._worker is not None:
+            self._stopping = True
+            self._queue.put_nowait(None)
+            self._batch_ready.set()
+            await self._worker
+            self._worker = None
+
+    async def calculate_final_grade(self, student: Student) -> GradeDetail:
+        """Solicita la nota final de un estudiante (RF04).
+
+        Args:
+            student: Estudiante con sus evaluaciones y datos
+
+        Returns:
+            GradeDetail con el detalle completo del cálculo
+
+        Raises:
+            RuntimeError: Si el servicio no está iniciado
+            ValueError: Si no hay evaluaciones o los pesos no suman 100%
+        """
+        if self._worker is None or self._stopping:
+            raise RuntimeError("El servicio de cálculo no está iniciado")
+
+        self._requests_received += 1
+        key = (student.student_id, student.fingerprint)
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._in_flight[key] = future
+            self._queue.put_nowait((key, student, future))
+            if self._queue.qsize() >= self._max_batch_size:
+                self._batch_ready.set()
+        else:
+            self._requests_coalesced += 1
+
+        return await asyncio.shield(future)
+
+    async def _process_batches(self) -> None:
+        """Agrupa las solicitudes en lotes y los calcula hasta recibir la señal de fin."""
+        while True:
+            first = await self._queue.get()
+            if first is None:
+                return
+
+            if self._queue.qsize() + 1 < self._max_batch_size:
+                try:
+                    await asyncio.wait_for(self._batch_ready.wait(), self._max_wait_seconds)
+                except asyncio.TimeoutError:
+                    pass
+            self._batch_ready.clear()
+
+            batch = [first]
+            stopping = False
+            while len(batch) < self._max_batch_size and not self._queue.empty():
+                pending = self._queue.get_nowait()
+                if pending is None:
+                    stopping = True
+                    break
+                batch.append(pending)
+
+            self._grade_batch(batch)
+            if stopping:
+                return
+            if self._queue.qsize() >= self._max_batch_size:
+                self._batch_ready.set()
+
+    def _grade_batch(self, batch: List[_PendingRequest]) -> None:
+        """Calcula un lote en una sola pasada y resuelve sus futures.
+
+        Cualquier error de una solicitud se entrega a su propio future, de
+        modo que una entrada inválida no detiene la tarea de lotes.
+        """
+        calculate = self._calculator.calculate_final_grade
+        for key, student, future in batch:
+            del self._in_flight[key]
+            try:
+                future.set_result(calculate(student))
+            except Exception as error:
+                future.set_exception(error)
+        self._batches_processed += 1
+        self._calculations += len(batch)
+
+    async def __aenter__(self) -> "AsyncGradingService":
+        """Inicia el servicio al entrar al bloque async with."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        """Detiene el servicio al salir del bloque async with."""
+        await self.stop()
+
+    def __repr__(self) -> str:
+        """Representación string del servicio."""
+        return (
+            f"AsyncGradingService(max_batch_size={self._max_batch_size}, "
+            f"max_wait={self._max_wait_seconds}s, batches={self._batches_processed})"
+        )
@@ -0,0 +1,389 @@
+"""Validación masiva de cohortes en columnas para importaciones."""
+
+import math
+import operator
+from functools import reduce
+from typing import Dict, Iterator, List, Optional, Sequence, Set
+from ..models.evaluation import Evaluation
+from ..models.student import Student
+from .grade_calculator import GradeCalculator
+
+RULE_NO_EVALUATIONS = "no_evaluations"
+RULE_GRADE_NOT_NUMBER = "grade_not_number"
+RULE_GRADE_RANGE = "grade_range"
+RULE_WEIGHT_NOT_NUMBER = "weight_not_number"
+RULE_WEIGHT_RANGE = "weight_range"
+RULE_WEIGHT_SUM = "weight_sum"
+
+
+class Violation:
+    """Incumplimiento de una regla de validación en una fila del lote."""
+
+    __slots__ = ("_row", "_student_id", "_rule", "_message", "_evaluation_index", "_value")
+
+    def __init__(
+        self,
+        row: int,
+        student_id: str,
+        rule: str,
+        message: str,
+        evaluation_index: Optional[int] = None,
+        value: object = None
+    ):
+        """Inicializa la violación.
+
+        Args:
+            row: Fila del estudiante dentro del lote (desde 0)
+            student_id: Identificador del estudiante
+            rule: Regla incumplida (una de las constantes RULE_*)
+            message: Mensaje equivalente al ValueError del modelo
+            evaluation_index: Posición de la evaluación dentro de la fila, si aplica
+            value: Valor que incumple la regla
+        """
+        self._row = row
+        self._student_id = student_id
+        self._rule = rule
+        self._message = message
+        self._evaluation_index = evaluation_index
+        self._value = value
+
+    @property
+    def row(self) -> int:
+        """Obtiene la fila del estudiante dentro del lote."""
+        return self._row
+
+    @property
+    def student_id(self) -> str:
+        """Obtiene el identificador del estudiante."""
+        return self._student_id
+
+    @property
+    def rule(self) -> str:
+        """Obtiene la regla incumplida."""
+        return self._rule
+
+    @property
+    def message(self) -> str:
+        """Obtiene el mensaje de la violación."""
+        return self._message
+
+    @property
+    def evaluation_index(self) -> Optional[int]:
+        """Obtiene la posición de la evaluación, o None si afecta a toda la fila."""
+        return self._evaluation_index
+
+    @property
+    def value(self) -> object:
+        """Obtiene el valor que incumple la regla."""
+        return self._value
+
+    def to_dict(self) -> dict:
+        """Convierte la violación a diccionario para exportarla."""
+        return {
+            "row": self._row,
+            "student_id": self._student_id,
+            "rule": self._rule,
+            "evaluation_index": self._evaluation_index,
+            "value": self._value,
+            "message": self._message,
+        }
+
+    def __repr__(self) -> str:
+        """Representación string de la violación."""
+        return (
+            f"Violation(row={self._row}, student_id={self._student_id}, "
+            f"rule={self._rule}, evaluation_index={self._evaluation_index})"
+        )
+
+
+class ValidationReport:
+    """Reporte con todas las violaciones encontradas en un lote."""
+
+    def __init__(self, students_checked: int, violations: List[Violation]):
+        """Inicializa el reporte.
+
+        Args:
+            students_checked: Cantidad de estudiantes revisados
+            violations: Violaciones ordenadas por fila
+        """
+        self._students_checked = students_checked
+        self._violations = violations
+
+    @property
+    def students_checked(self) -> int:
+        """Obtiene la cantidad de estudiantes revisados."""
+        return self._students_checked
+
+    @property
+    def violations(self) -> List[Violation]:
+        """Obtiene una copia de las violaciones encontradas."""
+        return list(self._violations)
+
+    @property
+    def is_valid(self) -> bool:
+        """Indica si el lote no tiene violaciones."""
+        return not self._violations
+
+    def invalid_rows(self) -> Set[int]:
+        """Obtiene las filas con al menos una violación."""
+        return {violation.row for violation in self._violations}
+
+    def count_by_rule(self) -> Dict[str, int]:
+        """Obtiene la cantidad de violaciones por regla."""
+        counts: Dict[str, int] = {}
+        for violation in self._violations:
+            counts[violation.rule] = counts.get(violation.rule, 0) + 1
+        return counts
+
+    def to_dicts(self) -> List[dict]:
+        """Convierte todas las violaciones a diccionarios."""
+        return [violation.to_dict() for violation in self._violations]
+
+    def __iter__(self) -> Iterator[Violation]:
+        """Itera las violaciones en orden de fila."""
+        return iter(self._violations)
+
+    def __len__(self) -> int:
+        """Obtiene la cantidad de violaciones."""
+        return len(self._violations)
+
+    def __repr__(self) -> str:
+        """Representación string del reporte."""
+        return (
+            f"ValidationReport(students={self._students_checked}, "
+            f"violations={len(self._violations)})"
+        )
+
+
+class BulkValidator:
+    """Valida una cohorte completa en columnas y reporta todas las violaciones.
+
+    Aplica las mismas reglas que Evaluation (rango de nota y peso) y que
+    GradeCalculator (al menos una evaluación y pesos que suman 100%), pero
+    sobre columnas completas: si min() y max() de una columna están dentro
+    del rango no se revisa elemento por elemento. En lugar de detenerse en el
+    primer ValueError devuelve un ValidationReport con fila, estudiante y
+    regla de cada incumplimiento. Un estudiante sin violaciones es aceptado
+    por GradeCalculator.calculate_batch_flat.
+    """
+
+    def validate_batch(
+        self,
+        student_ids: Sequence[str],
+        grades: Sequence[Sequence[float]],
+        weights: Sequence[Sequence[float]]
+    ) -> ValidationReport:
+        """Valida una cohorte expresada como matrices de notas y pesos.
+
+        Args:
+            student_ids: Identificadores de los estudiantes (n)
+            grades: Matriz de notas, una fila por estudiante
+            weights: Matriz de pesos, con la misma forma que grades
+
+        Returns:
+            ValidationReport con todas las violaciones encontradas
+
+        Raises:
+            ValueError: Si las dimensiones de las matrices no coinciden
+        """
+        if len(grades) != len(student_ids) or len(weights) != len(student_ids):
+            raise ValueError("Las matrices de notas y pesos deben tener una fila por estudiante")
+
+        counts = [len(row) for row in grades]
+        width = max(counts, default=0)
+        flat_grades: List[object] = [0.0] * (width * len(grades))
+        flat_weights: List[object] = [0.0] * (width * len(weights))
+
+        for row_index, (grade_row, weight_row) in enumerate(zip(grades, weights)):
+            if len(grade_row) != len(weight_row):
+                raise ValueError(
+                    f"Estudiante {student_ids[row_index]}: "
+                    "cada nota debe tener su peso correspondiente"
+                )
+            start = row_index * width
+            flat_grades[start:start + len(grade_row)] = grade_row
+            flat_weights[start:start + len(weight_row)] = weight_row
+
+        return self.validate_batch_flat(student_ids, flat_grades, flat_weights, width, counts)
+
+    def validate_batch_flat(
+        self,
+        student_ids: Sequence[str],
+        grades: Sequence[float],
+        weights: Sequence[float],
+        evaluations_per_student: int,
+        evaluation_counts: Optional[Sequence[int]] = None
+    ) -> ValidationReport:
+        """Valida una cohorte almacenada en columnas planas (n x k).
+
+        Usa el mismo formato que GradeCalculator.calculate_batch_flat: las
+        evaluaciones del estudiante i ocupan las posiciones [i*k, (i+1)*k).
+
+        Args:
+            student_ids: Identificadores de los estudiantes (n)
+            grades: Notas en orden por filas (n * k)
+            weights: Pesos en orden por filas (n * k)
+            evaluations_per_student: Ancho k de cada fila
+            evaluation_counts: Evaluaciones usadas por fila; si se omite se
+                               usan las k posiciones de cada fila
+
+        Returns:
+            ValidationReport con todas las violaciones encontradas
+
+        Raises:
+            ValueError: Si las dimensiones de las columnas no coinciden
+        """
+        size = len(student_ids)
+        width = evaluations_per_student
+        self._validate_shape(size, grades, weights, width, evaluation_counts)
+        if evaluation_counts is None:
+            evaluation_counts = [width] * size
+
+        grade_rows = self._rows_out_of_range(
+            grades, width, evaluation_counts, Evaluation.MIN_GRADE, Evaluation.MAX_GRADE
+        )
+        weight_rows = self._rows_out_of_range(
+            weights, width, evaluation_counts, Evaluation.MIN_WEIGHT, Evaluation.MAX_WEIGHT
+        )
+
+        violations: List[Violation] = []
+        for row in range(size):
+            count = evaluation_counts[row]
+            if count == 0:
+                violations.append(Violation(
+                    row, student_ids[row], RULE_NO_EVALUATIONS,
+                    "El estudiante debe tener al menos una evaluación"
+                ))
+                continue
+
+            start = row * width
+            row_is_numeric = True
+            if row in grade_rows:
+                row_is_numeric &= self._check_range(
+                    violations, row, student_ids[row], grades[start:start + count],
+                    Evaluation.MIN_GRADE, Evaluation.MAX_GRADE,
+                    RULE_GRADE_NOT_NUMBER, RULE_GRADE_RANGE, "La nota"
+                )
+            if row in weight_rows:
+                row_is_numeric &= self._check_range(
+                    violations, row, student_ids[row], weights[start:start + count],
+                    Evaluation.MIN_WEIGHT, Evaluation.MAX_WEIGHT,
+                    RULE_WEIGHT_NOT_NUMBER, RULE_WEIGHT_RANGE, "El peso"
+                )
+            if not row_is_numeric:
+                continue
+
+            # Misma suma secuencial que GradeCalculator para coincidir en el límite
+            total_weight = reduce(operator.add, weights[start:start + count], 0.0)
+            if abs(total_weight - GradeCalculator.MINIMUM_WEIGHT_SUM) > (
+                GradeCalculator.WEIGHT_SUM_TOLERANCE
+            ):
+                violations.append(Violation(
+                    row, student_ids[row], RULE_WEIGHT_SUM,
+                    f"Los pesos de las evaluaciones deben sumar "
+                    f"{GradeCalculator.MINIMUM_WEIGHT_SUM}%, pero suman {total_weight}%",
+                    value=total_weight
+                ))
+
+        return ValidationReport(size, violations)
+
+    def _validate_shape(
+        self,
+        size: int,
+        grades: Sequence[float],
+        weights: Sequence[float],
+        width: int,
+        evaluation_counts: Optional[Sequence[int]]
+    ) -> None:
+        """Valida que las columnas tengan dimensiones coherentes.
+
+        Raises:
+            ValueError: Si alguna columna no coincide con n o n * k
+        """
+        if width < 0 or width > Student.MAX_EVALUATIONS:
+            raise ValueError(
+                f"No se pueden tener más de {Student.MAX_EVALUATIONS} evaluaciones"
+            )
+        if len(grades) != size * width or len(weights) != size * width:
+            raise ValueError("Las columnas de notas y pesos deben tener n * k elementos")
+        if evaluation_counts is not None:
+            if len(evaluation_counts) != size:
+                raise ValueError("Debe indicarse una cantidad de evaluaciones por estudiante")
+            if any(count < 0 or count > width for count in evaluation_counts):
+                raise ValueError(
+                    f"La cantidad de evaluaciones por estudiante debe estar entre 0 y {width}"
+                )
+
+    def _rows_out_of_range(
+        self,
+        column: Sequence[float],
+        width: int,
+        evaluation_counts: Sequence[int],
+        minimum: float,
+        maximum: float
+    ) -> Set[int]:
+        """Obtiene las filas que requieren revisión elemento por elemento.
+
+        Si la columna completa está dentro de [minimum, maximum] (comprobado
+        con min, max y sum, que también detecta NaN) no hay filas por
+        revisar. Si no, se repite la comprobación fila por fila.
+        """
+        if self._is_within_range(column, minimum, maximum):
+            return set()
+        return {
+            row for row, count in enumerate(evaluation_counts)
+            if not self._is_within_range(
+                column[row * width:row * width + count], minimum, maximum
+            )
+        }
+
+    @staticmethod
+    def _is_within_range(values: Sequence[float], minimum: float, maximum: float) -> bool:
+        """Indica si todos los valores son números dentro del rango."""
+        if not values:
+            return True
+        try:
+            return (
+                min(values) >= minimum
+                and max(values) <= maximum
+                and not math.isnan(sum(values))
+            )
+        except TypeError:
+            return False
+
+    @staticmethod
+    def _check_range(
+        violations: List[Violation],
+        row: int,
+        student_id: str,
+        values: Sequence[float],
+        minimum: float,
+        maximum: float,
+        type_rule: str,
+        range_rule: str,
+        label: str
+    ) -> bool:
+        """Registra las violaciones de tipo y rango de una fila.
+
+        Returns:
+            True si todos los valores de la fila son numéricos
+        """
+        all_numeric = True
+        for position, value in enumerate(values):
+            if not isinstance(value, (int, float)):
+                all_numeric = False
+                violations.append(Violation(
+                    row, student_id, type_rule, f"{label} debe ser un número",
+                    evaluation_index=position, value=value
+                ))
+            elif not minimum <= value <= maximum:
+                violations.append(Violation(
+                    row, student_id, range_rule,
+                    f"{label} debe estar entre {minimum} y {maximum}",
+                    evaluation_index=position, value=value
+                ))
+        return all_numeric
+
+    def __repr__(self) -> str:
+        """Representación string del validador."""
+        return "BulkValidator()"
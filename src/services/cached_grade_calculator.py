@@ -0,0 +1,184 @@
+"""Caché de resultados delante de GradeCalculator."""
+
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+from ..models.grade_detail import GradeDetail
+from ..models.student import Student
+from .grade_calculator import GradeCalculator
+
+
+class _CacheEntry:
+    """Resultado almacenado junto con las huellas que lo validan."""
+
+    __slots__ = ("student_fingerprint", "policy_fingerprint", "grade_detail", "expires_at")
+
+    def __init__(self, student_fingerprint, policy_fingerprint, grade_detail, expires_at):
+        self.student_fingerprint = student_fingerprint
+        self.policy_fingerprint = policy_fingerprint
+        self.grade_detail = grade_detail
+        self.expires_at = expires_at
+
+
+class CachedGradeCalculator:
+    """Caché LRU/TTL de GradeDetail para consultas repetidas.
+
+    Cada entrada se indexa por student_id y solo se reutiliza si coinciden la
+    huella del estudiante (evaluaciones y asistencia) y la huella de las
+    políticas del calculador, por lo que un cambio en cualquiera de ellas
+    produce un nuevo cálculo. Los registros hechos a través de
+    register_evaluation y register_attendance invalidan la entrada de
+    inmediato.
+    """
+
+    DEFAULT_MAX_SIZE = 1024
+
+    def __init__(
+        self,
+        calculator: GradeCalculator,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """Inicializa la caché.
+
+        Args:
+            calculator: Calculador que produce los resultados
+            max_size: Cantidad máxima de entradas antes de desalojar la menos usada
+            ttl_seconds: Vigencia de cada entrada; None para no expirar
+            clock: Reloj monotónico usado para el TTL
+
+        Raises:
+            ValueError: Si max_size o ttl_seconds no son positivos
+        """
+        if max_size < 1:
+            raise ValueError("El tamaño máximo de la caché debe ser mayor que cero")
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError("El TTL de la caché debe ser mayor que cero")
+
+        self._calculator = calculator
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @property
+    def hits(self) -> int:
+        """Obtiene la cantidad de aciertos."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Obtiene la cantidad de fallos."""
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """Obtiene la cantidad de entradas desalojadas por capacidad."""
+        return self._evictions
+
+    @property
+    def expirations(self) -> int:
+        """Obtiene la cantidad de entradas descartadas por TTL."""
+        return self._expirations
+
+    @property
+    def size(self) -> int:
+        """Obtiene la cantidad de entradas almacenadas."""
+        return len(self._entries)
+
+    def calculate_final_grade(self, student: Student) -> GradeDetail:
+        """Devuelve la nota final en caché o la calcula si no es válida (RF04).
+
+        Args:
+            student: Estudiante con sus evaluaciones y datos
+
+        Returns:
+            GradeDetail almacenado o recién calculado
+
+        Raises:
+            ValueError: Si no hay evaluaciones o los pesos no suman 100%
+        """
+        student_id = student.student_id
+        student_fingerprint = student.fingerprint
+        policy_fingerprint = self._calculator.policy_fingerprint
+
+        entry = self._entries.get(student_id)
+        if entry is not None:
+            if entry.expires_at is not None and self._clock() >= entry.expires_at:
+                del self._entries[student_id]
+                self._expirations += 1
+            elif (entry.student_fingerprint == student_fingerprint
+                  and entry.policy_fingerprint == policy_fingerprint):
+                self._entries.move_to_end(student_id)
+                self._hits += 1
+                return entry.grade_detail
+
+        self._misses += 1
+        grade_detail = self._calculator.calculate_final_grade(student)
+        self._store(student_id, student_fingerprint, policy_fingerprint, grade_detail)
+        return grade_detail
+
+    def register_evaluation(self, student: Student, grade: float, weight: float) -> None:
+        """Registra una evaluación (RF01) e invalida la entrada del estudiante.
+
+        Args:
+            student: Estudiante al que se agrega la evaluación
+            grade: Nota obtenida
+            weight: Peso porcentual
+
+        Raises:
+            ValueError: Si se excede el límite de evaluaciones
+        """
+        self.invalidate(student.student_id)
+        self._calculator.register_evaluation(student, grade, weight)
+
+    def register_attendance(self, student: Student, has_reached_minimum: bool) -> None:
+        """Registra la asistencia (RF02) e invalida la entrada del estudiante.
+
+        Args:
+            student: Estudiante a actualizar
+            has_reached_minimum: Si cumplió la asistencia mínima
+        """
+        self.invalidate(student.student_id)
+        self._calculator.register_attendance(student, has_reached_minimum)
+
+    def invalidate(self, student_id: str) -> None:
+        """Descarta la entrada de un estudiante, si existe."""
+        self._entries.pop(student_id, None)
+
+    def clear(self) -> None:
+        """Descarta todas las entradas sin reiniciar los contadores."""
+        self._entries.clear()
+
+    def _store(
+        self,
+        student_id: str,
+        student_fingerprint: tuple,
+        policy_fingerprint: str,
+        grade_detail: GradeDetail
+    ) -> None:
+        """Guarda un resultado y desaloja la entrada menos usada si hace falta."""
+        expires_at = None
+        if self._ttl_seconds is not None:
+            expires_at = self._clock() + self._ttl_seconds
+
+        self._entries[student_id] = _CacheEntry(
+            student_fingerprint, policy_fingerprint, grade_detail, expires_at
+        )
+        self._entries.move_to_end(student_id)
+
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def __repr__(self) -> str:
+        """Representación string de la caché."""
+        return (
+            f"CachedGradeCalculator(size={len(self._entries)}/{self._max_size}, "
+            f"hits={self._hits}, misses={self._misses}, evictions={self._evictions})"
+        )
@@ -0,0 +1,134 @@
+"""Esquema de evaluación fijo de un curso, validado y precompilado una vez."""
+
+import operator
+from array import array
+from functools import reduce
+from typing import Sequence, Tuple
+from ..models.evaluation import Evaluation
+from ..models.student import Student
+from .grade_calculator import GradeCalculator
+
+
+class CourseScheme:
+    """Vector de pesos compartido por todos los estudiantes de un curso.
+
+    Valida los pesos una sola vez (rango de Evaluation, máximo de
+    evaluaciones y suma de 100%) y precalcula los coeficientes weight / 100.
+    Calificar a un estudiante se reduce entonces a un producto punto entre
+    sus notas y los coeficientes, acumulado en el mismo orden que
+    GradeCalculator.
+    """
+
+    def __init__(self, weights: Sequence[float], name: str = ""):
+        """Inicializa el esquema.
+
+        Args:
+            weights: Peso porcentual de cada evaluación, en orden
+            name: Nombre descriptivo del curso o esquema
+
+        Raises:
+            ValueError: Si los pesos están fuera de rango, exceden el máximo
+                        de evaluaciones o no suman 100%
+        """
+        if not weights:
+            raise ValueError("El esquema debe tener al menos una evaluación")
+        if len(weights) > Student.MAX_EVALUATIONS:
+            raise ValueError(
+                f"No se pueden tener más de {Student.MAX_EVALUATIONS} evaluaciones"
+            )
+
+        total_weight = 0.0
+        for weight in weights:
+            # Evaluation aplica las mismas validaciones de tipo y rango del peso
+            total_weight += Evaluation(Evaluation.MIN_GRADE, weight).weight
+        if abs(total_weight - GradeCalculator.MINIMUM_WEIGHT_SUM) > (
+            GradeCalculator.WEIGHT_SUM_TOLERANCE
+        ):
+            raise ValueError(
+                f"Los pesos de las evaluaciones deben sumar "
+                f"{GradeCalculator.MINIMUM_WEIGHT_SUM}%, pero suman {total_weight}%"
+            )
+
+        self._name = name
+        self._weights = tuple(float(weight) for weight in weights)
+        self._coefficients = tuple(weight / 100.0 for weight in self._weights)
+
+    @property
+    def name(self) -> str:
+        """Obtiene el nombre del esquema."""
+        return self._name
+
+    @property
+    def weights(self) -> Tuple[float, ...]:
+        """Obtiene los pesos porcentuales."""
+        return self._weights
+
+    @property
+    def coefficients(self) -> Tuple[float, ...]:
+        """Obtiene los coeficientes precalculados (peso / 100)."""
+        return self._coefficients
+
+    @property
+    def evaluation_count(self) -> int:
+        """Obtiene la cantidad de evaluaciones del esquema."""
+        return len(self._weights)
+
+    def weighted_average(self, grades: Sequence[float]) -> float:
+        """Calcula el promedio ponderado de un vector de notas.
+
+        Args:
+            grades: Una nota por evaluación, en el orden del esquema
+
+        Returns:
+            Promedio ponderado
+
+        Raises:
+            ValueError: Si la cantidad de notas no coincide con el esquema
+        """
+        if len(grades) != len(self._coefficients):
+            raise ValueError(
+                f"Se esperaban {len(self._coefficients)} notas, pero hay {len(grades)}"
+            )
+        return reduce(operator.add, map(operator.mul, grades, self._coefficients), 0.0)
+
+    def weighted_averages(self, grades: Sequence[float]) -> array:
+        """Calcula el promedio ponderado de todo un curso (matriz por vector).
+
+        Recorre la matriz por columnas: cada paso suma la contribución de una
+        evaluación para todos los estudiantes, manteniendo por fila el mismo
+        orden de acumulación que weighted_average.
+
+        Args:
+            grades: Notas en orden por filas (n * k, con k = evaluation_count)
+
+        Returns:
+            Promedio ponderado por estudiante (n)
+
+        Raises:
+            ValueError: Si la cantidad de notas no es múltiplo de k
+        """
+        width = len(self._coefficients)
+        if len(grades) % width != 0:
+            raise ValueError(f"Las notas deben tener n * {width} elementos")
+
+        totals = [0.0] * (len(grades) // width)
+        for position, coefficient in enumerate(self._coefficients):
+            totals = [
+                total + grade * coefficient
+                for total, grade in zip(totals, grades[position::width])
+            ]
+        return array("d", totals)
+
+    def __eq__(self, other) -> bool:
+        """Compara dos esquemas por sus pesos."""
+        if not isinstance(other, CourseScheme):
+            return False
+        return self._weights == other._weights
+
+    def __hash__(self) -> int:
+        """Hash basado en los pesos."""
+        return hash(self._weights)
+
+    def __repr__(self) -> str:
+        """Representación string del esquema."""
+        return f"CourseScheme(name={self._name!r}, weights={list(self._weights)})"
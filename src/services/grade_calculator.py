@@ -1,12 +1,20 @@
 """Calculador de notas finales - RF04 y RF05."""
 
-from typing import List
+import time
+from array import array
+from typing import TYPE_CHECKING, Optional, Sequence, Tuple
+from ..instrumentation import metrics_sink as metrics
+from ..instrumentation.metrics_sink import MetricsSink
 from ..models.evaluation import Evaluation
 from ..models.student import Student
 from ..models.grade_detail import GradeDetail
+from ..models.grade_detail_set import GradeDetailSet
 from ..policies.attendance_policy import AttendancePolicy
 from ..policies.extra_points_policy import ExtraPointsPolicy
 
+if TYPE_CHECKING:
+    from .course_scheme import CourseScheme
+
 
 class GradeCalculator:
     """Calcula la nota final de estudiantes considerando evaluaciones, asistencia y puntos extra.
@@ -16,25 +24,47 @@ class GradeCalculator:
     - RF04: Cálculo de nota final
     - RF05: Detalle del cálculo
     - RNF03: Cálculo determinista
+
+    Todas las rutas de cálculo (por estudiante, en lote, por buffers y las
+    clases que las reutilizan) acumulan las evaluaciones en orden, de forma
+    secuencial desde 0.0. Por eso, con los mismos datos, producen los mismos
+    bits que calculate_final_grade en el mismo intérprete. Hasta Python 3.11
+    esa suma coincide con sum(); desde 3.12 sum() usa suma compensada y
+    puede diferir en el último bit, incluido el total que se informa cuando
+    los pesos no suman 100%.
     """
 
     MIN_FINAL_GRADE = 0.0
     MAX_FINAL_GRADE = 20.0
+    PASSING_GRADE = 10.5
     MINIMUM_WEIGHT_SUM = 100.0
+    WEIGHT_SUM_TOLERANCE = 0.01
 
     def __init__(
         self,
         attendance_policy: AttendancePolicy,
-        extra_points_policy: ExtraPointsPolicy
+        extra_points_policy: ExtraPointsPolicy,
+        metrics_sink: Optional[MetricsSink] = None
     ):
         """Inicializa el calculador de notas.
 
         Args:
             attendance_policy: Política de asistencia a aplicar
             extra_points_policy: Política de puntos extra a aplicar
+            metrics_sink: Destino opcional de métricas por etapa; si es None
+                          el cálculo no se instrumenta
         """
         self._attendance_policy = attendance_policy
         self._extra_points_policy = extra_points_policy
+        self._metrics_sink = metrics_sink
+
+    @property
+    def policy_fingerprint(self) -> str:
+        """Obtiene la huella combinada de las políticas configuradas."""
+        return (
+            f"{self._attendance_policy.fingerprint}|"
+            f"{self._extra_points_policy.fingerprint}"
+        )
 
     def calculate_final_grade(self, student: Student) -> GradeDetail:
         """Calcula la nota final de un estudiante (RF04 y RF05).
@@ -54,29 +84,56 @@ class GradeCalculator:
         Raises:
             ValueError: Si no hay evaluaciones o los pesos no suman 100%
         """
-        self._validate_student_data(student)
+        if self._metrics_sink is not None:
+            return self._calculate_instrumented(student)
 
-        # Paso 1: Promedio ponderado
-        weighted_average = self._calculate_weighted_average(student.evaluations)
+        # Paso 1: Validación y promedio ponderado en una sola pasada
+        weighted_average = self._accumulate_evaluations(student)
 
-        # Paso 2: Aplicar política de asistencia
-        grade_after_attendance = self._attendance_policy.apply_penalty(
-            student.has_reached_minimum_classes,
-            weighted_average
-        )
-        attendance_penalty = self._attendance_policy.calculate_penalty_amount(
-            student.has_reached_minimum_classes,
-            weighted_average
+        return self._build_grade_detail(
+            weighted_average, student.has_reached_minimum_classes
         )
 
-        # Paso 3: Aplicar puntos extra
-        extra_points = self._extra_points_policy.calculate_extra_points(
-            student_meets_criteria=True
+    def _calculate_instrumented(self, student: Student) -> GradeDetail:
+        """Calcula la nota final informando duración por etapa al destino de métricas.
+
+        Mide las mismas funciones que usa calculate_final_grade, por lo que
+        el resultado es idéntico. La suma de pesos se valida en la misma
+        pasada que el promedio ponderado, de modo que su costo se informa en
+        esa etapa.
+        """
+        sink = self._metrics_sink
+        clock = time.perf_counter_ns
+        evaluation_count = student.evaluation_count
+        sink.observe(metrics.EVALUATIONS_PER_STUDENT, evaluation_count)
+
+        started = clock()
+        if evaluation_count == 0:
+            sink.increment(metrics.VALIDATION_FAILURES, metrics.FAILURE_NO_EVALUATIONS)
+            raise ValueError("El estudiante debe tener al menos una evaluación")
+        validated = clock()
+        sink.record_duration(metrics.STAGE_VALIDATION, validated - started)
+
+        try:
+            weighted_average = self._accumulate_evaluations(student)
+        except ValueError:
+            sink.increment(metrics.VALIDATION_FAILURES, metrics.FAILURE_WEIGHT_SUM)
+            raise
+        averaged = clock()
+        sink.record_duration(metrics.STAGE_WEIGHTED_AVERAGE, averaged - validated)
+
+        grade_after_attendance, attendance_penalty = self._apply_attendance_policy(
+            weighted_average, student.has_reached_minimum_classes
         )
-        grade_with_extra = grade_after_attendance + extra_points
+        penalized = clock()
+        sink.record_duration(metrics.STAGE_ATTENDANCE_POLICY, penalized - averaged)
+
+        extra_points, grade_with_extra = self._apply_extra_points(grade_after_attendance)
+        with_extra = clock()
+        sink.record_duration(metrics.STAGE_EXTRA_POINTS, with_extra - penalized)
 
-        # Paso 4: Asegurar rango válido [0, 20]
         final_grade = self._clamp_grade(grade_with_extra)
+        sink.record_duration(metrics.STAGE_CLAMP, clock() - with_extra)
 
         return GradeDetail(
             weighted_average=weighted_average,
@@ -85,45 +142,600 @@ class GradeCalculator:
             final_grade=final_grade
         )
 
-    def _calculate_weighted_average(self, evaluations: List[Evaluation]) -> float:
-        """Calcula el promedio ponderado de las evaluaciones.
+    def calculate_final_grade_incremental(self, student: Student) -> GradeDetail:
+        """Calcula la nota final usando los totales acumulados del estudiante.
+
+        En lugar de recorrer las evaluaciones usa la suma de pesos y la suma
+        ponderada que Student mantiene en add_evaluation, por lo que el costo
+        es O(1). El resultado es idéntico al de calculate_final_grade.
 
         Args:
-            evaluations: Lista de evaluaciones del estudiante
+            student: Estudiante con sus evaluaciones y datos
 
         Returns:
-            Promedio ponderado
+            GradeDetail con el detalle completo del cálculo
+
+        Raises:
+            ValueError: Si no hay evaluaciones o los pesos no suman 100%
         """
-        if not evaluations:
-            return 0.0
+        if student.evaluation_count == 0:
+            raise ValueError("El estudiante debe tener al menos una evaluación")
+        self._validate_weight_total(student.weight_total)
 
-        total_weighted_sum = sum(
-            evaluation.grade * (evaluation.weight / 100.0)
-            for evaluation in evaluations
+        return self._build_grade_detail(
+            student.weighted_sum, student.has_reached_minimum_classes
         )
 
-        return total_weighted_sum
+    def calculate_final_grades(self, students: Sequence[Student]) -> GradeDetailSet:
+        """Calcula la nota final de varios estudiantes en un resultado columnar.
+
+        Equivale a llamar calculate_final_grade por cada estudiante, pero
+        escribe cada componente directamente en su columna en lugar de crear
+        un GradeDetail por estudiante.
+
+        Args:
+            students: Estudiantes con sus evaluaciones y datos
+
+        Returns:
+            GradeDetailSet en el mismo orden que students
+
+        Raises:
+            ValueError: Si algún estudiante tiene datos inválidos
+        """
+        weighted_averages = array("d", bytes(8 * len(students)))
+        for row, student in enumerate(students):
+            try:
+                weighted_averages[row] = self._accumulate_evaluations(student)
+            except ValueError as error:
+                raise ValueError(f"Estudiante {student.student_id}: {error}") from error
+
+        return self._build_grade_detail_set(
+            [student.student_id for student in students],
+            weighted_averages,
+            [student.has_reached_minimum_classes for student in students]
+        )
+
+    def calculate_with_scheme(
+        self,
+        scheme: "CourseScheme",
+        grades: Sequence[float],
+        has_reached_minimum_classes: bool
+    ) -> GradeDetail:
+        """Calcula la nota final de un estudiante de un curso con esquema fijo.
+
+        Los pesos ya fueron validados por el esquema, por lo que solo se
+        validan las notas. El resultado es idéntico al de
+        calculate_final_grade con evaluaciones de los mismos pesos.
+
+        Args:
+            scheme: Esquema de pesos del curso
+            grades: Una nota por evaluación, en el orden del esquema
+            has_reached_minimum_classes: Si cumplió la asistencia mínima (RF02)
+
+        Returns:
+            GradeDetail con el detalle completo del cálculo
+
+        Raises:
+            ValueError: Si alguna nota es inválida o no coincide con el esquema
+        """
+        for grade in grades:
+            self._validate_scheme_grade(grade)
+        return self._build_grade_detail(
+            scheme.weighted_average(grades), has_reached_minimum_classes
+        )
 
-    def _validate_student_data(self, student: Student) -> None:
-        """Valida los datos del estudiante antes del cálculo.
+    def calculate_course(
+        self,
+        scheme: "CourseScheme",
+        student_ids: Sequence[str],
+        grades: Sequence[float],
+        attendance: Sequence[bool]
+    ) -> GradeDetailSet:
+        """Calcula la nota final de todo un curso con esquema fijo.
+
+        Las notas de la sección forman una matriz n x k en orden por filas;
+        el promedio ponderado se obtiene con un producto matriz-vector contra
+        los coeficientes del esquema.
+
+        Args:
+            scheme: Esquema de pesos del curso
+            student_ids: Identificadores de los estudiantes (n)
+            grades: Notas en orden por filas (n * k)
+            attendance: Máscara de asistencia mínima por estudiante (n)
+
+        Returns:
+            GradeDetailSet con los componentes del cálculo en columnas
+
+        Raises:
+            ValueError: Si las dimensiones no coinciden o alguna nota es inválida
+        """
+        size = len(student_ids)
+        width = scheme.evaluation_count
+        if len(grades) != size * width:
+            raise ValueError(f"Las notas deben tener n * {width} elementos")
+        if len(attendance) != size:
+            raise ValueError("La máscara de asistencia debe tener un valor por estudiante")
+
+        try:
+            in_range = not size or (
+                min(grades) >= Evaluation.MIN_GRADE and max(grades) <= Evaluation.MAX_GRADE
+            )
+        except TypeError:
+            # Alguna nota no es numérica: la validación por celda informa cuál
+            in_range = False
+        if not in_range:
+            for position, grade in enumerate(grades):
+                try:
+                    self._validate_scheme_grade(grade)
+                except ValueError as error:
+                    raise ValueError(
+                        f"Estudiante {student_ids[position // width]}: {error}"
+                    ) from error
+
+        return self._build_grade_detail_set(
+            student_ids, scheme.weighted_averages(grades), attendance
+        )
+
+    def calculate_batch(
+        self,
+        student_ids: Sequence[str],
+        grades: Sequence[Sequence[float]],
+        weights: Sequence[Sequence[float]],
+        attendance: Sequence[bool]
+    ) -> GradeDetailSet:
+        """Calcula la nota final de una cohorte completa en una sola pasada.
+
+        Equivale a llamar calculate_final_grade por cada estudiante, pero sin
+        construir Student, Evaluation ni GradeDetail por fila. Usa el mismo
+        orden de acumulación que calculate_batch_flat.
+
+        Args:
+            student_ids: Identificadores de los estudiantes (n)
+            grades: Matriz de notas, una fila por estudiante
+            weights: Matriz de pesos, con la misma forma que grades
+            attendance: Máscara de asistencia mínima por estudiante (RF02)
+
+        Returns:
+            GradeDetailSet con los componentes del cálculo en columnas
+
+        Raises:
+            ValueError: Si las dimensiones no coinciden o algún estudiante
+                        tiene datos inválidos
+        """
+        if len(grades) != len(student_ids) or len(weights) != len(student_ids):
+            raise ValueError("Las matrices de notas y pesos deben tener una fila por estudiante")
+
+        counts = [len(row) for row in grades]
+        width = max(counts, default=0)
+        flat_grades = array("d", bytes(8 * width * len(grades)))
+        flat_weights = array("d", bytes(8 * width * len(weights)))
+
+        for row_index, (grade_row, weight_row) in enumerate(zip(grades, weights)):
+            if len(grade_row) != len(weight_row):
+                raise ValueError(
+                    f"Estudiante {student_ids[row_index]}: "
+                    "cada nota debe tener su peso correspondiente"
+                )
+            start = row_index * width
+            try:
+                flat_grades[start:start + len(grade_row)] = array("d", grade_row)
+            except TypeError:
+                raise ValueError(
+                    f"Estudiante {student_ids[row_index]}: La nota debe ser un número"
+                ) from None
+            try:
+                flat_weights[start:start + len(weight_row)] = array("d", weight_row)
+            except TypeError:
+                raise ValueError(
+                    f"Estudiante {student_ids[row_index]}: El peso debe ser un número"
+                ) from None
+
+        return self.calculate_batch_flat(
+            student_ids, flat_grades, flat_weights, attendance, width, counts
+        )
+
+    def calculate_batch_flat(
+        self,
+        student_ids: Sequence[str],
+        grades: Sequence[float],
+        weights: Sequence[float],
+        attendance: Sequence[bool],
+        evaluations_per_student: int,
+        evaluation_counts: Optional[Sequence[int]] = None
+    ) -> GradeDetailSet:
+        """Calcula la nota final de una cohorte almacenada en columnas planas.
+
+        Las notas y pesos se reciben en orden por filas (n x k): las
+        evaluaciones del estudiante i ocupan las posiciones [i*k, (i+1)*k).
+        El promedio se acumula en el mismo orden que calculate_final_grade.
+
+        Args:
+            student_ids: Identificadores de los estudiantes (n)
+            grades: Notas en orden por filas (n * k)
+            weights: Pesos en orden por filas (n * k)
+            attendance: Máscara de asistencia mínima por estudiante (n)
+            evaluations_per_student: Ancho k de cada fila
+            evaluation_counts: Evaluaciones usadas por fila; si se omite se
+                               usan las k posiciones de cada fila
+
+        Returns:
+            GradeDetailSet con los componentes del cálculo en columnas
+
+        Raises:
+            ValueError: Si las dimensiones no coinciden o algún estudiante
+                        tiene datos inválidos
+        """
+        size = len(student_ids)
+        width = evaluations_per_student
+        self._validate_batch_shape(size, grades, weights, attendance, width, evaluation_counts)
+
+        penalty_grade = self._attendance_policy.penalty_grade
+        extra_points = self._extra_points_policy.granted_extra_points
+        min_grade, max_grade = Evaluation.MIN_GRADE, Evaluation.MAX_GRADE
+        min_weight, max_weight = Evaluation.MIN_WEIGHT, Evaluation.MAX_WEIGHT
+        min_final, max_final = self.MIN_FINAL_GRADE, self.MAX_FINAL_GRADE
+
+        weighted_averages = array("d", bytes(8 * size))
+        attendance_penalties = array("d", bytes(8 * size))
+        extra_points_column = array("d", [extra_points]) * size
+        final_grades = array("d", bytes(8 * size))
+
+        for row in range(size):
+            count = width if evaluation_counts is None else evaluation_counts[row]
+            if count == 0:
+                raise ValueError(
+                    f"Estudiante {student_ids[row]}: "
+                    "El estudiante debe tener al menos una evaluación"
+                )
+
+            # Paso 1: Promedio ponderado, con las mismas validaciones de Evaluation
+            start = row * width
+            total_weight = 0.0
+            weighted_average = 0.0
+            try:
+                for position in range(start, start + count):
+                    grade = grades[position]
+                    weight = weights[position]
+                    if grade < min_grade or grade > max_grade:
+                        raise ValueError(
+                            f"Estudiante {student_ids[row]}: "
+                            f"La nota debe estar entre {min_grade} y {max_grade}"
+                        )
+                    if weight < min_weight or weight > max_weight:
+                        raise ValueError(
+                            f"Estudiante {student_ids[row]}: "
+                            f"El peso debe estar entre {min_weight} y {max_weight}"
+                        )
+                    total_weight += weight
+                    weighted_average += grade * (weight / 100.0)
+            except TypeError:
+                field = "La nota" if isinstance(weight, (int, float)) else "El peso"
+                raise ValueError(
+                    f"Estudiante {student_ids[row]}: {field} debe ser un número"
+                ) from None
+
+            if abs(total_weight - self.MINIMUM_WEIGHT_SUM) > self.WEIGHT_SUM_TOLERANCE:
+                raise ValueError(
+                    f"Estudiante {student_ids[row]}: "
+                    f"Los pesos de las evaluaciones deben sumar {self.MINIMUM_WEIGHT_SUM}%, "
+                    f"pero suman {total_weight}%"
+                )
+
+            # Paso 2: Política de asistencia
+            if attendance[row]:
+                grade_after_attendance = weighted_average
+            else:
+                grade_after_attendance = penalty_grade
+                attendance_penalties[row] = penalty_grade - weighted_average
+
+            # Pasos 3 y 4: Puntos extra y rango válido [0, 20]
+            weighted_averages[row] = weighted_average
+            final_grades[row] = max(
+                min_final, min(grade_after_attendance + extra_points, max_final)
+            )
+
+        return GradeDetailSet(
+            student_ids=student_ids,
+            weighted_averages=weighted_averages,
+            attendance_penalties=attendance_penalties,
+            extra_points=extra_points_column,
+            final_grades=final_grades
+        )
+
+    def calculate_buffers(
+        self,
+        student_ids: Sequence[str],
+        grades: object,
+        weights: object,
+        attendance: object,
+        evaluations_per_student: int,
+        evaluation_counts: Optional[Sequence[int]] = None
+    ) -> GradeDetailSet:
+        """Calcula la nota final de una cohorte leyendo buffers sin copiarlos.
+
+        Acepta cualquier objeto con protocolo de buffer (array("d"), bytes,
+        bytearray, memoryview, mmap, shared_memory, arreglos de NumPy...).
+        Las notas y pesos deben ser flotantes de 64 bits contiguos en orden
+        por filas (n x k); también se aceptan bytes crudos y matrices de dos
+        dimensiones, que se reinterpretan como vectores planos. La máscara de
+        asistencia puede ser un buffer de un byte por estudiante o una
+        secuencia de bool. Los datos se leen en el lugar mediante memoryview,
+        con las mismas validaciones de rango que calculate_batch_flat.
+
+        Args:
+            student_ids: Identificadores de los estudiantes (n)
+            grades: Buffer de notas en orden por filas (n * k)
+            weights: Buffer de pesos en orden por filas (n * k)
+            attendance: Máscara de asistencia mínima por estudiante (n)
+            evaluations_per_student: Ancho k de cada fila
+            evaluation_counts: Evaluaciones usadas por fila; si se omite se
+                               usan las k posiciones de cada fila
+
+        Returns:
+            GradeDetailSet con los componentes del cálculo en columnas
+
+        Raises:
+            TypeError: Si notas o pesos no exponen el protocolo de buffer
+            ValueError: Si algún buffer no es contiguo o no contiene
+                        flotantes de 64 bits, si las dimensiones no
+                        coinciden o algún estudiante tiene datos inválidos
+        """
+        views = []
+        try:
+            grade_view = self._float64_view(grades, "notas", views)
+            weight_view = self._float64_view(weights, "pesos", views)
+            attendance_view = self._mask_view(attendance, views)
+            return self.calculate_batch_flat(
+                student_ids, grade_view, weight_view, attendance_view,
+                evaluations_per_student, evaluation_counts
+            )
+        finally:
+            # Libera las vistas para no retener el buffer del llamador
+            for view in reversed(views):
+                view.release()
+
+    @staticmethod
+    def _float64_view(buffer: object, name: str, views: list) -> memoryview:
+        """Obtiene una vista plana de flotantes de 64 bits sobre un buffer.
+
+        Raises:
+            ValueError: Si el buffer no es contiguo o no contiene float64
+        """
+        view = memoryview(buffer)
+        views.append(view)
+        if view.ndim == 1 and view.format == "d":
+            return view
+        if not view.c_contiguous:
+            raise ValueError(f"El buffer de {name} debe ser contiguo")
+        if view.format not in ("d", "B", "b", "c"):
+            raise ValueError(
+                f"El buffer de {name} debe contener flotantes de 64 bits, "
+                f"no el formato '{view.format}'"
+            )
+        if view.nbytes % 8:
+            raise ValueError(f"El tamaño del buffer de {name} no es múltiplo de 8 bytes")
+        raw = view.cast("B")
+        views.append(raw)
+        flat = raw.cast("d")
+        views.append(flat)
+        return flat
+
+    @staticmethod
+    def _mask_view(attendance: object, views: list) -> Sequence[bool]:
+        """Obtiene una vista de un byte por estudiante sobre la máscara de asistencia.
+
+        Las secuencias sin protocolo de buffer (por ejemplo, listas de bool)
+        se devuelven sin cambios.
+
+        Raises:
+            ValueError: Si el buffer no es contiguo o no tiene un byte por valor
+        """
+        try:
+            view = memoryview(attendance)
+        except TypeError:
+            return attendance
+        views.append(view)
+        if view.ndim == 1 and view.format in ("B", "?"):
+            return view
+        if not view.c_contiguous or view.itemsize != 1:
+            raise ValueError(
+                "El buffer de asistencia debe ser contiguo y tener un byte por estudiante"
+            )
+        flat = view.cast("B")
+        views.append(flat)
+        return flat
+
+    def _validate_batch_shape(
+        self,
+        size: int,
+        grades: Sequence[float],
+        weights: Sequence[float],
+        attendance: Sequence[bool],
+        width: int,
+        evaluation_counts: Optional[Sequence[int]]
+    ) -> None:
+        """Valida que las columnas de un lote tengan dimensiones coherentes.
+
+        Raises:
+            ValueError: Si alguna columna no coincide con n o n * k
+        """
+        if width < 0 or width > Student.MAX_EVALUATIONS:
+            raise ValueError(
+                f"No se pueden tener más de {Student.MAX_EVALUATIONS} evaluaciones"
+            )
+        if len(grades) != size * width or len(weights) != size * width:
+            raise ValueError("Las columnas de notas y pesos deben tener n * k elementos")
+        if len(attendance) != size:
+            raise ValueError("La máscara de asistencia debe tener un valor por estudiante")
+        if evaluation_counts is not None:
+            if len(evaluation_counts) != size:
+                raise ValueError("Debe indicarse una cantidad de evaluaciones por estudiante")
+            if any(count < 0 or count > width for count in evaluation_counts):
+                raise ValueError(
+                    f"La cantidad de evaluaciones por estudiante debe estar entre 0 y {width}"
+                )
+
+    def _accumulate_evaluations(self, student: Student) -> float:
+        """Valida las evaluaciones y calcula el promedio ponderado.
+
+        Recorre una sola vez la vista de solo lectura de las evaluaciones,
+        acumulando a la vez la suma de pesos y la suma ponderada. Es la
+        suma secuencial de referencia del cálculo determinista (RNF03).
 
         Args:
             student: Estudiante a validar
 
+        Returns:
+            Promedio ponderado
+
         Raises:
-            ValueError: Si los datos son inválidos
+            ValueError: Si no hay evaluaciones o los pesos no suman 100%
         """
-        if not student.evaluations:
+        if student.evaluation_count == 0:
             raise ValueError("El estudiante debe tener al menos una evaluación")
 
-        total_weight = sum(evaluation.weight for evaluation in student.evaluations)
+        total_weight = 0.0
+        total_weighted_sum = 0.0
+        for evaluation in student.iter_evaluations():
+            weight = evaluation.weight
+            total_weight += weight
+            total_weighted_sum += evaluation.grade * (weight / 100.0)
 
-        if abs(total_weight - self.MINIMUM_WEIGHT_SUM) > 0.01:
+        self._validate_weight_total(total_weight)
+
+        return total_weighted_sum
+
+    def _validate_weight_total(self, total_weight: float) -> None:
+        """Valida que la suma de pesos sea 100% (con tolerancia WEIGHT_SUM_TOLERANCE).
+
+        Args:
+            total_weight: Suma de pesos de las evaluaciones
+
+        Raises:
+            ValueError: Si los pesos no suman 100%
+        """
+        if abs(total_weight - self.MINIMUM_WEIGHT_SUM) > self.WEIGHT_SUM_TOLERANCE:
             raise ValueError(
                 f"Los pesos de las evaluaciones deben sumar {self.MINIMUM_WEIGHT_SUM}%, "
                 f"pero suman {total_weight}%"
             )
 
+    def _build_grade_detail(
+        self,
+        weighted_average: float,
+        has_reached_minimum_classes: bool
+    ) -> GradeDetail:
+        """Aplica las políticas y el rango válido a un promedio ponderado.
+
+        Args:
+            weighted_average: Promedio ponderado ya validado
+            has_reached_minimum_classes: Si cumplió la asistencia mínima (RF02)
+
+        Returns:
+            GradeDetail con el detalle completo del cálculo
+        """
+        # Paso 2: Aplicar política de asistencia
+        grade_after_attendance, attendance_penalty = self._apply_attendance_policy(
+            weighted_average, has_reached_minimum_classes
+        )
+
+        # Paso 3: Aplicar puntos extra (valor precalculado por la política)
+        extra_points, grade_with_extra = self._apply_extra_points(grade_after_attendance)
+
+        # Paso 4: Asegurar rango válido [0, 20]
+        final_grade = self._clamp_grade(grade_with_extra)
+
+        return GradeDetail(
+            weighted_average=weighted_average,
+            attendance_penalty=attendance_penalty,
+            extra_points=extra_points,
+            final_grade=final_grade
+        )
+
+    def _apply_attendance_policy(
+        self,
+        weighted_average: float,
+        has_reached_minimum_classes: bool
+    ) -> Tuple[float, float]:
+        """Aplica la política de asistencia (RF02).
+
+        Returns:
+            Tupla (nota después de asistencia, monto de la penalización)
+        """
+        return (
+            self._attendance_policy.apply_penalty(
+                has_reached_minimum_classes, weighted_average
+            ),
+            self._attendance_policy.calculate_penalty_amount(
+                has_reached_minimum_classes, weighted_average
+            ),
+        )
+
+    def _apply_extra_points(self, grade: float) -> Tuple[float, float]:
+        """Suma los puntos extra otorgados por la política (RF03).
+
+        Returns:
+            Tupla (puntos extra aplicados, nota con puntos extra)
+        """
+        extra_points = self._extra_points_policy.granted_extra_points
+        return extra_points, grade + extra_points
+
+    def _build_grade_detail_set(
+        self,
+        student_ids: Sequence[str],
+        weighted_averages: array,
+        attendance: Sequence[bool]
+    ) -> GradeDetailSet:
+        """Aplica las políticas y el rango válido a una columna de promedios.
+
+        Args:
+            student_ids: Identificadores de los estudiantes (n)
+            weighted_averages: Promedios ponderados ya validados (n)
+            attendance: Máscara de asistencia mínima por estudiante (n)
+
+        Returns:
+            GradeDetailSet con los componentes del cálculo en columnas
+        """
+        size = len(weighted_averages)
+        penalty_grade = self._attendance_policy.penalty_grade
+        extra_points = self._extra_points_policy.granted_extra_points
+        min_final, max_final = self.MIN_FINAL_GRADE, self.MAX_FINAL_GRADE
+
+        attendance_penalties = array("d", bytes(8 * size))
+        final_grades = array("d", bytes(8 * size))
+        for row in range(size):
+            weighted_average = weighted_averages[row]
+            if attendance[row]:
+                grade_after_attendance = weighted_average
+            else:
+                grade_after_attendance = penalty_grade
+                attendance_penalties[row] = penalty_grade - weighted_average
+            final_grades[row] = max(
+                min_final, min(grade_after_attendance + extra_points, max_final)
+            )
+
+        return GradeDetailSet(
+            student_ids=student_ids,
+            weighted_averages=weighted_averages,
+            attendance_penalties=attendance_penalties,
+            extra_points=array("d", [extra_points]) * size,
+            final_grades=final_grades
+        )
+
+    @staticmethod
+    def _validate_scheme_grade(grade: float) -> None:
+        """Valida una nota de un esquema fijo igual que Evaluation.
+
+        Raises:
+            ValueError: Si la nota no es un número o está fuera de rango
+        """
+        if not isinstance(grade, (int, float)):
+            raise ValueError("La nota debe ser un número")
+        if grade < Evaluation.MIN_GRADE or grade > Evaluation.MAX_GRADE:
+            raise ValueError(
+                f"La nota debe estar entre {Evaluation.MIN_GRADE} y {Evaluation.MAX_GRADE}"
+            )
+
     def _clamp_grade(self, grade: float) -> float:
         """Asegura que la nota esté en el rango válido [0, 20].
 
@@ -0,0 +1,95 @@
+"""Pipeline en streaming de carga, cálculo y exportación de notas."""
+
+from pathlib import Path
+from typing import Optional, Union
+from ..streaming.grade_reader import GradeReader
+from ..streaming.result_writer import RejectWriter, ResultWriter
+from .grade_calculator import GradeCalculator
+
+
+class PipelineSummary:
+    """Resumen de una ejecución del pipeline de notas."""
+
+    def __init__(self, students_graded: int, rows_rejected: int):
+        """Inicializa el resumen.
+
+        Args:
+            students_graded: Estudiantes calculados y exportados
+            rows_rejected: Filas o estudiantes enviados al archivo de rechazos
+        """
+        self._students_graded = students_graded
+        self._rows_rejected = rows_rejected
+
+    @property
+    def students_graded(self) -> int:
+        """Obtiene la cantidad de estudiantes calculados."""
+        return self._students_graded
+
+    @property
+    def rows_rejected(self) -> int:
+        """Obtiene la cantidad de rechazos registrados."""
+        return self._rows_rejected
+
+    def __repr__(self) -> str:
+        """Representación string del resumen."""
+        return (
+            f"PipelineSummary(graded={self._students_graded}, "
+            f"rejected={self._rows_rejected})"
+        )
+
+
+class GradePipeline:
+    """Calcula en streaming las notas finales de una exportación de registros.
+
+    Lee las filas de forma perezosa, agrupa cada estudiante, calcula su nota
+    con GradeCalculator (RF04) y escribe el detalle (RF05) inmediatamente, de
+    modo que el uso de memoria no depende del tamaño del archivo. Las filas o
+    estudiantes inválidos se registran en el archivo de rechazos con el
+    mensaje del ValueError en lugar de abortar la ejecución.
+    """
+
+    def __init__(self, calculator: GradeCalculator):
+        """Inicializa el pipeline.
+
+        Args:
+            calculator: Calculador de notas a utilizar
+        """
+        self._calculator = calculator
+
+    def run(
+        self,
+        input_path: Union[str, Path],
+        output_path: Union[str, Path],
+        reject_path: Union[str, Path],
+        input_format: Optional[str] = None,
+        output_format: Optional[str] = None
+    ) -> PipelineSummary:
+        """Ejecuta el pipeline completo.
+
+        Args:
+            input_path: Archivo CSV o JSONL de notas
+            output_path: Archivo CSV o JSONL de resultados
+            reject_path: Archivo CSV de filas rechazadas
+            input_format: Formato de entrada; por defecto según la extensión
+            output_format: Formato de salida; por defecto según la extensión
+
+        Returns:
+            Resumen con la cantidad de estudiantes calculados y rechazos
+        """
+        reader = GradeReader(input_path, input_format)
+
+        with ResultWriter(output_path, output_format) as results, \
+                RejectWriter(reject_path) as rejects:
+            for line_number, student in reader.iter_students(rejects.write):
+                try:
+                    grade_detail = self._calculator.calculate_final_grade(student)
+                except ValueError as error:
+                    rejects.write(line_number, student.student_id, str(error))
+                    continue
+                results.write(student.student_id, grade_detail)
+
+            return PipelineSummary(results.rows_written, rejects.rows_written)
+
+    def __repr__(self) -> str:
+        """Representación string del pipeline."""
+        return f"GradePipeline(calculator={self._calculator})"
@@ -0,0 +1,228 @@
+"""Registro de notas en memoria indexado por estudiante y por sección."""
+
+from array import array
+from typing import Dict, Iterable, Iterator, List, Tuple
+from ..models.evaluation import Evaluation
+from ..models.grade_detail import GradeDetail
+from ..models.grade_detail_set import GradeDetailSet
+from ..models.student import Student
+from .grade_calculator import GradeCalculator
+
+# Ancho fijo de cada fila: permite agregar evaluaciones sin mover otras filas
+_ROW_WIDTH = Student.MAX_EVALUATIONS
+_EMPTY_ROW = array("d", bytes(8 * _ROW_WIDTH))
+
+
+class _SectionColumns:
+    """Columnas contiguas de los estudiantes de una sección.
+
+    Las notas y pesos se guardan en orden por filas con ancho fijo
+    MAX_EVALUATIONS, el formato que espera GradeCalculator.calculate_batch_flat.
+    """
+
+    __slots__ = ("name", "student_ids", "grades", "weights", "counts", "attendance")
+
+    def __init__(self, name: str):
+        """Inicializa una sección vacía."""
+        self.name = name
+        self.student_ids: List[str] = []
+        self.grades = array("d")
+        self.weights = array("d")
+        self.counts = bytearray()
+        self.attendance = bytearray()
+
+    def append(self, student: Student) -> int:
+        """Agrega un estudiante al final de la sección y devuelve su fila."""
+        row = len(self.student_ids)
+        self.student_ids.append(student.student_id)
+        self.grades.extend(_EMPTY_ROW)
+        self.weights.extend(_EMPTY_ROW)
+        self.counts.append(0)
+        self.attendance.append(student.has_reached_minimum_classes)
+        for evaluation in student.iter_evaluations():
+            self.store(row, evaluation)
+        return row
+
+    def store(self, row: int, evaluation: Evaluation) -> None:
+        """Escribe una evaluación en la siguiente posición libre de la fila."""
+        position = row * _ROW_WIDTH + self.counts[row]
+        self.grades[position] = evaluation.grade
+        self.weights[position] = evaluation.weight
+        self.counts[row] += 1
+
+
+class Gradebook:
+    """Dueño de los estudiantes de una o varias secciones.
+
+    Indexa cada estudiante por su ID y por su sección, de modo que buscarlo
+    o actualizarlo es O(1) en lugar de recorrer una lista. Las evaluaciones
+    de cada sección se guardan en arreglos contiguos, por lo que calcular una
+    sección completa usa directamente GradeCalculator.calculate_batch_flat.
+    """
+
+    def __init__(self):
+        """Inicializa un registro vacío."""
+        self._sections: Dict[str, _SectionColumns] = {}
+        self._index: Dict[str, Tuple[_SectionColumns, int]] = {}
+
+    @property
+    def sections(self) -> List[str]:
+        """Obtiene los identificadores de las secciones en orden de registro."""
+        return list(self._sections)
+
+    def add_student(self, student: Student, section: str) -> None:
+        """Registra un estudiante en una sección copiando sus evaluaciones.
+
+        Args:
+            student: Estudiante a registrar
+            section: Identificador de la sección
+
+        Raises:
+            ValueError: Si el estudiante ya está registrado
+        """
+        if student.student_id in self._index:
+            raise ValueError(f"El estudiante {student.student_id} ya está registrado")
+        columns = self._sections.get(section)
+        if columns is None:
+            columns = self._sections[section] = _SectionColumns(section)
+        self._index[student.student_id] = (columns, columns.append(student))
+
+    def add_students(self, students: Iterable[Student], section: str) -> None:
+        """Registra varios estudiantes en una sección.
+
+        Raises:
+            ValueError: Si algún estudiante ya está registrado
+        """
+        for student in students:
+            self.add_student(student, section)
+
+    def get(self, student_id: str) -> Student:
+        """Obtiene una copia del estudiante con sus evaluaciones.
+
+        Las modificaciones sobre la copia no afectan al registro; para
+        actualizarlo se usan register_evaluation y register_attendance.
+
+        Raises:
+            ValueError: Si el estudiante no está registrado
+        """
+        columns, row = self._locate(student_id)
+        start = row * _ROW_WIDTH
+        return Student(
+            student_id,
+            [
+                Evaluation(columns.grades[position], columns.weights[position])
+                for position in range(start, start + columns.counts[row])
+            ],
+            bool(columns.attendance[row])
+        )
+
+    def section_of(self, student_id: str) -> str:
+        """Obtiene la sección de un estudiante.
+
+        Raises:
+            ValueError: Si el estudiante no está registrado
+        """
+        columns, _ = self._locate(student_id)
+        return columns.name
+
+    def section_student_ids(self, section: str) -> List[str]:
+        """Obtiene los IDs de una sección en orden de registro.
+
+        Raises:
+            ValueError: Si la sección no existe
+        """
+        return list(self._section(section).student_ids)
+
+    def register_evaluation(self, student_id: str, grade: float, weight: float) -> None:
+        """Registra en el lugar una nueva evaluación del estudiante (RF01).
+
+        Raises:
+            ValueError: Si el estudiante no existe, la evaluación es inválida
+                        o se excede el límite de evaluaciones (RNF01)
+        """
+        columns, row = self._locate(student_id)
+        evaluation = Evaluation(grade, weight)
+        if columns.counts[row] >= Student.MAX_EVALUATIONS:
+            raise ValueError(
+                f"No se pueden agregar más de {Student.MAX_EVALUATIONS} evaluaciones"
+            )
+        columns.store(row, evaluation)
+
+    def register_attendance(self, student_id: str, has_reached_minimum: bool) -> None:
+        """Registra en el lugar el estado de asistencia del estudiante (RF02).
+
+        Raises:
+            ValueError: Si el estudiante no está registrado
+        """
+        columns, row = self._locate(student_id)
+        columns.attendance[row] = bool(has_reached_minimum)
+
+    def grade_student(self, student_id: str, calculator: GradeCalculator) -> GradeDetail:
+        """Calcula la nota final de un estudiante (RF04).
+
+        Raises:
+            ValueError: Si el estudiante no existe o tiene datos inválidos
+        """
+        return calculator.calculate_final_grade(self.get(student_id))
+
+    def grade_section(self, section: str, calculator: GradeCalculator) -> GradeDetailSet:
+        """Calcula la nota final de todos los estudiantes de una sección (RF04).
+
+        Los arreglos de notas y pesos se pasan sin copiar a
+        calculate_batch_flat.
+
+        Args:
+            section: Identificador de la sección
+            calculator: Calculador con las políticas a aplicar
+
+        Returns:
+            GradeDetailSet en el orden de section_student_ids
+
+        Raises:
+            ValueError: Si la sección no existe o algún estudiante tiene
+                        datos inválidos
+        """
+        columns = self._section(section)
+        return calculator.calculate_batch_flat(
+            # Copia de los IDs: el resultado no debe cambiar si la sección crece
+            list(columns.student_ids), columns.grades, columns.weights,
+            columns.attendance, _ROW_WIDTH, columns.counts
+        )
+
+    def _locate(self, student_id: str) -> Tuple[_SectionColumns, int]:
+        """Obtiene las columnas y la fila de un estudiante.
+
+        Raises:
+            ValueError: Si el estudiante no está registrado
+        """
+        location = self._index.get(student_id)
+        if location is None:
+            raise ValueError(f"Estudiante desconocido: '{student_id}'")
+        return location
+
+    def _section(self, section: str) -> _SectionColumns:
+        """Obtiene las columnas de una sección.
+
+        Raises:
+            ValueError: Si la sección no existe
+        """
+        columns = self._sections.get(section)
+        if columns is None:
+            raise ValueError(f"Sección desconocida: '{section}'")
+        return columns
+
+    def __contains__(self, student_id: object) -> bool:
+        """Indica si un estudiante está registrado."""
+        return student_id in self._index
+
+    def __len__(self) -> int:
+        """Obtiene la cantidad total de estudiantes."""
+        return len(self._index)
+
+    def __iter__(self) -> Iterator[str]:
+        """Itera sobre los IDs de todos los estudiantes."""
+        return iter(self._index)
+
+    def __repr__(self) -> str:
+        """Representación string del registro."""
+        return f"Gradebook(students={len(self._index)}, sections={len(self._sections)})"
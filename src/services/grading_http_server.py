@@ -0,0 +1,184 @@
+"""Servidor HTTP local (solo biblioteca estándar) sobre AsyncGradingService."""
+
+import asyncio
+import json
+from http import HTTPStatus
+from typing import Optional, Tuple
+from ..models.evaluation import Evaluation
+from ..models.student import Student
+from .async_grading_service import AsyncGradingService
+
+
+class GradingHttpServer:
+    """Servidor HTTP/1.1 mínimo para consultar notas desde el portal.
+
+    Atiende POST /grades con un cuerpo JSON:
+        {"student_id": "...", "has_reached_minimum_classes": true,
+         "evaluations": [{"grade": 15.0, "weight": 50.0}, ...]}
+    y responde el detalle del cálculo (RF05) en JSON. Cada solicitud se
+    delega a AsyncGradingService, que agrupa las consultas concurrentes.
+    """
+
+    GRADES_PATH = "/grades"
+    MAX_BODY_BYTES = 64 * 1024
+    MAX_HEADER_LINES = 100
+
+    def __init__(self, service: AsyncGradingService, host: str = "127.0.0.1", port: int = 8080):
+        """Inicializa el servidor.
+
+        Args:
+            service: Servicio asíncrono de cálculo
+            host: Dirección donde escuchar
+            port: Puerto donde escuchar; 0 elige uno libre
+        """
+        self._service = service
+        self._host = host
+        self._port = port
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @property
+    def port(self) -> int:
+        """Obtiene el puerto efectivo en el que escucha el servidor."""
+        if self._server is not None:
+            return self._server.sockets[0].getsockname()[1]
+        return self._port
+
+    async def start(self) -> None:
+        """Inicia el servicio de cálculo y comienza a escuchar conexiones."""
+        await self._service.start()
+        self._server = await asyncio.start_server(self._handle_connection, self._host, self._port)
+
+    async def stop(self) -> None:
+        """Deja de aceptar conexiones y detiene el servicio de cálculo."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        await self._service.stop()
+
+    async def serve_forever(self) -> None:
+        """Atiende solicitudes hasta que la tarea sea cancelada."""
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def _handle_connection(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter
+    ) -> None:
+        """Lee una solicitud, la atiende y cierra la conexión."""
+        try:
+            try:
+                status, payload = await self._handle_request(reader)
+            except (asyncio.IncompleteReadError, ConnectionError):
+                return
+            except Exception:
+                status = HTTPStatus.INTERNAL_SERVER_ERROR
+                payload = {"error": "Error interno del servidor"}
+
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            writer.write(
+                f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                "Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n".encode("ascii") + body
+            )
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _handle_request(self, reader: asyncio.StreamReader) -> Tuple[HTTPStatus, dict]:
+        """Interpreta la solicitud HTTP y calcula la nota si corresponde."""
+        try:
+            request_line, headers = await self._read_head(reader)
+        except ValueError:
+            return (
+                HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE,
+                {"error": "Encabezado de la solicitud demasiado grande"}
+            )
+
+        if len(request_line) != 3:
+            return HTTPStatus.BAD_REQUEST, {"error": "Solicitud HTTP inválida"}
+        method, path, _ = request_line
+        if path != self.GRADES_PATH:
+            return HTTPStatus.NOT_FOUND, {"error": f"Ruta no encontrada: {path}"}
+        if method != "POST":
+            return HTTPStatus.METHOD_NOT_ALLOWED, {"error": "Solo se admite POST"}
+
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            return HTTPStatus.BAD_REQUEST, {"error": "Content-Length inválido"}
+        if length < 0:
+            return HTTPStatus.BAD_REQUEST, {"error": "Content-Length inválido"}
+        if length > self.MAX_BODY_BYTES:
+            return HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "Cuerpo demasiado grande"}
+
+        try:
+            student = student_from_payload(json.loads(await reader.readexactly(length)))
+            grade_detail = await self._service.calculate_final_grade(student)
+        except ValueError as error:
+            return HTTPStatus.BAD_REQUEST, {"error": str(error)}
+
+        response = {"student_id": student.student_id}
+        response.update(grade_detail.to_dict())
+        return HTTPStatus.OK, response
+
+    async def _read_head(self, reader: asyncio.StreamReader) -> Tuple[list, dict]:
+        """Lee la línea de solicitud y las cabeceras.
+
+        Raises:
+            ValueError: Si una línea supera el límite del lector o hay más
+                        de MAX_HEADER_LINES cabeceras
+        """
+        request_line = (await reader.readline()).decode("latin-1").split()
+        headers = {}
+        for _ in range(self.MAX_HEADER_LINES + 1):
+            line = (await reader.readline()).decode("latin-1").strip()
+            if not line:
+                return request_line, headers
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        raise ValueError(f"La solicitud tiene más de {self.MAX_HEADER_LINES} cabeceras")
+
+    def __repr__(self) -> str:
+        """Representación string del servidor."""
+        return f"GradingHttpServer(host={self._host}, port={self.port})"
+
+
+def student_from_payload(payload: object) -> Student:
+    """Construye un Student a partir del cuerpo JSON de una solicitud.
+
+    Args:
+        payload: Diccionario con student_id, evaluations y
+                 has_reached_minimum_classes
+
+    Returns:
+        Estudiante con sus evaluaciones validadas
+
+    Raises:
+        ValueError: Si el cuerpo no tiene la forma esperada o los datos son inválidos
+    """
+    if not isinstance(payload, dict):
+        raise ValueError("El cuerpo debe ser un objeto JSON")
+    evaluations = payload.get("evaluations")
+    if not isinstance(evaluations, list):
+        raise ValueError("evaluations debe ser una lista")
+    if not all(isinstance(item, dict) for item in evaluations):
+        raise ValueError("Cada evaluación debe ser un objeto con grade y weight")
+
+    attendance = payload.get("has_reached_minimum_classes", False)
+    if not isinstance(attendance, bool):
+        raise ValueError("has_reached_minimum_classes debe ser booleano")
+
+    return Student(
+        student_id=payload.get("student_id"),
+        evaluations=[
+            Evaluation(item.get("grade"), item.get("weight"))
+            for item in evaluations
+        ],
+        has_reached_minimum_classes=attendance
+    )
@@ -0,0 +1,126 @@
+"""Recálculo incremental de notas basado en el seguimiento de cambios."""
+
+from typing import Dict, Iterable, Optional
+from ..models.grade_detail import GradeDetail
+from ..models.student import Student
+from .grade_calculator import GradeCalculator
+
+
+class RegradeSummary:
+    """Resumen de una ejecución de IncrementalRegrader.regrade."""
+
+    def __init__(self, recomputed: int, skipped: int, policies_changed: bool):
+        """Inicializa el resumen.
+
+        Args:
+            recomputed: Estudiantes cuya nota se volvió a calcular
+            skipped: Estudiantes cuyo GradeDetail guardado se reutilizó
+            policies_changed: Si las políticas cambiaron desde el recálculo anterior
+        """
+        self._recomputed = recomputed
+        self._skipped = skipped
+        self._policies_changed = policies_changed
+
+    @property
+    def recomputed(self) -> int:
+        """Obtiene la cantidad de estudiantes recalculados."""
+        return self._recomputed
+
+    @property
+    def skipped(self) -> int:
+        """Obtiene la cantidad de estudiantes omitidos."""
+        return self._skipped
+
+    @property
+    def policies_changed(self) -> bool:
+        """Obtiene si un cambio de políticas obligó a recalcular a todos."""
+        return self._policies_changed
+
+    def __repr__(self) -> str:
+        """Representación string del resumen."""
+        return (
+            f"RegradeSummary(recomputed={self._recomputed}, "
+            f"skipped={self._skipped}, policies_changed={self._policies_changed})"
+        )
+
+
+class IncrementalRegrader:
+    """Recalcula solo los estudiantes cuyos datos o políticas cambiaron.
+
+    Un estudiante queda marcado como modificado al crearse y con cada
+    add_evaluation o set_attendance_status que cambie su estado. Las
+    políticas se comparan por su huella (policy_fingerprint): un cambio de
+    penalty_grade o de un voto docente que altere los puntos otorgados
+    invalida todos los resultados. El resto de los estudiantes reutiliza el
+    GradeDetail guardado en el recálculo anterior.
+
+    El indicador de cambios pertenece al estudiante, por lo que cada
+    estudiante debe recalcularse con un único IncrementalRegrader.
+    """
+
+    def __init__(self, calculator: GradeCalculator):
+        """Inicializa el recalculador.
+
+        Args:
+            calculator: Calculador con las políticas vigentes
+        """
+        self._calculator = calculator
+        self._results: Dict[str, GradeDetail] = {}
+        self._policy_fingerprint: Optional[str] = None
+
+    def regrade(self, students: Iterable[Student]) -> RegradeSummary:
+        """Recalcula los estudiantes modificados y reutiliza el resto.
+
+        Args:
+            students: Estudiantes a mantener al día
+
+        Returns:
+            Resumen con recalculados, omitidos y si cambiaron las políticas
+
+        Raises:
+            ValueError: Si algún estudiante modificado tiene datos inválidos;
+                        los calculados antes del error quedan guardados
+        """
+        fingerprint = self._calculator.policy_fingerprint
+        policies_changed = (
+            self._policy_fingerprint is not None and fingerprint != self._policy_fingerprint
+        )
+        if fingerprint != self._policy_fingerprint:
+            self._results.clear()
+            self._policy_fingerprint = fingerprint
+
+        calculate = self._calculator.calculate_final_grade
+        results = self._results
+        recomputed = skipped = 0
+        for student in students:
+            student_id = student.student_id
+            if not student.is_dirty and student_id in results:
+                skipped += 1
+                continue
+            try:
+                results[student_id] = calculate(student)
+            except ValueError as error:
+                raise ValueError(f"Estudiante {student_id}: {error}") from error
+            student.mark_clean()
+            recomputed += 1
+
+        return RegradeSummary(recomputed, skipped, policies_changed)
+
+    def grade_detail(self, student_id: str) -> GradeDetail:
+        """Obtiene el último GradeDetail calculado de un estudiante.
+
+        Raises:
+            ValueError: Si el estudiante no fue calculado
+        """
+        grade_detail = self._results.get(student_id)
+        if grade_detail is None:
+            raise ValueError(f"Estudiante desconocido: '{student_id}'")
+        return grade_detail
+
+    def __len__(self) -> int:
+        """Obtiene la cantidad de resultados guardados."""
+        return len(self._results)
+
+    def __repr__(self) -> str:
+        """Representación string del recalculador."""
+        return f"IncrementalRegrader(results={len(self._results)})"
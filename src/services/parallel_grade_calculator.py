@@ -0,0 +1,159 @@
+"""Cálculo paralelo de notas en procesos - RNF02 y RNF03."""
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+from ..models.grade_detail import GradeDetail
+from ..models.student import Student
+from ..policies.attendance_policy import AttendancePolicy
+from ..policies.extra_points_policy import ExtraPointsPolicy
+from .grade_calculator import GradeCalculator
+
+_worker_calculator: Optional[GradeCalculator] = None
+
+
+def _initialize_worker(
+    attendance_policy: AttendancePolicy,
+    extra_points_policy: ExtraPointsPolicy
+) -> None:
+    """Crea el calculador del proceso trabajador una sola vez."""
+    global _worker_calculator
+    _worker_calculator = GradeCalculator(attendance_policy, extra_points_policy)
+
+
+def _grade_chunk(students: List[Student]) -> List[Tuple[float, float, float, float]]:
+    """Calcula las notas de un bloque de estudiantes en el trabajador.
+
+    Devuelve tuplas de flotantes en lugar de GradeDetail para abaratar la
+    serialización de vuelta al proceso principal.
+    """
+    calculate = _worker_calculator.calculate_final_grade
+    results = []
+    for student in students:
+        detail = calculate(student)
+        results.append((
+            detail.weighted_average,
+            detail.attendance_penalty,
+            detail.extra_points,
+            detail.final_grade,
+        ))
+    return results
+
+
+class ParallelGradeCalculator:
+    """Calcula las notas de poblaciones grandes repartidas en varios procesos.
+
+    Divide los estudiantes en bloques de tamaño fijo y los procesa con un
+    ProcessPoolExecutor. Las políticas se envían a cada trabajador una sola
+    vez al iniciarlo, y los resultados se devuelven en el orden original.
+
+    Puede usarse como context manager para reutilizar el mismo grupo de
+    procesos entre varias llamadas.
+    """
+
+    DEFAULT_CHUNK_SIZE = 1000
+
+    def __init__(
+        self,
+        attendance_policy: AttendancePolicy,
+        extra_points_policy: ExtraPointsPolicy,
+        max_workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ):
+        """Inicializa el calculador paralelo.
+
+        Args:
+            attendance_policy: Política de asistencia a aplicar
+            extra_points_policy: Política de puntos extra a aplicar
+            max_workers: Cantidad de procesos; por defecto la cantidad de CPUs
+            chunk_size: Estudiantes por bloque enviado a un trabajador
+
+        Raises:
+            ValueError: Si max_workers o chunk_size no son positivos
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("La cantidad de procesos debe ser mayor que cero")
+        if chunk_size < 1:
+            raise ValueError("El tamaño de bloque debe ser mayor que cero")
+
+        self._attendance_policy = attendance_policy
+        self._extra_points_policy = extra_points_policy
+        self._max_workers = max_workers
+        self._chunk_size = chunk_size
+        self._executor: Optional[Executor] = None
+
+    @property
+    def max_workers(self) -> Optional[int]:
+        """Obtiene la cantidad de procesos configurada."""
+        return self._max_workers
+
+    @property
+    def chunk_size(self) -> int:
+        """Obtiene el tamaño de bloque configurado."""
+        return self._chunk_size
+
+    def open(self) -> "ParallelGradeCalculator":
+        """Inicia el grupo de procesos trabajadores."""
+        if self._executor is None:
+            self._executor = self._create_executor()
+        return self
+
+    def close(self) -> None:
+        """Detiene el grupo de procesos trabajadores."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def calculate_final_grades(self, students: Sequence[Student]) -> List[GradeDetail]:
+        """Calcula la nota final de cada estudiante en paralelo (RF04).
+
+        Args:
+            students: Estudiantes a calcular
+
+        Returns:
+            Lista de GradeDetail en el mismo orden que students
+
+        Raises:
+            ValueError: Si algún estudiante tiene datos inválidos
+        """
+        if not students:
+            return []
+
+        chunks = [
+            list(students[start:start + self._chunk_size])
+            for start in range(0, len(students), self._chunk_size)
+        ]
+
+        if self._executor is not None:
+            return self._collect(self._executor, chunks)
+        with self._create_executor() as executor:
+            return self._collect(executor, chunks)
+
+    def _collect(self, executor: Executor, chunks: List[List[Student]]) -> List[GradeDetail]:
+        """Distribuye los bloques y concatena los resultados en orden."""
+        results: List[GradeDetail] = []
+        for chunk_results in executor.map(_grade_chunk, chunks):
+            results.extend(GradeDetail(*row) for row in chunk_results)
+        return results
+
+    def _create_executor(self) -> Executor:
+        """Crea el grupo de procesos con las políticas ya cargadas."""
+        return ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            initializer=_initialize_worker,
+            initargs=(self._attendance_policy, self._extra_points_policy)
+        )
+
+    def __enter__(self) -> "ParallelGradeCalculator":
+        """Inicia los trabajadores al entrar al bloque with."""
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Detiene los trabajadores al salir del bloque with."""
+        self.close()
+
+    def __repr__(self) -> str:
+        """Representación string del calculador paralelo."""
+        return (
+            f"ParallelGradeCalculator(workers={self._max_workers}, "
+            f"chunk_size={self._chunk_size})"
+        )
@@ -0,0 +1,385 @@
+"""Simulación de escenarios con variantes de las políticas de notas."""
+
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
+from ..models.student import Student
+from ..policies.attendance_policy import AttendancePolicy
+from ..policies.extra_points_policy import ExtraPointsPolicy
+from .grade_calculator import GradeCalculator
+
+
+class Scenario:
+    """Combinación con nombre de una política de asistencia y una de puntos extra."""
+
+    def __init__(
+        self,
+        name: str,
+        attendance_policy: AttendancePolicy,
+        extra_points_policy: ExtraPointsPolicy
+    ):
+        """Inicializa el escenario.
+
+        Args:
+            name: Nombre único del escenario
+            attendance_policy: Política de asistencia del escenario
+            extra_points_policy: Política de puntos extra del escenario
+
+        Raises:
+            ValueError: Si el nombre está vacío
+        """
+        if not name:
+            raise ValueError("El nombre del escenario no puede estar vacío")
+        self._name = name
+        self._attendance_policy = attendance_policy
+        self._extra_points_policy = extra_points_policy
+
+    @property
+    def name(self) -> str:
+        """Obtiene el nombre del escenario."""
+        return self._name
+
+    @property
+    def attendance_policy(self) -> AttendancePolicy:
+        """Obtiene la política de asistencia."""
+        return self._attendance_policy
+
+    @property
+    def extra_points_policy(self) -> ExtraPointsPolicy:
+        """Obtiene la política de puntos extra."""
+        return self._extra_points_policy
+
+    @property
+    def parameters(self) -> Tuple[float, float]:
+        """Obtiene (nota de penalización, puntos extra otorgados).
+
+        Son los únicos valores de las políticas que afectan el cálculo, por
+        lo que dos escenarios con los mismos parámetros dan las mismas notas.
+        """
+        return (
+            self._attendance_policy.penalty_grade,
+            self._extra_points_policy.granted_extra_points,
+        )
+
+    def __repr__(self) -> str:
+        """Representación string del escenario."""
+        penalty_grade, extra_points = self.parameters
+        return (
+            f"Scenario(name={self._name}, penalty_grade={penalty_grade}, "
+            f"extra_points={extra_points})"
+        )
+
+
+def teacher_vote_scenarios(
+    attendance_policy: AttendancePolicy,
+    extra_points_policy: ExtraPointsPolicy
+) -> List[Scenario]:
+    """Crea un escenario por docente con su voto invertido.
+
+    Args:
+        attendance_policy: Política de asistencia común a los escenarios
+        extra_points_policy: Política cuyos votos se varían
+
+    Returns:
+        Escenarios "docente_<i>" en el orden de all_years_teachers
+    """
+    scenarios = []
+    votes = extra_points_policy.all_years_teachers
+    for index, agrees in enumerate(votes):
+        changed_votes = list(votes)
+        changed_votes[index] = not agrees
+        scenarios.append(Scenario(
+            f"docente_{index}",
+            attendance_policy,
+            ExtraPointsPolicy(changed_votes, extra_points_policy.extra_points_amount)
+        ))
+    return scenarios
+
+
+class ScenarioResult:
+    """Matriz estudiantes x escenarios de notas finales con agregados."""
+
+    def __init__(
+        self,
+        student_ids: Sequence[str],
+        scenario_names: Sequence[str],
+        final_grade_columns: Sequence[array],
+        passing_counts: Sequence[int],
+        passing_grade: float,
+        baseline_name: str
+    ):
+        """Inicializa el resultado.
+
+        Args:
+            student_ids: Identificadores de los estudiantes (n)
+            scenario_names: Nombres de los escenarios (m)
+            final_grade_columns: Una columna de n notas finales por escenario
+            passing_counts: Aprobados por escenario
+            passing_grade: Nota mínima aprobatoria usada
+            baseline_name: Escenario de referencia para las diferencias
+        """
+        self._student_ids = student_ids
+        self._scenario_names = list(scenario_names)
+        self._positions = {name: index for index, name in enumerate(self._scenario_names)}
+        self._columns = list(final_grade_columns)
+        self._passing_counts = list(passing_counts)
+        self._passing_grade = passing_grade
+        self._baseline_name = baseline_name
+
+    @property
+    def student_ids(self) -> Sequence[str]:
+        """Obtiene los identificadores de los estudiantes."""
+        return self._student_ids
+
+    @property
+    def scenario_names(self) -> List[str]:
+        """Obtiene los nombres de los escenarios en orden."""
+        return list(self._scenario_names)
+
+    @property
+    def baseline_name(self) -> str:
+        """Obtiene el escenario de referencia."""
+        return self._baseline_name
+
+    @property
+    def passing_grade(self) -> float:
+        """Obtiene la nota mínima aprobatoria usada."""
+        return self._passing_grade
+
+    def final_grades(self, scenario_name: str) -> array:
+        """Obtiene la columna de notas finales de un escenario.
+
+        Los escenarios con los mismos parámetros comparten la misma columna.
+        """
+        return self._columns[self._position(scenario_name)]
+
+    def final_grade(self, student_index: int, scenario_name: str) -> float:
+        """Obtiene la nota final de un estudiante en un escenario."""
+        return self._columns[self._position(scenario_name)][student_index]
+
+    def student_row(self, student_index: int) -> List[float]:
+        """Obtiene las notas finales de un estudiante en todos los escenarios."""
+        return [column[student_index] for column in self._columns]
+
+    def pass_rate(self, scenario_name: str) -> float:
+        """Obtiene la proporción de aprobados de un escenario."""
+        if not self._student_ids:
+            return 0.0
+        return self._passing_counts[self._position(scenario_name)] / len(self._student_ids)
+
+    def pass_rate_delta(self, scenario_name: str) -> float:
+        """Obtiene la diferencia de aprobación respecto del escenario de referencia."""
+        return self.pass_rate(scenario_name) - self.pass_rate(self._baseline_name)
+
+    def summary(self) -> List[dict]:
+        """Obtiene los agregados de cada escenario.
+
+        Returns:
+            Un diccionario por escenario con aprobados, tasa de aprobación,
+            diferencia con la referencia y nota final promedio
+        """
+        size = len(self._student_ids)
+        return [
+            {
+                "scenario": name,
+                "passing": self._passing_counts[index],
+                "pass_rate": self.pass_rate(name),
+                "pass_rate_delta": self.pass_rate_delta(name),
+                "mean_final_grade": sum(self._columns[index]) / size if size else 0.0,
+            }
+            for index, name in enumerate(self._scenario_names)
+        ]
+
+    def _position(self, scenario_name: str) -> int:
+        """Obtiene la posición de un escenario.
+
+        Raises:
+            ValueError: Si el escenario no existe
+        """
+        position = self._positions.get(scenario_name)
+        if position is None:
+            raise ValueError(f"Escenario desconocido: '{scenario_name}'")
+        return position
+
+    def __len__(self) -> int:
+        """Obtiene la cantidad de escenarios."""
+        return len(self._scenario_names)
+
+    def __repr__(self) -> str:
+        """Representación string del resultado."""
+        return (
+            f"ScenarioResult(students={len(self._student_ids)}, "
+            f"scenarios={len(self._scenario_names)})"
+        )
+
+
+class ScenarioEngine:
+    """Evalúa muchas variantes de políticas sobre una cohorte en una sola pasada.
+
+    El promedio ponderado de cada estudiante no depende de las políticas, así
+    que se calcula una sola vez. Cada escenario solo aporta una nota de
+    penalización y unos puntos extra otorgados; los escenarios con los mismos
+    parámetros se calculan una vez, y las notas de quienes cumplieron la
+    asistencia se reutilizan entre escenarios con los mismos puntos extra.
+    Los resultados son idénticos a los de GradeCalculator con cada política.
+    """
+
+    def __init__(self, passing_grade: float = GradeCalculator.PASSING_GRADE):
+        """Inicializa el motor.
+
+        Args:
+            passing_grade: Nota final mínima para considerar aprobado
+        """
+        self._passing_grade = passing_grade
+
+    @property
+    def passing_grade(self) -> float:
+        """Obtiene la nota mínima aprobatoria."""
+        return self._passing_grade
+
+    def run(
+        self,
+        students: Sequence[Student],
+        scenarios: Sequence[Scenario],
+        baseline_name: Optional[str] = None
+    ) -> ScenarioResult:
+        """Calcula la nota final de cada estudiante en cada escenario.
+
+        Args:
+            students: Estudiantes de la cohorte
+            scenarios: Escenarios a evaluar, con nombres únicos
+            baseline_name: Escenario de referencia; por defecto el primero
+
+        Returns:
+            ScenarioResult con la matriz de notas y los agregados
+
+        Raises:
+            ValueError: Si algún estudiante tiene datos inválidos o los
+                        escenarios no son válidos
+        """
+        neutral = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([False]))
+        details = neutral.calculate_final_grades(students)
+        return self.run_columns(
+            details.student_ids,
+            details.weighted_averages,
+            [student.has_reached_minimum_classes for student in students],
+            scenarios,
+            baseline_name
+        )
+
+    def run_columns(
+        self,
+        student_ids: Sequence[str],
+        weighted_averages: Sequence[float],
+        attendance: Sequence[bool],
+        scenarios: Sequence[Scenario],
+        baseline_name: Optional[str] = None
+    ) -> ScenarioResult:
+        """Evalúa los escenarios a partir de promedios ponderados ya calculados.
+
+        Permite reutilizar las columnas de un GradeDetailSet o de un cálculo
+        en lote sin volver a recorrer las evaluaciones.
+
+        Args:
+            student_ids: Identificadores de los estudiantes (n)
+            weighted_averages: Promedio ponderado por estudiante (n)
+            attendance: Máscara de asistencia mínima por estudiante (n)
+            scenarios: Escenarios a evaluar, con nombres únicos
+            baseline_name: Escenario de referencia; por defecto el primero
+
+        Returns:
+            ScenarioResult con la matriz de notas y los agregados
+
+        Raises:
+            ValueError: Si las columnas no coinciden o los escenarios no son válidos
+        """
+        size = len(student_ids)
+        if len(weighted_averages) != size or len(attendance) != size:
+            raise ValueError("Todas las columnas deben tener un valor por estudiante")
+        names = [scenario.name for scenario in scenarios]
+        if not names:
+            raise ValueError("Debe indicarse al menos un escenario")
+        if len(set(names)) != len(names):
+            raise ValueError("Los nombres de los escenarios deben ser únicos")
+        baseline_name = names[0] if baseline_name is None else baseline_name
+        if baseline_name not in names:
+            raise ValueError(f"Escenario desconocido: '{baseline_name}'")
+
+        absent_rows = [row for row in range(size) if not attendance[row]]
+        present_columns: Dict[float, Tuple[array, int]] = {}
+        computed: Dict[Tuple[float, float], Tuple[array, int]] = {}
+        columns = []
+        passing_counts = []
+
+        for scenario in scenarios:
+            parameters = scenario.parameters
+            if parameters not in computed:
+                penalty_grade, extra_points = parameters
+                if extra_points not in present_columns:
+                    present_columns[extra_points] = self._present_column(
+                        weighted_averages, extra_points
+                    )
+                computed[parameters] = self._scenario_column(
+                    present_columns[extra_points], absent_rows, penalty_grade, extra_points
+                )
+            column, passing = computed[parameters]
+            columns.append(column)
+            passing_counts.append(passing)
+
+        return ScenarioResult(
+            student_ids, names, columns, passing_counts, self._passing_grade, baseline_name
+        )
+
+    def _present_column(
+        self,
+        weighted_averages: Sequence[float],
+        extra_points: float
+    ) -> Tuple[array, int]:
+        """Calcula la nota final de todos como si cumplieran la asistencia.
+
+        Returns:
+            (columna de notas, cantidad de aprobados en la columna)
+        """
+        min_final, max_final = GradeCalculator.MIN_FINAL_GRADE, GradeCalculator.MAX_FINAL_GRADE
+        column = array("d", [
+            max(min_final, min(weighted_average + extra_points, max_final))
+            for weighted_average in weighted_averages
+        ])
+        passing_grade = self._passing_grade
+        return column, sum(1 for grade in column if grade >= passing_grade)
+
+    def _scenario_column(
+        self,
+        present_column: Tuple[array, int],
+        absent_rows: Sequence[int],
+        penalty_grade: float,
+        extra_points: float
+    ) -> Tuple[array, int]:
+        """Aplica la penalización de asistencia de un escenario sobre la columna base.
+
+        Solo se recorren las filas de quienes no cumplieron la asistencia;
+        sin ellas la columna base se comparte sin copiarla.
+
+        Returns:
+            (columna de notas, cantidad de aprobados)
+        """
+        column, passing = present_column
+        if not absent_rows:
+            return column, passing
+
+        penalized_grade = max(
+            GradeCalculator.MIN_FINAL_GRADE,
+            min(penalty_grade + extra_points, GradeCalculator.MAX_FINAL_GRADE)
+        )
+        penalized_passes = penalized_grade >= self._passing_grade
+        column = array("d", column)
+        for row in absent_rows:
+            if column[row] >= self._passing_grade:
+                passing -= 1
+            column[row] = penalized_grade
+        if penalized_passes:
+            passing += len(absent_rows)
+        return column, passing
+
+    def __repr__(self) -> str:
+        """Representación string del motor."""
+        return f"ScenarioEngine(passing_grade={self._passing_grade})"
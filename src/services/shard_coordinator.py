@@ -0,0 +1,405 @@
+"""Coordinador de trabajos de cálculo repartidos en shards - RNF02 y RNF03."""
+
+import os
+import pickle
+import queue
+import threading
+import time
+import zlib
+from array import array
+from collections import deque
+from multiprocessing import AuthenticationError, Process
+from multiprocessing.connection import Client, Connection, Listener, wait
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+from ..models.grade_detail import GradeDetail
+from ..models.grade_detail_set import COLUMN_NAMES
+from ..models.student import Student
+from ..policies.attendance_policy import AttendancePolicy
+from ..policies.extra_points_policy import ExtraPointsPolicy
+from .grade_calculator import GradeCalculator
+
+# Estados de la respuesta de un trabajador a un shard
+STATUS_OK = "ok"
+STATUS_INVALID = "invalid"
+STATUS_FAILED = "failed"
+
+_PADDING = array("d", bytes(8 * Student.MAX_EVALUATIONS))
+
+# Intervalo con que se vigilan los trabajadores mientras se conectan
+_CONNECT_POLL_SECONDS = 0.05
+
+
+def shard_for(student_id: str, shard_count: int) -> int:
+    """Obtiene el shard de un estudiante a partir del CRC32 de su ID.
+
+    A diferencia de hash(), CRC32 no depende de PYTHONHASHSEED, por lo que
+    un estudiante cae en el mismo shard en cualquier proceso o nodo.
+
+    Args:
+        student_id: Código o identificador del estudiante
+        shard_count: Cantidad total de shards
+
+    Returns:
+        Índice del shard en [0, shard_count)
+    """
+    return zlib.crc32(student_id.encode("utf-8")) % shard_count
+
+
+def _serve_shards(address: object, authkey: bytes) -> None:
+    """Atiende shards enviados por el coordinador hasta recibir un mensaje vacío.
+
+    Las políticas llegan serializadas una sola vez al conectarse; cada
+    shard se responde con las columnas de su GradeDetailSet.
+    """
+    try:
+        with Client(address, authkey=authkey) as connection:
+            attendance_policy, extra_points_policy = pickle.loads(connection.recv_bytes())
+            calculator = GradeCalculator(attendance_policy, extra_points_policy)
+            while True:
+                message = connection.recv_bytes()
+                if not message:
+                    return
+                connection.send(_grade_shard(calculator, message))
+    except (EOFError, OSError):
+        # El coordinador cerró la conexión: el trabajo terminó o se abortó
+        return
+
+
+def _grade_shard(calculator: GradeCalculator, message: bytes) -> Tuple[str, object]:
+    """Calcula un shard y clasifica el resultado para el coordinador.
+
+    Los datos inválidos no se reintentan porque fallarían igual en otro
+    trabajador; cualquier otro error, incluido un mensaje que no se pueda
+    deserializar, se informa como fallo transitorio.
+    """
+    try:
+        student_ids, grades, weights, attendance, width, counts = pickle.loads(message)
+        detail_set = calculator.calculate_batch_flat(
+            student_ids, grades, weights, attendance, width, counts
+        )
+    except ValueError as error:
+        return STATUS_INVALID, str(error)
+    except Exception as error:
+        return STATUS_FAILED, f"{type(error).__name__}: {error}"
+    return STATUS_OK, tuple(detail_set.column(name) for name in COLUMN_NAMES)
+
+
+def _pack_shard(students: Sequence[Student], rows: List[int]) -> bytes:
+    """Serializa un shard en columnas planas para calculate_batch_flat.
+
+    Las notas y pesos viajan como array('d') de ancho k (el máximo de
+    evaluaciones del shard, con relleno en cero), lo que cuesta mucho menos
+    que serializar cada Student con sus objetos Evaluation.
+    """
+    width = max(students[row].evaluation_count for row in rows)
+    student_ids = []
+    grades = array("d")
+    weights = array("d")
+    attendance = bytearray()
+    counts = bytearray()
+    for row in rows:
+        student = students[row]
+        student_ids.append(student.student_id)
+        attendance.append(student.has_reached_minimum_classes)
+        counts.append(student.evaluation_count)
+        for evaluation in student.iter_evaluations():
+            grades.append(evaluation.grade)
+            weights.append(evaluation.weight)
+        padding = width - student.evaluation_count
+        if padding:
+            grades.extend(_PADDING[:padding])
+            weights.extend(_PADDING[:padding])
+    return pickle.dumps(
+        (student_ids, grades, weights, attendance, width, counts),
+        protocol=pickle.HIGHEST_PROTOCOL
+    )
+
+
+class ShardCoordinator:
+    """Reparte el cálculo de una cohorte en shards atendidos por trabajadores.
+
+    Los estudiantes se asignan a shards según el CRC32 de su ID y cada shard
+    se envía a un proceso trabajador conectado por un socket local con
+    autenticación, que hace las veces de un nodo remoto. Las políticas se
+    serializan una sola vez por trabajo y cada shard viaja en columnas
+    planas. Si un trabajador falla o termina
+    inesperadamente, su shard se reintenta en otro trabajador.
+
+    Cada fila vuelve a su posición original sin importar el orden en que
+    terminen los shards.
+    """
+
+    DEFAULT_SHARD_COUNT = 16
+    DEFAULT_MAX_RETRIES = 2
+    CONNECT_TIMEOUT_SECONDS = 30.0
+
+    def __init__(
+        self,
+        attendance_policy: AttendancePolicy,
+        extra_points_policy: ExtraPointsPolicy,
+        shard_count: int = DEFAULT_SHARD_COUNT,
+        worker_count: Optional[int] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES
+    ):
+        """Inicializa el coordinador.
+
+        Args:
+            attendance_policy: Política de asistencia a aplicar
+            extra_points_policy: Política de puntos extra a aplicar
+            shard_count: Cantidad de shards en que se divide la cohorte
+            worker_count: Cantidad de trabajadores; por defecto la cantidad de CPUs
+            max_retries: Reintentos permitidos por shard ante fallos transitorios
+
+        Raises:
+            ValueError: Si algún parámetro numérico está fuera de rango
+        """
+        if shard_count < 1:
+            raise ValueError("La cantidad de shards debe ser mayor que cero")
+        if worker_count is not None and worker_count < 1:
+            raise ValueError("La cantidad de trabajadores debe ser mayor que cero")
+        if max_retries < 0:
+            raise ValueError("La cantidad de reintentos no puede ser negativa")
+
+        self._attendance_policy = attendance_policy
+        self._extra_points_policy = extra_points_policy
+        self._shard_count = shard_count
+        self._worker_count = worker_count or os.cpu_count() or 1
+        self._max_retries = max_retries
+
+    @property
+    def shard_count(self) -> int:
+        """Obtiene la cantidad de shards."""
+        return self._shard_count
+
+    @property
+    def worker_count(self) -> int:
+        """Obtiene la cantidad máxima de trabajadores."""
+        return self._worker_count
+
+    @property
+    def max_retries(self) -> int:
+        """Obtiene los reintentos permitidos por shard."""
+        return self._max_retries
+
+    def partition(self, students: Sequence[Student]) -> List[List[int]]:
+        """Asigna cada estudiante a su shard.
+
+        Args:
+            students: Estudiantes de la cohorte
+
+        Returns:
+            Por cada shard, las posiciones de sus estudiantes en orden creciente
+        """
+        shards: List[List[int]] = [[] for _ in range(self._shard_count)]
+        for row, student in enumerate(students):
+            shards[shard_for(student.student_id, self._shard_count)].append(row)
+        return shards
+
+    def calculate_final_grades(self, students: Sequence[Student]) -> List[GradeDetail]:
+        """Calcula la nota final de toda la cohorte repartida en shards (RF04).
+
+        Args:
+            students: Estudiantes a calcular
+
+        Returns:
+            Lista de GradeDetail en el mismo orden que students
+
+        Raises:
+            ValueError: Si algún estudiante tiene datos inválidos
+            RuntimeError: Si un shard agota sus reintentos o no quedan trabajadores
+        """
+        shards = self.partition(students)
+        pending: Deque[int] = deque(
+            shard_id for shard_id, rows in enumerate(shards) if rows
+        )
+        if not pending:
+            return []
+
+        authkey = os.urandom(32)
+        payload = pickle.dumps(
+            (self._attendance_policy, self._extra_points_policy),
+            protocol=pickle.HIGHEST_PROTOCOL
+        )
+        worker_count = min(self._worker_count, len(pending))
+        # Sin dirección, Listener usa un socket Unix (o un pipe en Windows):
+        # sobre TCP local cada shard esperaba ~40 ms por Nagle y el ACK
+        # retardado. El backlog por defecto (1) bloqueaba las conexiones
+        # simultáneas de los trabajadores.
+        with Listener(backlog=worker_count, authkey=authkey) as listener:
+            processes = [
+                Process(target=_serve_shards, args=(listener.address, authkey), daemon=True)
+                for _ in range(worker_count)
+            ]
+            for process in processes:
+                process.start()
+
+            connections: List[Connection] = []
+            try:
+                self._accept_workers(listener, authkey, processes, connections)
+                for connection in connections:
+                    connection.send_bytes(payload)
+                return self._run_shards(students, shards, pending, connections)
+            finally:
+                self._shutdown(connections, processes)
+
+    def _accept_workers(
+        self,
+        listener: Listener,
+        authkey: bytes,
+        processes: List[Process],
+        connections: List[Connection]
+    ) -> None:
+        """Acepta una conexión por trabajador sin bloquearse si alguno muere.
+
+        Las conexiones se aceptan en un hilo auxiliar mientras este hilo
+        vigila los procesos: si uno termina antes de conectarse (por ejemplo,
+        por un error de importación o falta de memoria) o se agota
+        CONNECT_TIMEOUT_SECONDS, se aborta con un error claro. Las conexiones
+        aceptadas se agregan a connections para que el llamador las cierre.
+
+        Raises:
+            RuntimeError: Si un trabajador termina antes de conectarse o no
+                          se conectan todos a tiempo
+        """
+        accepted: "queue.Queue[Optional[Connection]]" = queue.Queue()
+
+        def accept_all() -> None:
+            try:
+                for _ in processes:
+                    accepted.put(listener.accept())
+            except (OSError, EOFError, AuthenticationError):
+                accepted.put(None)
+
+        acceptor = threading.Thread(target=accept_all, daemon=True)
+        acceptor.start()
+        deadline = time.monotonic() + self.CONNECT_TIMEOUT_SECONDS
+        try:
+            while len(connections) < len(processes):
+                try:
+                    connection = accepted.get(timeout=_CONNECT_POLL_SECONDS)
+                except queue.Empty:
+                    self._check_workers_alive(processes, deadline)
+                    continue
+                if connection is None:
+                    raise RuntimeError("No se pudo aceptar la conexión de un trabajador")
+                connections.append(connection)
+        finally:
+            if acceptor.is_alive():
+                # Conexiones propias para liberar los accept() pendientes del hilo
+                for _ in range(len(processes) - len(connections)):
+                    try:
+                        Client(listener.address, authkey=authkey).close()
+                    except (OSError, EOFError, AuthenticationError):
+                        break
+                acceptor.join(timeout=1)
+            while not accepted.empty():
+                leftover = accepted.get_nowait()
+                if leftover is not None and leftover not in connections:
+                    leftover.close()
+
+    def _check_workers_alive(self, processes: List[Process], deadline: float) -> None:
+        """Aborta si algún trabajador terminó o se agotó el plazo de conexión.
+
+        Raises:
+            RuntimeError: Si un trabajador terminó o venció el plazo
+        """
+        for process in processes:
+            if process.exitcode is not None:
+                raise RuntimeError(
+                    "Un trabajador terminó antes de conectarse "
+                    f"(código de salida {process.exitcode})"
+                )
+        if time.monotonic() > deadline:
+            raise RuntimeError(
+                "Los trabajadores no se conectaron en "
+                f"{self.CONNECT_TIMEOUT_SECONDS} segundos"
+            )
+
+    def _run_shards(
+        self,
+        students: Sequence[Student],
+        shards: List[List[int]],
+        pending: Deque[int],
+        connections: List[Connection]
+    ) -> List[GradeDetail]:
+        """Despacha los shards pendientes y une los resultados en orden."""
+        results: List[Optional[GradeDetail]] = [None] * len(students)
+        attempts = [0] * self._shard_count
+        idle = list(connections)
+        in_flight: Dict[Connection, int] = {}
+
+        while pending or in_flight:
+            while pending and idle:
+                connection = idle.pop()
+                shard_id = pending.popleft()
+                try:
+                    connection.send_bytes(_pack_shard(students, shards[shard_id]))
+                except OSError:
+                    # El trabajador murió antes de recibir el shard
+                    connection.close()
+                    pending.appendleft(shard_id)
+                    continue
+                in_flight[connection] = shard_id
+
+            if not in_flight:
+                raise RuntimeError("No quedan trabajadores disponibles para el trabajo")
+
+            for connection in wait(list(in_flight)):
+                shard_id = in_flight.pop(connection)
+                try:
+                    status, payload = connection.recv()
+                except (EOFError, OSError):
+                    connection.close()
+                    self._retry(shard_id, attempts, pending, "el trabajador terminó inesperadamente")
+                    continue
+
+                idle.append(connection)
+                if status == STATUS_INVALID:
+                    raise ValueError(payload)
+                if status == STATUS_FAILED:
+                    self._retry(shard_id, attempts, pending, payload)
+                    continue
+                self._merge(results, shards[shard_id], payload)
+
+        return results
+
+    def _retry(self, shard_id: int, attempts: List[int], pending: Deque[int], reason: str) -> None:
+        """Vuelve a encolar un shard fallido o aborta si agotó sus reintentos."""
+        attempts[shard_id] += 1
+        if attempts[shard_id] > self._max_retries:
+            raise RuntimeError(
+                f"El shard {shard_id} falló {attempts[shard_id]} veces: {reason}"
+            )
+        pending.append(shard_id)
+
+    @staticmethod
+    def _merge(
+        results: List[Optional[GradeDetail]],
+        rows: List[int],
+        columns: Tuple[Sequence[float], ...]
+    ) -> None:
+        """Ubica los resultados de un shard en sus posiciones originales."""
+        for row, values in zip(rows, zip(*columns)):
+            results[row] = GradeDetail(*values)
+
+    @staticmethod
+    def _shutdown(connections: List[Connection], processes: List[Process]) -> None:
+        """Detiene los trabajadores, incluso si el trabajo se abortó."""
+        for connection in connections:
+            try:
+                connection.send_bytes(b"")
+            except OSError:
+                pass
+            connection.close()
+        for process in processes:
+            process.join(timeout=1)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+
+    def __repr__(self) -> str:
+        """Representación string del coordinador."""
+        return (
+            f"ShardCoordinator(shards={self._shard_count}, "
+            f"workers={self._worker_count}, max_retries={self._max_retries})"
+        )
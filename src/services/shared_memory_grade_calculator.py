@@ -0,0 +1,343 @@
+"""Cálculo paralelo de notas con intercambio por memoria compartida - RNF02 y RNF03."""
+
+from array import array
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import List, Optional, Sequence, Tuple
+from ..models.grade_detail_set import GradeDetailSet
+from ..models.student import Student
+from ..policies.attendance_policy import AttendancePolicy
+from ..policies.extra_points_policy import ExtraPointsPolicy
+from .grade_calculator import GradeCalculator
+
+# Columnas del segmento de resultados, en el orden de COLUMN_NAMES
+_RESULT_COLUMNS = 4
+
+# Bloque asignado a un trabajador:
+# (segmento de entrada, segmento de resultados, n, k, fila inicial, fila final)
+_RowTask = Tuple[str, str, int, int, int, int]
+
+_worker_calculator: Optional[GradeCalculator] = None
+
+
+def _initialize_worker(
+    attendance_policy: AttendancePolicy,
+    extra_points_policy: ExtraPointsPolicy
+) -> None:
+    """Crea el calculador del proceso trabajador una sola vez."""
+    global _worker_calculator
+    _worker_calculator = GradeCalculator(attendance_policy, extra_points_policy)
+
+
+def _input_size(size: int, width: int) -> int:
+    """Obtiene los bytes del segmento de entrada de n estudiantes con k evaluaciones."""
+    return 16 * size * width + 2 * size
+
+
+def _slice_view(
+    buffer: memoryview, start: int, stop: int, format: str, views: List[memoryview]
+) -> memoryview:
+    """Obtiene una vista tipada de [start, stop) bytes y la registra para liberarla."""
+    raw = buffer[start:stop]
+    views.append(raw)
+    if format == "B":
+        return raw
+    typed = raw.cast(format)
+    views.append(typed)
+    return typed
+
+
+def _input_views(
+    buffer: memoryview, size: int, width: int, views: List[memoryview]
+) -> Tuple[memoryview, memoryview, memoryview, memoryview]:
+    """Obtiene las columnas del segmento de entrada.
+
+    El segmento contiene, en orden: notas y pesos (n * k flotantes cada uno,
+    en orden por filas), cantidad de evaluaciones y asistencia (n bytes cada
+    una).
+    """
+    cells = 8 * size * width
+    return (
+        _slice_view(buffer, 0, cells, "d", views),
+        _slice_view(buffer, cells, 2 * cells, "d", views),
+        _slice_view(buffer, 2 * cells, 2 * cells + size, "B", views),
+        _slice_view(buffer, 2 * cells + size, 2 * cells + 2 * size, "B", views),
+    )
+
+
+def _result_views(
+    buffer: memoryview, size: int, views: List[memoryview]
+) -> List[memoryview]:
+    """Obtiene las cuatro columnas de flotantes del segmento de resultados."""
+    return [
+        _slice_view(buffer, 8 * size * column, 8 * size * (column + 1), "d", views)
+        for column in range(_RESULT_COLUMNS)
+    ]
+
+
+def _release(views: List[memoryview]) -> None:
+    """Libera las vistas en orden inverso para poder cerrar el segmento."""
+    for view in reversed(views):
+        view.release()
+    views.clear()
+
+
+def _grade_rows(task: _RowTask) -> int:
+    """Calcula un bloque de filas en el trabajador y escribe sus resultados.
+
+    Las entradas se leen en el lugar desde la memoria compartida y las
+    cuatro columnas del resultado se copian en sus posiciones del segmento
+    de resultados; al proceso principal solo vuelve la cantidad de filas.
+    Como IDs se usan los números de fila: el proceso principal reconstruye
+    el mensaje con el ID real si el bloque tiene datos inválidos.
+    """
+    input_name, result_name, size, width, start, stop = task
+    inputs = SharedMemory(name=input_name)
+    results = SharedMemory(name=result_name)
+    views: List[memoryview] = []
+    try:
+        grades, weights, counts, attendance = _input_views(inputs.buf, size, width, views)
+        first, last = start * width, stop * width
+        rows = [
+            grades[first:last], weights[first:last], counts[start:stop], attendance[start:stop]
+        ]
+        views.extend(rows)
+        grades, weights, counts, attendance = rows
+        detail_set = _worker_calculator.calculate_buffers(
+            range(start, stop), grades, weights, attendance, width, counts
+        )
+        columns = (
+            detail_set.weighted_averages,
+            detail_set.attendance_penalties,
+            detail_set.extra_points,
+            detail_set.final_grades,
+        )
+        for target, column in zip(_result_views(results.buf, size, views), columns):
+            target[start:stop] = column
+        return stop - start
+    finally:
+        _release(views)
+        inputs.close()
+        results.close()
+
+
+class SharedMemoryGradeCalculator:
+    """Calcula las notas de poblaciones grandes en procesos sin serializar resultados.
+
+    Las evaluaciones se copian una sola vez a un segmento de
+    multiprocessing.shared_memory y cada trabajador recibe solo los nombres
+    de los segmentos y su rango de filas. Los trabajadores leen las
+    entradas en el lugar (GradeCalculator.calculate_buffers) y escriben
+    promedio ponderado, penalización, puntos extra y nota final en un
+    segmento de resultados en columnas, en las posiciones de sus filas. No
+    hay comunicación por estudiante.
+
+    Los segmentos se crean por llamada y se eliminan al terminar, incluso
+    si algún estudiante tiene datos inválidos. Puede usarse como context
+    manager para reutilizar el mismo grupo de procesos.
+    """
+
+    DEFAULT_CHUNK_SIZE = 10_000
+
+    def __init__(
+        self,
+        attendance_policy: AttendancePolicy,
+        extra_points_policy: ExtraPointsPolicy,
+        max_workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ):
+        """Inicializa el calculador con memoria compartida.
+
+        Args:
+            attendance_policy: Política de asistencia a aplicar
+            extra_points_policy: Política de puntos extra a aplicar
+            max_workers: Cantidad de procesos; por defecto la cantidad de CPUs
+            chunk_size: Filas por bloque asignado a un trabajador
+
+        Raises:
+            ValueError: Si max_workers o chunk_size no son positivos
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("La cantidad de procesos debe ser mayor que cero")
+        if chunk_size < 1:
+            raise ValueError("El tamaño de bloque debe ser mayor que cero")
+
+        self._attendance_policy = attendance_policy
+        self._extra_points_policy = extra_points_policy
+        self._calculator = GradeCalculator(attendance_policy, extra_points_policy)
+        self._max_workers = max_workers
+        self._chunk_size = chunk_size
+        self._executor: Optional[Executor] = None
+
+    @property
+    def max_workers(self) -> Optional[int]:
+        """Obtiene la cantidad de procesos configurada."""
+        return self._max_workers
+
+    @property
+    def chunk_size(self) -> int:
+        """Obtiene el tamaño de bloque configurado."""
+        return self._chunk_size
+
+    def open(self) -> "SharedMemoryGradeCalculator":
+        """Inicia el grupo de procesos trabajadores."""
+        if self._executor is None:
+            self._executor = self._create_executor()
+        return self
+
+    def close(self) -> None:
+        """Detiene el grupo de procesos trabajadores."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def calculate_final_grades(self, students: Sequence[Student]) -> GradeDetailSet:
+        """Calcula la nota final de cada estudiante en paralelo (RF04).
+
+        Las evaluaciones se escriben directamente en la memoria compartida,
+        con un ancho de fila igual a la mayor cantidad de evaluaciones.
+
+        Args:
+            students: Estudiantes a calcular
+
+        Returns:
+            GradeDetailSet en el mismo orden que students
+
+        Raises:
+            ValueError: Si algún estudiante tiene datos inválidos
+        """
+        student_ids = [student.student_id for student in students]
+        size = len(student_ids)
+        if size == 0:
+            return self._calculator.calculate_batch_flat([], (), (), (), 0)
+
+        width = max(student.evaluation_count for student in students)
+        inputs = SharedMemory(create=True, size=max(_input_size(size, width), 1))
+        results = SharedMemory(create=True, size=8 * _RESULT_COLUMNS * size)
+        views: List[memoryview] = []
+        try:
+            columns = _input_views(inputs.buf, size, width, views)
+            self._pack_students(students, width, *columns)
+            tasks = [
+                (inputs.name, results.name, size, width, start,
+                 min(start + self._chunk_size, size))
+                for start in range(0, size, self._chunk_size)
+            ]
+            finished: List[_RowTask] = []
+            try:
+                if self._executor is not None:
+                    self._dispatch(self._executor, tasks, finished)
+                else:
+                    with self._create_executor() as executor:
+                        self._dispatch(executor, tasks, finished)
+            except ValueError:
+                _, _, _, _, start, stop = tasks[len(finished)]
+                self._raise_with_student_ids(student_ids, width, start, stop, *columns)
+                raise
+
+            weighted_averages, penalties, extra_points, final_grades = (
+                array("d", view) for view in _result_views(results.buf, size, views)
+            )
+        finally:
+            _release(views)
+            for segment in (inputs, results):
+                segment.close()
+                segment.unlink()
+
+        return GradeDetailSet(
+            student_ids=student_ids,
+            weighted_averages=weighted_averages,
+            attendance_penalties=penalties,
+            extra_points=extra_points,
+            final_grades=final_grades
+        )
+
+    @staticmethod
+    def _pack_students(
+        students: Sequence[Student],
+        width: int,
+        grades: memoryview,
+        weights: memoryview,
+        counts: memoryview,
+        attendance: memoryview
+    ) -> None:
+        """Escribe las evaluaciones de los estudiantes en el segmento de entrada.
+
+        Raises:
+            ValueError: Si un estudiante excede el límite de evaluaciones
+        """
+        if width > Student.MAX_EVALUATIONS:
+            raise ValueError(
+                f"No se pueden tener más de {Student.MAX_EVALUATIONS} evaluaciones"
+            )
+        for row, student in enumerate(students):
+            start = position = row * width
+            for evaluation in student.iter_evaluations():
+                grades[position] = evaluation.grade
+                weights[position] = evaluation.weight
+                position += 1
+            counts[row] = position - start
+            attendance[row] = student.has_reached_minimum_classes
+
+    @staticmethod
+    def _dispatch(
+        executor: Executor, tasks: List[_RowTask], finished: List[_RowTask]
+    ) -> None:
+        """Reparte los bloques y espera a que todos terminen.
+
+        Los resultados llegan en el orden de tasks, así que si un bloque
+        falla, finished contiene exactamente los bloques anteriores a él.
+        """
+        for task, _ in zip(tasks, executor.map(_grade_rows, tasks)):
+            finished.append(task)
+
+    def _raise_with_student_ids(
+        self,
+        student_ids: List[str],
+        width: int,
+        start: int,
+        stop: int,
+        grades: memoryview,
+        weights: memoryview,
+        counts: memoryview,
+        attendance: memoryview
+    ) -> None:
+        """Repite en el proceso principal el bloque fallido para informar el ID real.
+
+        Los trabajadores identifican las filas por su número; al recalcular
+        las filas [start, stop) con sus IDs, el error se lanza con el mismo
+        mensaje que GradeCalculator.calculate_final_grades.
+        """
+        first, last = start * width, stop * width
+        rows = [
+            grades[first:last], weights[first:last], attendance[start:stop], counts[start:stop]
+        ]
+        try:
+            self._calculator.calculate_buffers(
+                student_ids[start:stop], rows[0], rows[1], rows[2], width, rows[3]
+            )
+        finally:
+            _release(rows)
+
+    def _create_executor(self) -> Executor:
+        """Crea el grupo de procesos con las políticas ya cargadas."""
+        return ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            initializer=_initialize_worker,
+            initargs=(self._attendance_policy, self._extra_points_policy)
+        )
+
+    def __enter__(self) -> "SharedMemoryGradeCalculator":
+        """Inicia los trabajadores al entrar al bloque with."""
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Detiene los trabajadores al salir del bloque with."""
+        self.close()
+
+    def __repr__(self) -> str:
+        """Representación string del calculador con memoria compartida."""
+        return (
+            f"SharedMemoryGradeCalculator(workers={self._max_workers}, "
+            f"chunk_size={self._chunk_size})"
+        )
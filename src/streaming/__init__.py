@@ -0,0 +1,41 @@
+"""Lectura y escritura en streaming de notas y resultados.
+
+Los nombres exportados se importan de forma perezosa al primer acceso,
+de modo que importar un submódulo no carga el resto del paquete.
+"""
+
+from typing import TYPE_CHECKING
+from .._lazy_exports import lazy_exports
+
+_EXPORTS = {
+    "BinaryGradebook": ".binary_gradebook",
+    "BinaryGradebookWriter": ".binary_gradebook",
+    "GradeReader": ".grade_reader",
+    "RejectWriter": ".result_writer",
+    "ResultWriter": ".result_writer",
+    "SqliteResultStore": ".sqlite_result_store",
+    "convert_to_gradebook": ".binary_gradebook",
+    "read_result_set": ".result_set_file",
+    "write_result_set": ".result_set_file",
+}
+
+__all__ = [
+    "BinaryGradebook",
+    "BinaryGradebookWriter",
+    "GradeReader",
+    "RejectWriter",
+    "ResultWriter",
+    "SqliteResultStore",
+    "convert_to_gradebook",
+    "read_result_set",
+    "write_result_set",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from .binary_gradebook import BinaryGradebook, BinaryGradebookWriter, convert_to_gradebook
+    from .grade_reader import GradeReader
+    from .result_writer import RejectWriter, ResultWriter
+    from .result_set_file import read_result_set, write_result_set
+    from .sqlite_result_store import SqliteResultStore
@@ -0,0 +1,490 @@
+"""Libro de notas binario de registros fijos, leído con mmap."""
+
+import mmap
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Iterator, Optional, Sequence, Union
+from ..models.evaluation import Evaluation
+from ..models.student import Student
+from .grade_reader import GradeReader, RejectHandler
+
+MAGIC = b"GRDB"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHHIQ")
+HEADER_SIZE = 32
+DEFAULT_ID_WIDTH = 16
+
+
+class _Layout:
+    """Posición de cada bloque de columnas dentro del archivo.
+
+    El archivo tiene una cabecera de HEADER_SIZE bytes seguida de un bloque
+    por columna, todos de registros fijos: notas y pesos (n * k float64),
+    cantidad de evaluaciones (n uint8), asistencia (n uint8) e
+    identificadores (n * id_width bytes UTF-8 rellenos con ceros). Las
+    columnas de float64 van primero para quedar alineadas a 8 bytes.
+    """
+
+    __slots__ = (
+        "record_count", "evaluations_per_student", "id_width",
+        "grades_offset", "weights_offset", "counts_offset",
+        "attendance_offset", "ids_offset", "file_size"
+    )
+
+    def __init__(self, record_count: int, evaluations_per_student: int, id_width: int):
+        self.record_count = record_count
+        self.evaluations_per_student = evaluations_per_student
+        self.id_width = id_width
+        column_bytes = 8 * record_count * evaluations_per_student
+        self.grades_offset = HEADER_SIZE
+        self.weights_offset = self.grades_offset + column_bytes
+        self.counts_offset = self.weights_offset + column_bytes
+        self.attendance_offset = self.counts_offset + record_count
+        self.ids_offset = self.attendance_offset + record_count
+        self.file_size = self.ids_offset + record_count * id_width
+
+
+class StudentIdTable(Sequence):
+    """Vista perezosa de la tabla de identificadores del libro de notas.
+
+    Decodifica cada identificador solo cuando se accede a él, sin crear una
+    lista de n strings al abrir el archivo. Al cerrar el libro, la tabla
+    copia su bloque de bytes, de modo que los resultados que la usan como
+    student_ids siguen siendo válidos después de close().
+    """
+
+    def __init__(self, ids_view: memoryview, id_width: int):
+        """Inicializa la tabla.
+
+        Args:
+            ids_view: Bloque de identificadores (n * id_width bytes)
+            id_width: Bytes reservados por identificador
+        """
+        self._ids_view = ids_view
+        self._id_width = id_width
+        self._size = len(ids_view) // id_width if id_width else 0
+
+    def __getitem__(self, index):
+        """Obtiene el identificador de la posición indicada."""
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("Índice de estudiante fuera de rango")
+        start = index * self._id_width
+        raw = bytes(self._ids_view[start:start + self._id_width])
+        return raw.rstrip(b"\0").decode("utf-8")
+
+    def detach(self) -> None:
+        """Copia el bloque de identificadores para no depender del archivo mapeado."""
+        self._ids_view = bytes(self._ids_view)
+
+    def __len__(self) -> int:
+        """Obtiene la cantidad de identificadores."""
+        return self._size
+
+    def __repr__(self) -> str:
+        """Representación string de la tabla."""
+        return f"StudentIdTable(size={self._size})"
+
+
+class BinaryGradebook:
+    """Libro de notas binario abierto con mmap y expuesto como vistas sin copia.
+
+    Las columnas se sirven como memoryview sobre el archivo mapeado, con el
+    mismo formato plano (n x k) que GradeCalculator.calculate_batch_flat, por
+    lo que un lote completo se califica sin parsear ni crear objetos por
+    estudiante. Abrir el archivo solo lee la cabecera: el resto se carga bajo
+    demanda desde la caché de páginas del sistema operativo.
+
+    Las columnas dejan de ser válidas al cerrar el libro; la tabla de
+    identificadores se copia al cerrar y sigue siendo válida.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """Inicializa el libro de notas.
+
+        Args:
+            path: Ruta del archivo binario
+        """
+        self._path = Path(path)
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._views = []
+        self._layout: Optional[_Layout] = None
+        self._student_ids: Optional[StudentIdTable] = None
+        self._grades: Optional[memoryview] = None
+        self._weights: Optional[memoryview] = None
+        self._evaluation_counts: Optional[memoryview] = None
+        self._attendance: Optional[memoryview] = None
+
+    def open(self) -> "BinaryGradebook":
+        """Mapea el archivo en memoria y valida su cabecera.
+
+        Raises:
+            ValueError: Si el archivo no es un libro de notas válido
+        """
+        if sys.byteorder != "little":
+            raise ValueError("El libro de notas binario requiere una plataforma little-endian")
+
+        self._file = open(self._path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            self._file = None
+            raise ValueError("El archivo del libro de notas está vacío")
+
+        try:
+            self._layout = _read_layout(self._mmap)
+        except ValueError:
+            self.close()
+            raise
+
+        layout = self._layout
+        buffer = memoryview(self._mmap)
+        self._views.append(buffer)
+        self._grades = self._column(buffer, layout.grades_offset, layout.weights_offset, "d")
+        self._weights = self._column(buffer, layout.weights_offset, layout.counts_offset, "d")
+        self._evaluation_counts = self._column(
+            buffer, layout.counts_offset, layout.attendance_offset, "B"
+        )
+        self._attendance = self._column(
+            buffer, layout.attendance_offset, layout.ids_offset, "B"
+        )
+        ids_view = self._column(buffer, layout.ids_offset, layout.file_size, "B")
+        self._student_ids = StudentIdTable(ids_view, layout.id_width)
+        return self
+
+    def _column(self, buffer: memoryview, start: int, end: int, typecode: str) -> memoryview:
+        """Crea una vista tipada de un bloque y la registra para liberarla al cerrar."""
+        view = buffer[start:end].cast(typecode)
+        self._views.append(view)
+        return view
+
+    @property
+    def record_count(self) -> int:
+        """Obtiene la cantidad de estudiantes del libro."""
+        return self._layout.record_count
+
+    @property
+    def evaluations_per_student(self) -> int:
+        """Obtiene el ancho k de cada registro."""
+        return self._layout.evaluations_per_student
+
+    @property
+    def student_ids(self) -> StudentIdTable:
+        """Obtiene la tabla perezosa de identificadores."""
+        return self._student_ids
+
+    @property
+    def grades(self) -> memoryview:
+        """Obtiene la columna de notas (n * k float64) sin copia."""
+        return self._grades
+
+    @property
+    def weights(self) -> memoryview:
+        """Obtiene la columna de pesos (n * k float64) sin copia."""
+        return self._weights
+
+    @property
+    def evaluation_counts(self) -> memoryview:
+        """Obtiene la cantidad de evaluaciones usadas por estudiante."""
+        return self._evaluation_counts
+
+    @property
+    def attendance(self) -> memoryview:
+        """Obtiene la máscara de asistencia mínima (1 o 0 por estudiante)."""
+        return self._attendance
+
+    def student_at(self, index: int) -> Student:
+        """Construye el Student del registro indicado.
+
+        Args:
+            index: Posición del estudiante en el libro
+
+        Returns:
+            Estudiante con sus evaluaciones y asistencia
+        """
+        width = self._layout.evaluations_per_student
+        start = index * width
+        count = self._evaluation_counts[index]
+        return Student(
+            student_id=self._student_ids[index],
+            evaluations=[
+                Evaluation(self._grades[position], self._weights[position])
+                for position in range(start, start + count)
+            ],
+            has_reached_minimum_classes=bool(self._attendance[index])
+        )
+
+    def iter_students(self) -> Iterator[Student]:
+        """Itera los estudiantes del libro en orden, construyéndolos bajo demanda."""
+        for index in range(self._layout.record_count):
+            yield self.student_at(index)
+
+    def close(self) -> None:
+        """Libera las vistas y desmapea el archivo.
+
+        La tabla de identificadores se copia antes de liberar su vista, por lo
+        que sigue siendo válida. Las columnas de notas, pesos y asistencia
+        dejan de serlo.
+
+        Raises:
+            BufferError: Si quien llama aún tiene vistas derivadas de las
+                         columnas; el libro queda cerrado de todos modos y el
+                         mapeo se libera cuando esas vistas se descartan
+        """
+        if self._student_ids is not None:
+            self._student_ids.detach()
+        self._student_ids = None
+        self._grades = self._weights = None
+        self._evaluation_counts = self._attendance = None
+        views, self._views = self._views, []
+        mapping, self._mmap = self._mmap, None
+        file, self._file = self._file, None
+        try:
+            for view in reversed(views):
+                view.release()
+            if mapping is not None:
+                mapping.close()
+        finally:
+            if file is not None:
+                file.close()
+
+    def __len__(self) -> int:
+        """Obtiene la cantidad de estudiantes del libro."""
+        return self._layout.record_count
+
+    def __enter__(self) -> "BinaryGradebook":
+        """Abre el libro al entrar al bloque with."""
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Cierra el libro al salir del bloque with."""
+        self.close()
+
+    def __repr__(self) -> str:
+        """Representación string del libro de notas."""
+        records = self._layout.record_count if self._layout is not None else "?"
+        return f"BinaryGradebook(path={self._path}, records={records})"
+
+
+class BinaryGradebookWriter:
+    """Escribe un libro de notas binario de tamaño conocido.
+
+    El archivo se reserva completo al abrirlo y cada registro se copia
+    directamente en su posición a través de mmap.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        record_count: int,
+        id_width: int = DEFAULT_ID_WIDTH
+    ):
+        """Inicializa el escritor.
+
+        Args:
+            path: Ruta del archivo de salida
+            record_count: Cantidad de estudiantes que se escribirán
+            id_width: Bytes reservados por identificador (UTF-8)
+
+        Raises:
+            ValueError: Si record_count es negativo o id_width no es positivo
+        """
+        if record_count < 0:
+            raise ValueError("La cantidad de registros no puede ser negativa")
+        if id_width < 1:
+            raise ValueError("El ancho del identificador debe ser mayor que cero")
+
+        self._path = Path(path)
+        self._layout = _Layout(record_count, Student.MAX_EVALUATIONS, id_width)
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._grades: Optional[memoryview] = None
+        self._weights: Optional[memoryview] = None
+        self._records_written = 0
+
+    @property
+    def records_written(self) -> int:
+        """Obtiene la cantidad de registros escritos."""
+        return self._records_written
+
+    def open(self) -> "BinaryGradebookWriter":
+        """Crea el archivo con su tamaño final y escribe la cabecera."""
+        layout = self._layout
+        self._file = open(self._path, "w+b")
+        self._file.truncate(layout.file_size)
+        self._mmap = mmap.mmap(self._file.fileno(), layout.file_size)
+        self._mmap[0:HEADER.size] = HEADER.pack(
+            MAGIC, FORMAT_VERSION, layout.evaluations_per_student,
+            layout.id_width, layout.record_count
+        )
+        self._grades = memoryview(self._mmap)[layout.grades_offset:layout.weights_offset].cast("d")
+        self._weights = memoryview(self._mmap)[layout.weights_offset:layout.counts_offset].cast("d")
+        return self
+
+    def write(
+        self,
+        student_id: str,
+        grades: Sequence[float],
+        weights: Sequence[float],
+        has_reached_minimum_classes: bool
+    ) -> None:
+        """Escribe el siguiente registro.
+
+        Args:
+            student_id: Identificador del estudiante
+            grades: Notas del estudiante (hasta MAX_EVALUATIONS)
+            weights: Pesos correspondientes a cada nota
+            has_reached_minimum_classes: Si cumplió la asistencia mínima
+
+        Raises:
+            ValueError: Si el libro está completo, el identificador no cabe o
+                        las notas no tienen la forma esperada
+        """
+        layout = self._layout
+        index = self._records_written
+        if index >= layout.record_count:
+            raise ValueError(f"El libro de notas ya tiene {layout.record_count} registros")
+        if len(grades) != len(weights):
+            raise ValueError(
+                f"Estudiante {student_id}: cada nota debe tener su peso correspondiente"
+            )
+        if len(grades) > layout.evaluations_per_student:
+            raise ValueError(
+                f"No se pueden tener más de {layout.evaluations_per_student} evaluaciones"
+            )
+        encoded_id = student_id.encode("utf-8")
+        if len(encoded_id) > layout.id_width:
+            raise ValueError(
+                f"El ID del estudiante {student_id} supera {layout.id_width} bytes"
+            )
+
+        start = index * layout.evaluations_per_student
+        count = len(grades)
+        self._grades[start:start + count] = array("d", grades)
+        self._weights[start:start + count] = array("d", weights)
+        self._mmap[layout.counts_offset + index] = count
+        self._mmap[layout.attendance_offset + index] = 1 if has_reached_minimum_classes else 0
+        id_start = layout.ids_offset + index * layout.id_width
+        self._mmap[id_start:id_start + len(encoded_id)] = encoded_id
+        self._records_written += 1
+
+    def write_student(self, student: Student) -> None:
+        """Escribe el registro de un Student.
+
+        Args:
+            student: Estudiante con sus evaluaciones y asistencia
+        """
+        evaluations = student.evaluations
+        self.write(
+            student.student_id,
+            [evaluation.grade for evaluation in evaluations],
+            [evaluation.weight for evaluation in evaluations],
+            student.has_reached_minimum_classes
+        )
+
+    def close(self) -> None:
+        """Vuelca el libro a disco y cierra el archivo.
+
+        Raises:
+            ValueError: Si se escribieron menos registros que los reservados
+        """
+        if self._mmap is None:
+            return
+        self._grades.release()
+        self._weights.release()
+        self._grades = self._weights = None
+        self._mmap.flush()
+        self._mmap.close()
+        self._mmap = None
+        self._file.close()
+        self._file = None
+        if self._records_written != self._layout.record_count:
+            raise ValueError(
+                f"Se reservaron {self._layout.record_count} registros, "
+                f"pero se escribieron {self._records_written}"
+            )
+
+    def __enter__(self) -> "BinaryGradebookWriter":
+        """Abre el archivo al entrar al bloque with."""
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Cierra el archivo al salir del bloque with."""
+        if exc_type is None:
+            self.close()
+            return
+        try:
+            self.close()
+        except ValueError:
+            pass  # Se conserva la excepción original del bloque
+
+    def __repr__(self) -> str:
+        """Representación string del escritor."""
+        return (
+            f"BinaryGradebookWriter(path={self._path}, "
+            f"records={self._records_written}/{self._layout.record_count})"
+        )
+
+
+def convert_to_gradebook(
+    input_path: Union[str, Path],
+    output_path: Union[str, Path],
+    input_format: Optional[str] = None,
+    id_width: int = DEFAULT_ID_WIDTH,
+    on_reject: Optional[RejectHandler] = None
+) -> int:
+    """Convierte una exportación CSV o JSONL en un libro de notas binario.
+
+    Lee la entrada dos veces con GradeReader: la primera cuenta los
+    estudiantes para reservar el archivo y la segunda los escribe.
+
+    Args:
+        input_path: Archivo de notas de entrada
+        output_path: Libro de notas binario de salida
+        input_format: Formato de entrada; por defecto según la extensión
+        id_width: Bytes reservados por identificador
+        on_reject: Función llamada con (línea, student_id, mensaje) por cada
+                   fila rechazada
+
+    Returns:
+        Cantidad de estudiantes escritos
+    """
+    reader = GradeReader(input_path, input_format)
+    record_count = sum(1 for _ in reader.iter_students(lambda *rejected: None))
+
+    with BinaryGradebookWriter(output_path, record_count, id_width) as writer:
+        for _, student in reader.iter_students(on_reject or (lambda *rejected: None)):
+            writer.write_student(student)
+    return record_count
+
+
+def _read_layout(buffer: mmap.mmap) -> _Layout:
+    """Lee y valida la cabecera de un libro de notas.
+
+    Raises:
+        ValueError: Si la cabecera no corresponde al formato o el tamaño no coincide
+    """
+    if len(buffer) < HEADER_SIZE:
+        raise ValueError("El archivo no es un libro de notas binario")
+    magic, version, width, id_width, record_count = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise ValueError("El archivo no es un libro de notas binario")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Versión de libro de notas no soportada: {version}")
+    if width > Student.MAX_EVALUATIONS or id_width < 1:
+        raise ValueError("La cabecera del libro de notas es inválida")
+
+    layout = _Layout(record_count, width, id_width)
+    if len(buffer) != layout.file_size:
+        raise ValueError(
+            f"El libro de notas debería tener {layout.file_size} bytes, "
+            f"pero tiene {len(buffer)}"
+        )
+    return layout
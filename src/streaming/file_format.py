@@ -0,0 +1,32 @@
+"""Formatos de archivo soportados por la lectura y escritura en streaming."""
+
+from pathlib import Path
+from typing import Optional, Union
+
+CSV_FORMAT = "csv"
+JSONL_FORMAT = "jsonl"
+SUPPORTED_FORMATS = (CSV_FORMAT, JSONL_FORMAT)
+
+
+def detect_file_format(path: Union[str, Path], file_format: Optional[str] = None) -> str:
+    """Determina el formato de un archivo a partir de su extensión.
+
+    Args:
+        path: Ruta del archivo
+        file_format: Formato explícito; tiene prioridad sobre la extensión
+
+    Returns:
+        El formato normalizado ("csv" o "jsonl")
+
+    Raises:
+        ValueError: Si el formato no está soportado
+    """
+    resolved = (file_format or Path(path).suffix.lstrip(".")).lower()
+    if resolved == "json":
+        resolved = JSONL_FORMAT
+    if resolved not in SUPPORTED_FORMATS:
+        raise ValueError(
+            f"Formato de archivo no soportado: '{resolved}' "
+            f"(se esperaba {' o '.join(SUPPORTED_FORMATS)})"
+        )
+    return resolved
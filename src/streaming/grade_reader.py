@@ -0,0 +1,148 @@
+"""Lector en streaming de notas exportadas por registros académicos."""
+
+import csv
+import json
+import math
+from pathlib import Path
+from typing import Callable, Iterator, Optional, Tuple, Union
+from ..models.evaluation import Evaluation
+from ..models.student import Student
+from .file_format import CSV_FORMAT, detect_file_format
+
+RejectHandler = Callable[[int, str, str], None]
+
+TRUE_VALUES = ("true", "1", "si", "sí", "yes", "y", "s")
+
+
+class GradeReader:
+    """Lee filas de notas en CSV o JSONL y las agrupa en estudiantes.
+
+    Cada fila representa una evaluación con las columnas student_id, grade,
+    weight y has_reached_minimum_classes. La entrada debe estar ordenada por
+    student_id, o al menos tener consecutivas las filas de cada estudiante
+    (como en las exportaciones ordenadas por código). Así se procesan
+    archivos de cualquier tamaño manteniendo en memoria solo el estudiante
+    en curso, sin estado por cada estudiante ya leído.
+    """
+
+    STUDENT_ID_FIELD = "student_id"
+    GRADE_FIELD = "grade"
+    WEIGHT_FIELD = "weight"
+    ATTENDANCE_FIELD = "has_reached_minimum_classes"
+
+    def __init__(self, path: Union[str, Path], file_format: Optional[str] = None):
+        """Inicializa el lector.
+
+        Args:
+            path: Ruta del archivo de entrada
+            file_format: "csv" o "jsonl"; por defecto se deduce de la extensión
+
+        Raises:
+            ValueError: Si el formato no está soportado
+        """
+        self._path = Path(path)
+        self._file_format = detect_file_format(path, file_format)
+
+    def read_rows(self) -> Iterator[Tuple[int, object]]:
+        """Lee las filas del archivo de forma perezosa.
+
+        Yields:
+            Tuplas (número de línea, fila); la fila es un diccionario o, si la
+            línea JSONL no pudo decodificarse, el ValueError producido
+        """
+        with open(self._path, newline="", encoding="utf-8") as source:
+            if self._file_format == CSV_FORMAT:
+                reader = csv.DictReader(source)
+                for row in reader:
+                    yield reader.line_num, row
+                return
+
+            for line_number, line in enumerate(source, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield line_number, json.loads(line)
+                except ValueError as error:
+                    yield line_number, ValueError(f"JSON inválido: {error}")
+
+    def iter_students(self, on_reject: RejectHandler) -> Iterator[Tuple[int, Student]]:
+        """Agrupa las filas consecutivas de cada student_id en un Student.
+
+        Las filas inválidas no detienen la lectura: se informan mediante
+        on_reject con el mensaje del ValueError y se omiten. También se
+        rechazan las filas que contradicen la asistencia de la primera fila
+        del estudiante en curso.
+
+        Solo se compara contra el estudiante en curso: si las filas de un
+        estudiante no son consecutivas, cada tramo se entrega como un
+        estudiante distinto. Detectarlo exigiría recordar todos los IDs
+        leídos, y la memoria dejaría de ser constante.
+
+        Args:
+            on_reject: Función llamada con (línea, student_id, mensaje) por
+                       cada fila rechazada
+
+        Yields:
+            Tuplas (línea de la primera fila, estudiante)
+        """
+        current_student = None
+        current_line = 0
+
+        for line_number, row in self.read_rows():
+            if isinstance(row, ValueError) or not isinstance(row, dict):
+                on_reject(line_number, "", str(row))
+                continue
+
+            student_id = row.get(self.STUDENT_ID_FIELD)
+            has_reached_minimum = _parse_bool(row.get(self.ATTENDANCE_FIELD))
+            if current_student is None or student_id != current_student.student_id:
+                if current_student is not None:
+                    yield current_line, current_student
+                    current_student = None
+                try:
+                    current_student = Student(
+                        student_id=student_id,
+                        has_reached_minimum_classes=has_reached_minimum
+                    )
+                    current_line = line_number
+                except ValueError as error:
+                    on_reject(line_number, str(student_id or ""), str(error))
+                    continue
+            elif has_reached_minimum != current_student.has_reached_minimum_classes:
+                on_reject(
+                    line_number, student_id,
+                    f"La asistencia del estudiante {student_id} no coincide con su primera fila"
+                )
+                continue
+
+            try:
+                grade = _parse_number(row.get(self.GRADE_FIELD), "La nota debe ser un número")
+                weight = _parse_number(row.get(self.WEIGHT_FIELD), "El peso debe ser un número")
+                current_student.add_evaluation(Evaluation(grade, weight))
+            except ValueError as error:
+                on_reject(line_number, student_id, str(error))
+
+        if current_student is not None:
+            yield current_line, current_student
+
+
+def _parse_number(value: object, message: str) -> float:
+    """Convierte un valor de texto o JSON en número, con el mensaje de Evaluation."""
+    if isinstance(value, bool):
+        raise ValueError(message)
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(message) from None
+    if math.isnan(number):
+        raise ValueError(message)
+    return number
+
+
+def _parse_bool(value: object) -> bool:
+    """Interpreta el indicador de asistencia mínima (RF02)."""
+    if isinstance(value, bool):
+        return value
+    if value is None:
+        return False
+    return str(value).strip().lower() in TRUE_VALUES
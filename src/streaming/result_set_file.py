@@ -0,0 +1,103 @@
+"""Archivo binario columnar de resultados (GradeDetailSet)."""
+
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Union
+from ..models.grade_detail_set import COLUMN_NAMES, GradeDetailSet
+from .binary_gradebook import DEFAULT_ID_WIDTH, HEADER_SIZE, StudentIdTable
+
+MAGIC = b"GRDR"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHHIQ")
+
+
+def write_result_set(
+    path: Union[str, Path],
+    detail_set: GradeDetailSet,
+    id_width: int = DEFAULT_ID_WIDTH
+) -> None:
+    """Escribe un GradeDetailSet completo sin recorrerlo fila por fila.
+
+    El archivo tiene una cabecera de HEADER_SIZE bytes, las cuatro columnas
+    de GradeDetail como bloques float64 (en el orden de COLUMN_NAMES) y la
+    tabla de identificadores de ancho fijo. Los valores se guardan sin
+    redondear.
+
+    Args:
+        path: Ruta del archivo de salida
+        detail_set: Resultados a exportar
+        id_width: Bytes reservados por identificador (UTF-8)
+
+    Raises:
+        ValueError: Si algún identificador no cabe en id_width bytes
+    """
+    if sys.byteorder != "little":
+        raise ValueError("El archivo binario de resultados requiere una plataforma little-endian")
+
+    encoded_ids = []
+    for student_id in detail_set.student_ids:
+        encoded = student_id.encode("utf-8")
+        if len(encoded) > id_width:
+            raise ValueError(f"El ID del estudiante {student_id} supera {id_width} bytes")
+        encoded_ids.append(encoded.ljust(id_width, b"\0"))
+
+    with open(path, "wb") as target:
+        target.write(
+            HEADER.pack(MAGIC, FORMAT_VERSION, len(COLUMN_NAMES), id_width, len(detail_set))
+            .ljust(HEADER_SIZE, b"\0")
+        )
+        for name in COLUMN_NAMES:
+            column = detail_set.column(name)
+            if not isinstance(column, array) or column.typecode != "d":
+                column = array("d", column)
+            column.tofile(target)
+        target.write(b"".join(encoded_ids))
+
+
+def read_result_set(path: Union[str, Path]) -> GradeDetailSet:
+    """Lee un archivo escrito por write_result_set.
+
+    Las columnas se cargan con array.frombytes y los identificadores se
+    decodifican de forma perezosa.
+
+    Args:
+        path: Ruta del archivo binario
+
+    Returns:
+        GradeDetailSet con los valores guardados
+
+    Raises:
+        ValueError: Si el archivo no corresponde al formato
+    """
+    if sys.byteorder != "little":
+        raise ValueError("El archivo binario de resultados requiere una plataforma little-endian")
+
+    data = Path(path).read_bytes()
+    if len(data) < HEADER_SIZE:
+        raise ValueError("El archivo no es un archivo binario de resultados")
+    magic, version, column_count, id_width, record_count = HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError("El archivo no es un archivo binario de resultados")
+    if version != FORMAT_VERSION or column_count != len(COLUMN_NAMES) or id_width < 1:
+        raise ValueError(f"Versión de archivo de resultados no soportada: {version}")
+
+    column_bytes = 8 * record_count
+    ids_offset = HEADER_SIZE + column_bytes * len(COLUMN_NAMES)
+    expected_size = ids_offset + record_count * id_width
+    if len(data) != expected_size:
+        raise ValueError(
+            f"El archivo de resultados debería tener {expected_size} bytes, "
+            f"pero tiene {len(data)}"
+        )
+
+    columns = []
+    for position in range(len(COLUMN_NAMES)):
+        start = HEADER_SIZE + position * column_bytes
+        column = array("d")
+        column.frombytes(data[start:start + column_bytes])
+        columns.append(column)
+
+    student_ids = StudentIdTable(memoryview(data)[ids_offset:], id_width)
+    return GradeDetailSet(student_ids, *columns)
@@ -0,0 +1,170 @@
+"""Escritores en streaming de resultados y filas rechazadas."""
+
+import csv
+import json
+from pathlib import Path
+from typing import Optional, Union
+from ..models.grade_detail import GradeDetail
+from ..models.grade_detail_set import GradeDetailSet
+from .file_format import CSV_FORMAT, detect_file_format
+
+
+class ResultWriter:
+    """Escribe filas de GradeDetail.to_dict() a CSV o JSONL a medida que llegan.
+
+    Se usa como context manager para garantizar el cierre del archivo.
+    """
+
+    FIELDS = (
+        "student_id",
+        "weighted_average",
+        "attendance_penalty",
+        "extra_points",
+        "final_grade",
+    )
+
+    def __init__(self, path: Union[str, Path], file_format: Optional[str] = None):
+        """Inicializa el escritor.
+
+        Args:
+            path: Ruta del archivo de salida
+            file_format: "csv" o "jsonl"; por defecto se deduce de la extensión
+
+        Raises:
+            ValueError: Si el formato no está soportado
+        """
+        self._path = Path(path)
+        self._file_format = detect_file_format(path, file_format)
+        self._file = None
+        self._csv_writer = None
+        self._rows_written = 0
+
+    @property
+    def rows_written(self) -> int:
+        """Obtiene la cantidad de filas escritas."""
+        return self._rows_written
+
+    def open(self) -> "ResultWriter":
+        """Abre el archivo de salida y escribe la cabecera si es CSV."""
+        self._file = open(self._path, "w", newline="", encoding="utf-8")
+        if self._file_format == CSV_FORMAT:
+            self._csv_writer = csv.writer(self._file)
+            self._csv_writer.writerow(self.FIELDS)
+        return self
+
+    def write(self, student_id: str, grade_detail: GradeDetail) -> None:
+        """Escribe el detalle de cálculo de un estudiante.
+
+        Args:
+            student_id: Identificador del estudiante
+            grade_detail: Detalle del cálculo (RF05)
+        """
+        row = {"student_id": student_id}
+        row.update(grade_detail.to_dict())
+        if self._csv_writer is not None:
+            self._csv_writer.writerow([row[field] for field in self.FIELDS])
+        else:
+            self._file.write(json.dumps(row, ensure_ascii=False) + "\n")
+        self._rows_written += 1
+
+    def write_set(self, detail_set: GradeDetailSet) -> None:
+        """Escribe todas las filas de un GradeDetailSet en bloque.
+
+        Redondea las columnas completas de una vez y escribe las filas
+        directamente desde ellas, sin crear GradeDetail ni diccionarios por
+        fila. La salida es idéntica a llamar write por cada estudiante.
+
+        Args:
+            detail_set: Resultados columnares del cálculo
+        """
+        rounded = detail_set.rounded()
+        rows = zip(
+            detail_set.student_ids,
+            rounded.weighted_averages,
+            rounded.attendance_penalties,
+            rounded.extra_points,
+            rounded.final_grades,
+        )
+        if self._csv_writer is not None:
+            self._csv_writer.writerows(rows)
+        else:
+            self._file.writelines(
+                f'{{"student_id": {json.dumps(student_id, ensure_ascii=False)}, '
+                f'"weighted_average": {weighted_average!r}, '
+                f'"attendance_penalty": {attendance_penalty!r}, '
+                f'"extra_points": {extra_points!r}, '
+                f'"final_grade": {final_grade!r}}}\n'
+                for student_id, weighted_average, attendance_penalty, extra_points, final_grade
+                in rows
+            )
+        self._rows_written += len(detail_set)
+
+    def close(self) -> None:
+        """Cierra el archivo de salida."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._csv_writer = None
+
+    def __enter__(self) -> "ResultWriter":
+        """Abre el archivo al entrar al bloque with."""
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Cierra el archivo al salir del bloque with."""
+        self.close()
+
+
+class RejectWriter:
+    """Escribe en CSV las filas rechazadas junto con el mensaje del ValueError."""
+
+    FIELDS = ("line", "student_id", "error")
+
+    def __init__(self, path: Union[str, Path]):
+        """Inicializa el escritor de rechazos.
+
+        Args:
+            path: Ruta del archivo CSV de rechazos
+        """
+        self._path = Path(path)
+        self._file = None
+        self._csv_writer = None
+        self._rows_written = 0
+
+    @property
+    def rows_written(self) -> int:
+        """Obtiene la cantidad de filas rechazadas escritas."""
+        return self._rows_written
+
+    def open(self) -> "RejectWriter":
+        """Abre el archivo de rechazos y escribe la cabecera."""
+        self._file = open(self._path, "w", newline="", encoding="utf-8")
+        self._csv_writer = csv.writer(self._file)
+        self._csv_writer.writerow(self.FIELDS)
+        return self
+
+    def write(self, line_number: int, student_id: str, message: str) -> None:
+        """Registra una fila rechazada.
+
+        Args:
+            line_number: Línea del archivo de entrada
+            student_id: Identificador del estudiante, si se conoce
+            message: Mensaje del ValueError que motivó el rechazo
+        """
+        self._csv_writer.writerow([line_number, student_id, message])
+        self._rows_written += 1
+
+    def close(self) -> None:
+        """Cierra el archivo de rechazos."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._csv_writer = None
+
+    def __enter__(self) -> "RejectWriter":
+        """Abre el archivo al entrar al bloque with."""
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Cierra el archivo al salir del bloque with."""
+        self.close()
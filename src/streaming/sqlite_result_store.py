@@ -0,0 +1,244 @@
+"""Persistencia de resultados de notas en SQLite con escrituras por lotes."""
+
+import sqlite3
+import time
+from array import array
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Tuple, Union
+from ..models.grade_detail import GradeDetail
+from ..models.grade_detail_set import GradeDetailSet
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS grade_results (
+    student_id TEXT PRIMARY KEY,
+    weighted_average REAL NOT NULL,
+    attendance_penalty REAL NOT NULL,
+    extra_points REAL NOT NULL,
+    final_grade REAL NOT NULL,
+    policy_fingerprint TEXT NOT NULL,
+    graded_at REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+_UPSERT = (
+    "INSERT OR REPLACE INTO grade_results ("
+    "student_id, weighted_average, attendance_penalty, extra_points, final_grade, "
+    "policy_fingerprint, graded_at) VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+_SELECT_COLUMNS = (
+    "SELECT student_id, weighted_average, attendance_penalty, extra_points, final_grade "
+    "FROM grade_results"
+)
+
+ResultRow = Tuple[str, float, float, float, float, str, float]
+
+
+class SqliteResultStore:
+    """Almacén persistente de GradeDetail en una base SQLite local.
+
+    Guarda una fila por estudiante con los cuatro campos de GradeDetail, la
+    huella de políticas usada y la fecha de cálculo. Las escrituras se hacen
+    con executemany en lotes dentro de una sola transacción y reemplazan el
+    resultado anterior del mismo estudiante. La base usa WAL, de modo que
+    los lectores no bloquean una escritura masiva en curso.
+
+    La lectura masiva devuelve un GradeDetailSet construido columna por
+    columna, sin crear un objeto por fila. Los REAL de SQLite son flotantes
+    de 64 bits, así que se leen los mismos valores que se escribieron.
+    """
+
+    DEFAULT_BATCH_SIZE = 10_000
+
+    def __init__(self, path: Union[str, Path], batch_size: int = DEFAULT_BATCH_SIZE):
+        """Inicializa el almacén.
+
+        Args:
+            path: Archivo de la base SQLite
+            batch_size: Filas por llamada a executemany
+
+        Raises:
+            ValueError: Si batch_size no es positivo
+        """
+        if batch_size < 1:
+            raise ValueError("El tamaño de lote debe ser mayor que cero")
+
+        self._path = Path(path)
+        self._batch_size = batch_size
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @property
+    def path(self) -> Path:
+        """Obtiene la ruta de la base."""
+        return self._path
+
+    @property
+    def batch_size(self) -> int:
+        """Obtiene la cantidad de filas por lote."""
+        return self._batch_size
+
+    def open(self) -> "SqliteResultStore":
+        """Abre la base y prepara el esquema si no existe."""
+        if self._connection is None:
+            self._connection = sqlite3.connect(str(self._path))
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(_SCHEMA)
+        return self
+
+    def close(self) -> None:
+        """Cierra la base."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def upsert(
+        self,
+        student_id: str,
+        grade_detail: GradeDetail,
+        policy_fingerprint: str,
+        graded_at: Optional[float] = None
+    ) -> None:
+        """Guarda o reemplaza el resultado de un estudiante.
+
+        Args:
+            student_id: Identificador del estudiante
+            grade_detail: Resultado del cálculo
+            policy_fingerprint: Huella de las políticas usadas (policy_fingerprint)
+            graded_at: Marca de tiempo Unix; por defecto la hora actual
+        """
+        self.upsert_many([(student_id, grade_detail)], policy_fingerprint, graded_at)
+
+    def upsert_many(
+        self,
+        results: Iterable[Tuple[str, GradeDetail]],
+        policy_fingerprint: str,
+        graded_at: Optional[float] = None
+    ) -> int:
+        """Guarda o reemplaza muchos resultados en una sola transacción.
+
+        Args:
+            results: Pares (student_id, GradeDetail); se consumen por lotes
+            policy_fingerprint: Huella de las políticas usadas
+            graded_at: Marca de tiempo Unix común; por defecto la hora actual
+
+        Returns:
+            Cantidad de filas escritas
+        """
+        timestamp = time.time() if graded_at is None else graded_at
+        return self._write_rows(
+            (
+                student_id, detail.weighted_average, detail.attendance_penalty,
+                detail.extra_points, detail.final_grade, policy_fingerprint, timestamp
+            )
+            for student_id, detail in results
+        )
+
+    def upsert_set(
+        self,
+        detail_set: GradeDetailSet,
+        policy_fingerprint: str,
+        graded_at: Optional[float] = None
+    ) -> int:
+        """Guarda o reemplaza un GradeDetailSet leyendo sus columnas directamente.
+
+        Args:
+            detail_set: Resultados en columnas
+            policy_fingerprint: Huella de las políticas usadas
+            graded_at: Marca de tiempo Unix común; por defecto la hora actual
+
+        Returns:
+            Cantidad de filas escritas
+        """
+        size = len(detail_set)
+        timestamp = time.time() if graded_at is None else graded_at
+        return self._write_rows(zip(
+            detail_set.student_ids,
+            detail_set.column("weighted_average"),
+            detail_set.column("attendance_penalty"),
+            detail_set.column("extra_points"),
+            detail_set.column("final_grade"),
+            [policy_fingerprint] * size,
+            [timestamp] * size,
+        ))
+
+    def load(self, student_id: str) -> Optional[GradeDetail]:
+        """Obtiene el resultado guardado de un estudiante, o None si no existe."""
+        row = self._open_connection().execute(
+            f"{_SELECT_COLUMNS} WHERE student_id = ?", (student_id,)
+        ).fetchone()
+        return GradeDetail(*row[1:]) if row else None
+
+    def load_set(self, policy_fingerprint: Optional[str] = None) -> GradeDetailSet:
+        """Carga los resultados guardados en columnas, ordenados por student_id.
+
+        Args:
+            policy_fingerprint: Si se indica, solo carga los resultados
+                                calculados con esas políticas
+
+        Returns:
+            GradeDetailSet con una fila por estudiante guardado
+        """
+        connection = self._open_connection()
+        if policy_fingerprint is None:
+            cursor = connection.execute(f"{_SELECT_COLUMNS} ORDER BY student_id")
+        else:
+            cursor = connection.execute(
+                f"{_SELECT_COLUMNS} WHERE policy_fingerprint = ? ORDER BY student_id",
+                (policy_fingerprint,)
+            )
+
+        # Transpone las filas a columnas sin crear objetos por estudiante
+        columns = list(zip(*cursor.fetchall())) or [(), (), (), (), ()]
+        return GradeDetailSet(
+            student_ids=list(columns[0]),
+            weighted_averages=array("d", columns[1]),
+            attendance_penalties=array("d", columns[2]),
+            extra_points=array("d", columns[3]),
+            final_grades=array("d", columns[4])
+        )
+
+    def policy_fingerprint_of(self, student_id: str) -> Optional[str]:
+        """Obtiene la huella de políticas con la que se calculó un estudiante."""
+        row = self._open_connection().execute(
+            "SELECT policy_fingerprint FROM grade_results WHERE student_id = ?",
+            (student_id,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _write_rows(self, rows: Iterator[ResultRow]) -> int:
+        """Escribe filas con executemany por lotes en una sola transacción."""
+        connection = self._open_connection()
+        written = 0
+        with connection:
+            while True:
+                batch = list(islice(rows, self._batch_size))
+                if not batch:
+                    break
+                connection.executemany(_UPSERT, batch)
+                written += len(batch)
+        return written
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """Obtiene la conexión, abriéndola si hace falta."""
+        self.open()
+        return self._connection
+
+    def __len__(self) -> int:
+        """Obtiene la cantidad de estudiantes guardados."""
+        return self._open_connection().execute(
+            "SELECT COUNT(*) FROM grade_results"
+        ).fetchone()[0]
+
+    def __enter__(self) -> "SqliteResultStore":
+        """Abre la base al entrar al bloque with."""
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Cierra la base al salir del bloque with."""
+        self.close()
+
+    def __repr__(self) -> str:
+        """Representación string del almacén."""
+        return f"SqliteResultStore(path={str(self._path)!r}, batch_size={self._batch_size})"
@@ -0,0 +1,33 @@
+"""Fixtures compartidas por los tests de cálculo en lote y en paralelo."""
+
+import pytest
+from src.models.evaluation import Evaluation
+from src.models.student import Student
+
+COHORT_WEIGHTS = (10.0, 20.0, 30.0, 40.0)
+
+
+def _build_cohort(count, id_class=str):
+    """Construye estudiantes con notas variadas y asistencia alternada.
+
+    Args:
+        count: Cantidad de estudiantes
+        id_class: Tipo del student_id (str o una subclase de str)
+    """
+    return [
+        Student(
+            student_id=id_class(f"S{index:04d}"),
+            evaluations=[
+                Evaluation(grade=(index * 7 + position * 3) % 21, weight=weight)
+                for position, weight in enumerate(COHORT_WEIGHTS)
+            ],
+            has_reached_minimum_classes=index % 3 != 0
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.fixture
+def build_students():
+    """Fábrica de cohortes deterministas: build_students(count, id_class=str)."""
+    return _build_cohort
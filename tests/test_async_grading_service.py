@@ -0,0 +1,211 @@
+"""Tests unitarios para AsyncGradingService y GradingHttpServer."""
+
+import asyncio
+import json
+
+import pytest
+from src.models.student import Student
+from src.services.async_grading_service import AsyncGradingService
+from src.services.grade_calculator import GradeCalculator
+from src.services.grading_http_server import GradingHttpServer
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+
+
+def _calculator():
+    """Calculador con acuerdo docente para puntos extra."""
+    return GradeCalculator(AttendancePolicy(), ExtraPointsPolicy(all_years_teachers=[True]))
+
+
+def _student(student_id, grade=15.0):
+    """Estudiante con una evaluación del 100% y asistencia cumplida."""
+    student = Student(student_id=student_id, has_reached_minimum_classes=True)
+    _calculator().register_evaluation(student, grade=grade, weight=100.0)
+    return student
+
+
+async def _post(port, body):
+    """Envía un POST /grades y devuelve (código, cuerpo JSON)."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    payload = json.dumps(body).encode("utf-8")
+    writer.write(
+        b"POST /grades HTTP/1.1\r\nHost: localhost\r\n"
+        + f"Content-Length: {len(payload)}\r\n\r\n".encode("ascii")
+        + payload
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, content = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(content)
+
+
+class TestAsyncGradingService:
+    """Tests para la clase AsyncGradingService."""
+
+    def test_shouldCoalesceConcurrentRequestsIntoOneBatch(self):
+        """Debería calcular solicitudes concurrentes en un único lote."""
+        async def scenario():
+            async with AsyncGradingService(_calculator(), max_wait_seconds=0.05) as service:
+                details = await asyncio.gather(*(
+                    service.calculate_final_grade(_student(f"S{index:03d}", 10.0 + index))
+                    for index in range(10)
+                ))
+            return service, details
+
+        service, details = asyncio.run(scenario())
+
+        assert [detail.final_grade for detail in details] == [11.0 + i for i in range(10)]
+        assert service.batches_processed == 1
+        assert service.calculations == 10
+
+    def test_shouldShareComputationForDuplicateInFlightRequests(self):
+        """Debería compartir un cálculo entre solicitudes duplicadas en vuelo."""
+        async def scenario():
+            async with AsyncGradingService(_calculator()) as service:
+                student = _student("S001")
+                details = await asyncio.gather(*(
+                    service.calculate_final_grade(student) for _ in range(5)
+                ))
+            return service, details
+
+        service, details = asyncio.run(scenario())
+
+        assert all(detail is details[0] for detail in details)
+        assert service.requests_received == 5
+        assert service.requests_coalesced == 4
+        assert service.calculations == 1
+
+    def test_shouldSplitBatchesByMaxSize(self):
+        """Debería respetar el tamaño máximo de lote."""
+        async def scenario():
+            async with AsyncGradingService(_calculator(), max_batch_size=4) as service:
+                await asyncio.gather(*(
+                    service.calculate_final_grade(_student(f"S{index:03d}"))
+                    for index in range(10)
+                ))
+            return service
+
+        service = asyncio.run(scenario())
+
+        assert service.batches_processed == 3
+
+    def test_shouldIsolateValidationErrorsPerRequest(self):
+        """Debería fallar solo la solicitud inválida del lote."""
+        async def scenario():
+            async with AsyncGradingService(_calculator()) as service:
+                return await asyncio.gather(
+                    service.calculate_final_grade(_student("S001")),
+                    service.calculate_final_grade(Student(student_id="S002")),
+                    return_exceptions=True
+                )
+
+        valid, invalid = asyncio.run(scenario())
+
+        assert valid.final_grade == 16.0
+        assert isinstance(invalid, ValueError)
+
+    def test_shouldKeepServingAfterUnexpectedError(self):
+        """Debería entregar cualquier error a su solicitud sin detener los lotes."""
+        class FailingCalculator(GradeCalculator):
+            def calculate_final_grade(self, student):
+                if student.student_id == "S666":
+                    raise TypeError("dato no numérico")
+                return super().calculate_final_grade(student)
+
+        calculator = FailingCalculator(
+            AttendancePolicy(), ExtraPointsPolicy(all_years_teachers=[True])
+        )
+
+        async def scenario():
+            async with AsyncGradingService(calculator, max_wait_seconds=0.01) as service:
+                first = await asyncio.gather(
+                    service.calculate_final_grade(_student("S666")),
+                    service.calculate_final_grade(_student("S001")),
+                    return_exceptions=True
+                )
+                later = await asyncio.wait_for(
+                    service.calculate_final_grade(_student("S002", 12.0)), timeout=1.0
+                )
+            return first, later
+
+        (failed, valid), later = asyncio.run(scenario())
+
+        assert isinstance(failed, TypeError)
+        assert valid.final_grade == 16.0
+        assert later.final_grade == 13.0
+
+    def test_shouldRaiseErrorWhenNotStarted(self):
+        """Debería lanzar error si el servicio no fue iniciado."""
+        service = AsyncGradingService(_calculator())
+
+        with pytest.raises(RuntimeError, match="no está iniciado"):
+            asyncio.run(service.calculate_final_grade(_student("S001")))
+
+
+class TestGradingHttpServer:
+    """Tests para la clase GradingHttpServer."""
+
+    def test_shouldServeGradeDetailOverHttp(self):
+        """Debería responder el detalle del cálculo en JSON."""
+        async def scenario():
+            server = GradingHttpServer(AsyncGradingService(_calculator()), port=0)
+            await server.start()
+            try:
+                return await asyncio.gather(
+                    _post(server.port, {
+                        "student_id": "S001",
+                        "has_reached_minimum_classes": True,
+                        "evaluations": [{"grade": 14.0, "weight": 50.0},
+                                        {"grade": 16.0, "weight": 50.0}],
+                    }),
+                    _post(server.port, {"student_id": "S002", "evaluations": "x"}),
+                )
+            finally:
+                await server.stop()
+
+        (status, body), (error_status, error_body) = asyncio.run(scenario())
+
+        assert status == 200
+        assert body == {
+            "student_id": "S001",
+            "weighted_average": 15.0,
+            "attendance_penalty": 0.0,
+            "extra_points": 1.0,
+            "final_grade": 16.0,
+        }
+        assert error_status == 400
+        assert error_body["error"] == "evaluations debe ser una lista"
+
+    def test_shouldRejectOversizedHeadersAndReportInternalErrors(self):
+        """Debería responder 431 a cabeceras excesivas y 500 a errores inesperados."""
+        async def raw_request(port, head):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(head)
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+            return int(response.split()[1])
+
+        async def scenario():
+            service = AsyncGradingService(_calculator())
+            server = GradingHttpServer(service, port=0)
+            await server.start()
+            try:
+                many_headers = b"POST /grades HTTP/1.1\r\n" + b"X-Relleno: 1\r\n" * 200
+                long_header = b"POST /grades HTTP/1.1\r\nX-Relleno: " + b"a" * 70_000
+                statuses = [
+                    await raw_request(server.port, many_headers + b"\r\n"),
+                    await raw_request(server.port, long_header + b"\r\n\r\n"),
+                ]
+                await service.stop()
+                statuses.append((await _post(server.port, {
+                    "student_id": "S001",
+                    "has_reached_minimum_classes": True,
+                    "evaluations": [{"grade": 14.0, "weight": 100.0}],
+                }))[0])
+                return statuses
+            finally:
+                await server.stop()
+
+        assert asyncio.run(scenario()) == [431, 431, 500]
@@ -66,3 +66,13 @@ class TestAttendancePolicy:
 
         assert final_grade == custom_penalty
         assert policy.penalty_grade == custom_penalty
+
+    def test_shouldChangeFingerprintWhenPenaltyGradeChanges(self):
+        """Debería reflejar en la huella un cambio de la nota de penalización."""
+        policy = AttendancePolicy()
+        previous = policy.fingerprint
+
+        policy.set_penalty_grade(5.0)
+
+        assert policy.penalty_grade == 5.0
+        assert policy.fingerprint != previous
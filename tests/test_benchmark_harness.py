@@ -0,0 +1,56 @@
+"""Tests unitarios para las herramientas de benchmark."""
+
+import pytest
+from benchmarks.harness import (
+    BenchmarkResult,
+    find_regressions,
+    load_baseline,
+    measure,
+    percentile_of_sorted,
+    save_baseline,
+)
+
+
+class TestBenchmarkHarness:
+    """Tests para la medición y comparación de benchmarks."""
+
+    def test_shouldComputeNearestRankPercentiles(self):
+        """Debería calcular percentiles por rango más cercano."""
+        result = BenchmarkResult("case@100", list(range(100, 0, -1)))
+
+        assert result.p50_ns == 50
+        assert result.p95_ns == 95
+        assert result.p99_ns == 99
+        assert percentile_of_sorted([7], 99) == 7
+
+    def test_shouldMeasureOneSamplePerInput(self):
+        """Debería registrar una muestra por entrada, sin el calentamiento."""
+        calls = []
+
+        result = measure("case@3", calls.append, [1, 2, 3], warmup_inputs=[0])
+
+        assert calls == [0, 1, 2, 3]
+        assert result.iterations == 3
+
+    def test_shouldDetectRegressionAboveThreshold(self, tmp_path):
+        """Debería informar regresiones que superan el umbral del baseline."""
+        baseline_path = tmp_path / "baseline.json"
+        save_baseline(baseline_path, [
+            BenchmarkResult("fast@10", [100] * 10),
+            BenchmarkResult("slow@10", [100] * 10),
+        ])
+        current = [
+            BenchmarkResult("fast@10", [110] * 10),
+            BenchmarkResult("slow@10", [150] * 10),
+            BenchmarkResult("new@10", [999] * 10),
+        ]
+
+        regressions = find_regressions(current, load_baseline(baseline_path), threshold=0.2)
+
+        assert len(regressions) == 1
+        assert regressions[0].startswith("slow@10: p50_ns 100 -> 150")
+
+    def test_shouldRaiseErrorWhenThereAreNoSamples(self):
+        """Debería lanzar error si no hay muestras."""
+        with pytest.raises(ValueError, match="al menos una muestra"):
+            BenchmarkResult("empty", [])
@@ -0,0 +1,142 @@
+"""Tests unitarios para el libro de notas binario."""
+
+import csv
+
+import pytest
+from src.models.evaluation import Evaluation
+from src.models.student import Student
+from src.services.grade_calculator import GradeCalculator
+from src.streaming.binary_gradebook import (
+    BinaryGradebook,
+    BinaryGradebookWriter,
+    convert_to_gradebook,
+)
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+
+
+@pytest.fixture
+def calculator():
+    """Calculador con políticas por defecto y puntos extra acordados."""
+    return GradeCalculator(AttendancePolicy(), ExtraPointsPolicy(all_years_teachers=[True]))
+
+
+@pytest.fixture
+def gradebook_path(tmp_path):
+    """Libro de notas con tres estudiantes de distinta cantidad de evaluaciones."""
+    path = tmp_path / "cohorte.grdb"
+    with BinaryGradebookWriter(path, record_count=3) as writer:
+        writer.write("S001", [15.5, 17.3], [60.0, 40.0], True)
+        writer.write("S002", [10.0], [100.0], False)
+        writer.write_student(Student(
+            "Ñandú-03",
+            [Evaluation(12.0, 30.0), Evaluation(14.0, 30.0), Evaluation(18.0, 40.0)],
+            has_reached_minimum_classes=True
+        ))
+    return path
+
+
+class TestBinaryGradebook:
+    """Tests para BinaryGradebook y BinaryGradebookWriter."""
+
+    def test_shouldExposeColumnsAsZeroCopyViews(self, gradebook_path):
+        """Debería servir las columnas como memoryview sobre el archivo."""
+        with BinaryGradebook(gradebook_path) as gradebook:
+            assert len(gradebook) == 3
+            assert gradebook.evaluations_per_student == Student.MAX_EVALUATIONS
+            assert isinstance(gradebook.grades, memoryview)
+            assert gradebook.grades.readonly
+            assert list(gradebook.student_ids) == ["S001", "S002", "Ñandú-03"]
+            assert list(gradebook.evaluation_counts) == [2, 1, 3]
+            assert list(gradebook.attendance) == [1, 0, 1]
+            assert gradebook.grades[:2].tolist() == [15.5, 17.3]
+
+    def test_shouldGradeBatchDirectlyFromViews(self, gradebook_path, calculator):
+        """Debería calcular el lote igual que calculate_final_grade por estudiante."""
+        with BinaryGradebook(gradebook_path) as gradebook:
+            results = calculator.calculate_batch_flat(
+                gradebook.student_ids,
+                gradebook.grades,
+                gradebook.weights,
+                gradebook.attendance,
+                gradebook.evaluations_per_student,
+                gradebook.evaluation_counts
+            )
+            expected = [
+                calculator.calculate_final_grade(student)
+                for student in gradebook.iter_students()
+            ]
+
+        for index, detail in enumerate(expected):
+            assert results.detail_at(index).to_dict() == detail.to_dict()
+
+    def test_shouldRaiseErrorWhenFileIsNotAGradebook(self, tmp_path):
+        """Debería rechazar archivos sin la cabecera del formato."""
+        path = tmp_path / "otro.grdb"
+        path.write_bytes(b"student_id,grade,weight\n" * 4)
+
+        with pytest.raises(ValueError, match="no es un libro de notas"):
+            BinaryGradebook(path).open()
+
+    def test_shouldRaiseErrorWhenFewerRecordsAreWritten(self, tmp_path):
+        """Debería lanzar error si no se escriben todos los registros reservados."""
+        writer = BinaryGradebookWriter(tmp_path / "incompleto.grdb", record_count=2).open()
+        writer.write("S001", [15.0], [100.0], True)
+
+        with pytest.raises(ValueError, match="se escribieron 1"):
+            writer.close()
+
+    def test_shouldRaiseErrorWhenStudentIdDoesNotFit(self, tmp_path):
+        """Debería rechazar identificadores más largos que id_width."""
+        with BinaryGradebookWriter(tmp_path / "ids.grdb", 1, id_width=4) as writer:
+            with pytest.raises(ValueError, match="supera 4 bytes"):
+                writer.write("S000001", [15.0], [100.0], True)
+            writer.write("S001", [15.0], [100.0], True)
+
+    def test_shouldConvertCsvExport(self, tmp_path):
+        """Debería convertir una exportación CSV agrupando por estudiante y sin filas inválidas."""
+        source = tmp_path / "notas.csv"
+        with open(source, "w", newline="", encoding="utf-8") as target:
+            writer = csv.writer(target)
+            writer.writerow(["student_id", "grade", "weight", "has_reached_minimum_classes"])
+            writer.writerows([
+                ["S001", "15", "50", "true"],
+                ["S001", "16", "50", "true"],
+                ["S002", "25", "100", "false"],
+                ["S003", "11", "100", "false"],
+            ])
+        rejected = []
+
+        written = convert_to_gradebook(
+            source, tmp_path / "notas.grdb", on_reject=lambda *row: rejected.append(row)
+        )
+
+        with BinaryGradebook(tmp_path / "notas.grdb") as gradebook:
+            assert written == 3
+            assert list(gradebook.student_ids) == ["S001", "S002", "S003"]
+            assert list(gradebook.evaluation_counts) == [2, 0, 1]
+            assert len(rejected) == 1
+
+    def test_shouldKeepResultIdsValidAfterClose(self, gradebook_path, calculator):
+        """Debería poder leer los IDs del resultado después de cerrar el libro."""
+        with BinaryGradebook(gradebook_path) as gradebook:
+            results = calculator.calculate_batch_flat(
+                gradebook.student_ids, gradebook.grades, gradebook.weights,
+                gradebook.attendance, gradebook.evaluations_per_student,
+                gradebook.evaluation_counts,
+            )
+
+        assert list(results.student_ids) == ["S001", "S002", "Ñandú-03"]
+        assert results.student_id_at(2) == "Ñandú-03"
+
+    def test_shouldCloseFileEvenWhenCallerHoldsAView(self, gradebook_path):
+        """Debería dejar el libro cerrado aunque el mapeo siga exportado."""
+        gradebook = BinaryGradebook(gradebook_path).open()
+        held = gradebook.grades[:2]
+
+        with pytest.raises(BufferError):
+            gradebook.close()
+
+        assert gradebook.grades is None
+        gradebook.close()  # Un segundo cierre no falla
+        held.release()
@@ -0,0 +1,109 @@
+"""Tests unitarios para BulkValidator."""
+
+from array import array
+import pytest
+from src.services.bulk_validator import (
+    RULE_GRADE_NOT_NUMBER,
+    RULE_GRADE_RANGE,
+    RULE_NO_EVALUATIONS,
+    RULE_WEIGHT_RANGE,
+    RULE_WEIGHT_SUM,
+    BulkValidator,
+)
+from src.services.grade_calculator import GradeCalculator
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+
+
+class TestBulkValidator:
+    """Tests para la clase BulkValidator."""
+
+    def test_shouldReportNoViolationsForValidBatch(self):
+        """Debería aceptar un lote válido sin revisar elemento por elemento."""
+        report = BulkValidator().validate_batch(
+            ["S001", "S002"],
+            grades=[[15.0, 16.0], [20.0]],
+            weights=[[50.0, 50.0], [100.0]]
+        )
+
+        assert report.is_valid
+        assert report.students_checked == 2
+        assert len(report) == 0
+
+    def test_shouldReportEveryViolationInsteadOfRaising(self):
+        """Debería reportar todas las violaciones con fila, estudiante y regla."""
+        report = BulkValidator().validate_batch(
+            ["S001", "S002", "S003", "S004"],
+            grades=[[21.0, -1.0], [15.0], [], [10.0]],
+            weights=[[50.0, 50.0], [101.0], [], [60.0]]
+        )
+
+        found = [(v.row, v.student_id, v.rule, v.evaluation_index) for v in report]
+        assert found == [
+            (0, "S001", RULE_GRADE_RANGE, 0),
+            (0, "S001", RULE_GRADE_RANGE, 1),
+            (1, "S002", RULE_WEIGHT_RANGE, 0),
+            (1, "S002", RULE_WEIGHT_SUM, None),
+            (2, "S003", RULE_NO_EVALUATIONS, None),
+            (3, "S004", RULE_WEIGHT_SUM, None),
+        ]
+        assert report.invalid_rows() == {0, 1, 2, 3}
+        assert report.count_by_rule()[RULE_GRADE_RANGE] == 2
+
+    def test_shouldUseSameMessagesAsModels(self):
+        """Debería usar los mismos mensajes que Evaluation y GradeCalculator."""
+        report = BulkValidator().validate_batch(
+            ["S001", "S002"], grades=[[25.0], [10.0]], weights=[[100.0], [60.0]]
+        )
+
+        messages = [violation.message for violation in report]
+        assert messages[0] == "La nota debe estar entre 0.0 y 20.0"
+        assert messages[1].startswith("Los pesos de las evaluaciones deben sumar 100.0%")
+
+    def test_shouldReportNonNumericAndNanValues(self):
+        """Debería reportar valores no numéricos y NaN sin abortar."""
+        report = BulkValidator().validate_batch(
+            ["S001", "S002"],
+            grades=[["quince"], [float("nan")]],
+            weights=[[100.0], [100.0]]
+        )
+
+        assert [violation.rule for violation in report] == [
+            RULE_GRADE_NOT_NUMBER, RULE_GRADE_RANGE
+        ]
+        assert report.to_dicts()[0]["value"] == "quince"
+
+    def test_shouldOnlyCheckUsedPositionsOfFlatColumns(self):
+        """Debería ignorar el relleno fuera de evaluation_counts."""
+        grades = array("d", [15.0, 99.0, 12.0, 14.0])
+        weights = array("d", [100.0, -5.0, 50.0, 50.0])
+
+        report = BulkValidator().validate_batch_flat(
+            ["S001", "S002"], grades, weights, 2, evaluation_counts=[1, 2]
+        )
+
+        assert report.is_valid
+
+    def test_shouldAgreeWithCalculateBatchFlat(self):
+        """Las filas válidas deberían ser aceptadas por el cálculo en lote."""
+        student_ids = ["S001", "S002", "S003"]
+        grades = array("d", [15.0, 16.0, 10.0, 12.0, 18.0, 19.0])
+        weights = array("d", [33.33, 66.67, 50.0, 49.0, 50.0, 50.0])
+        calculator = GradeCalculator(
+            AttendancePolicy(), ExtraPointsPolicy(all_years_teachers=[True])
+        )
+
+        report = BulkValidator().validate_batch_flat(student_ids, grades, weights, 2)
+        valid_rows = [row for row in range(3) if row not in report.invalid_rows()]
+
+        assert report.invalid_rows() == {1}
+        for row in valid_rows:
+            calculator.calculate_batch_flat(
+                [student_ids[row]], grades[row * 2:row * 2 + 2],
+                weights[row * 2:row * 2 + 2], [True], 2
+            )
+
+    def test_shouldRaiseErrorWhenShapesDoNotMatch(self):
+        """Debería lanzar error si las columnas no tienen n * k elementos."""
+        with pytest.raises(ValueError, match="n \\* k"):
+            BulkValidator().validate_batch_flat(["S001"], [15.0], [50.0, 50.0], 2)
@@ -0,0 +1,129 @@
+"""Tests unitarios para CachedGradeCalculator."""
+
+import pytest
+from src.models.student import Student
+from src.services.cached_grade_calculator import CachedGradeCalculator
+from src.services.grade_calculator import GradeCalculator
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+
+
+class _FakeClock:
+    """Reloj controlable para probar el TTL."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def extra_points_policy():
+    """Política de puntos extra con acuerdo docente."""
+    return ExtraPointsPolicy(all_years_teachers=[True, True])
+
+
+@pytest.fixture
+def calculator(extra_points_policy):
+    """Calculador con políticas por defecto."""
+    return GradeCalculator(AttendancePolicy(), extra_points_policy)
+
+
+def _register_student(cache, student_id, grade=15.0):
+    """Crea un estudiante con una evaluación del 100% registrada vía la caché."""
+    student = Student(student_id=student_id, has_reached_minimum_classes=True)
+    cache.register_evaluation(student, grade=grade, weight=100.0)
+    return student
+
+
+class TestCachedGradeCalculator:
+    """Tests para la clase CachedGradeCalculator."""
+
+    def test_shouldReturnStoredDetailOnHit(self, calculator):
+        """Debería devolver el mismo GradeDetail sin recalcular."""
+        cache = CachedGradeCalculator(calculator)
+        student = _register_student(cache, "S001")
+
+        first = cache.calculate_final_grade(student)
+        second = cache.calculate_final_grade(student)
+
+        assert second is first
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_shouldInvalidateWhenEvaluationIsRegistered(self, calculator):
+        """Debería recalcular tras register_evaluation."""
+        cache = CachedGradeCalculator(calculator)
+        student = Student(student_id="S001", has_reached_minimum_classes=True)
+        cache.register_evaluation(student, grade=10.0, weight=50.0)
+        cache.register_evaluation(student, grade=12.0, weight=50.0)
+        first = cache.calculate_final_grade(student)
+
+        cache.register_attendance(student, has_reached_minimum=False)
+        second = cache.calculate_final_grade(student)
+
+        assert first.final_grade == 12.0
+        assert second.final_grade == 1.0
+        assert cache.misses == 2
+
+    def test_shouldMissWhenStudentChangesOutsideTheCache(self, calculator):
+        """Debería detectar cambios hechos directamente sobre el estudiante."""
+        cache = CachedGradeCalculator(calculator)
+        student = Student(student_id="S001", has_reached_minimum_classes=True)
+        calculator.register_evaluation(student, grade=10.0, weight=50.0)
+        calculator.register_evaluation(student, grade=12.0, weight=50.0)
+        cache.calculate_final_grade(student)
+
+        student.set_attendance_status(False)
+        detail = cache.calculate_final_grade(student)
+
+        assert detail.final_grade == 1.0
+        assert cache.hits == 0
+
+    def test_shouldMissWhenPolicyChanges(self, calculator, extra_points_policy):
+        """Debería recalcular si cambia la huella de las políticas."""
+        cache = CachedGradeCalculator(calculator)
+        student = _register_student(cache, "S001")
+        cache.calculate_final_grade(student)
+
+        extra_points_policy.set_teacher_vote(0, False)
+        detail = cache.calculate_final_grade(student)
+
+        assert detail.extra_points == 0.0
+        assert cache.misses == 2
+
+    def test_shouldEvictLeastRecentlyUsedEntry(self, calculator):
+        """Debería desalojar la entrada menos usada al superar el tamaño."""
+        cache = CachedGradeCalculator(calculator, max_size=2)
+        first = _register_student(cache, "S001")
+        second = _register_student(cache, "S002")
+        third = _register_student(cache, "S003")
+
+        cache.calculate_final_grade(first)
+        cache.calculate_final_grade(second)
+        cache.calculate_final_grade(first)
+        cache.calculate_final_grade(third)
+        cache.calculate_final_grade(first)
+
+        assert cache.evictions == 1
+        assert cache.size == 2
+        assert cache.hits == 2
+
+    def test_shouldExpireEntriesAfterTtl(self, calculator):
+        """Debería descartar entradas vencidas según el TTL."""
+        clock = _FakeClock()
+        cache = CachedGradeCalculator(calculator, ttl_seconds=10.0, clock=clock)
+        student = _register_student(cache, "S001")
+        cache.calculate_final_grade(student)
+
+        clock.now = 10.0
+        cache.calculate_final_grade(student)
+
+        assert cache.expirations == 1
+        assert cache.misses == 2
+
+    def test_shouldRaiseErrorWhenMaxSizeIsNotPositive(self, calculator):
+        """Debería lanzar error si el tamaño máximo no es positivo."""
+        with pytest.raises(ValueError, match="tamaño máximo"):
+            CachedGradeCalculator(calculator, max_size=0)
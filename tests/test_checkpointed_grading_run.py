@@ -0,0 +1,175 @@
+"""Tests unitarios para CheckpointedGradingRun."""
+
+import sqlite3
+
+import pytest
+from src.models.evaluation import Evaluation
+from src.models.student import Student
+from src.services.checkpointed_grading_run import CheckpointedGradingRun
+from src.services.grade_calculator import GradeCalculator
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+
+
+class _CountingCalculator(GradeCalculator):
+    """Calculador que registra los estudiantes calculados."""
+
+    def __init__(self, extra_points=1.0):
+        """Inicializa el calculador con los puntos extra indicados."""
+        super().__init__(AttendancePolicy(), ExtraPointsPolicy([True], extra_points))
+        self.calculated = []
+
+    def calculate_final_grade(self, student):
+        """Registra el estudiante antes de calcular su nota."""
+        self.calculated.append(student.student_id)
+        return super().calculate_final_grade(student)
+
+
+def _interrupted(students, stop_at):
+    """Entrega estudiantes y simula una caída antes de la posición stop_at."""
+    for position, student in enumerate(students):
+        if position == stop_at:
+            raise RuntimeError("ejecución interrumpida")
+        yield student
+
+
+def _section():
+    """Construye una sección con cantidades de evaluaciones y asistencia distintas."""
+    return [
+        Student("A001", [Evaluation(20.0, 100.0)], True),
+        Student("A002", [Evaluation(0.0, 40.0), Evaluation(19.5, 60.0)], False),
+        Student("A003", [Evaluation(10.4, 50.0), Evaluation(10.6, 50.0)], True),
+        Student("A004", [Evaluation(12.0, 25.0)] * 4, True),
+        Student("A005", [Evaluation(15.0, 10.0)] * 10, False),
+        Student("A006", [Evaluation(7.25, 30.0), Evaluation(18.0, 70.0)], True),
+    ]
+
+
+class TestCheckpointedGradingRun:
+    """Tests para la clase CheckpointedGradingRun."""
+
+    def test_shouldResumeWithoutRegradingFinishedStudents(self, build_students, tmp_path):
+        """Debería reanudar desde el checkpoint sin recalcular a nadie."""
+        students = build_students(25)
+        path = tmp_path / "checkpoints.db"
+
+        with CheckpointedGradingRun(_CountingCalculator(), path, checkpoint_interval=4) as run:
+            with pytest.raises(RuntimeError):
+                run.run(_interrupted(students, 10), job_id="cierre")
+            assert run.completed_count("cierre") == 10
+
+        calculator = _CountingCalculator()
+        with CheckpointedGradingRun(calculator, path, checkpoint_interval=4) as run:
+            results = run.run(students, job_id="cierre")
+
+        expected = [GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([True], 1.0))
+                    .calculate_final_grade(student) for student in students]
+        assert calculator.calculated == [s.student_id for s in students[10:]]
+        assert [detail.to_dict() for detail in results] == [e.to_dict() for e in expected]
+        assert [d.final_grade for d in results] == [e.final_grade for e in expected]
+
+    def test_shouldKeepResultsBeforeInvalidStudent(self, build_students, tmp_path):
+        """Debería guardar lo calculado antes de un estudiante inválido."""
+        students = build_students(5) + [Student(student_id="S9999")]
+
+        with CheckpointedGradingRun(
+            _CountingCalculator(), tmp_path / "checkpoints.db", checkpoint_interval=100
+        ) as run:
+            with pytest.raises(ValueError, match="al menos una evaluación"):
+                run.run(students)
+
+            assert run.completed_count("default") == 5
+
+    def test_shouldKeepOriginalErrorWhenFinalCheckpointFails(
+        self, build_students, tmp_path, monkeypatch
+    ):
+        """Debería propagar el error del cálculo aunque falle el último checkpoint."""
+        students = build_students(5) + [Student(student_id="S9999")]
+
+        def failing_checkpoint(*args):
+            raise sqlite3.OperationalError("disco lleno")
+
+        with CheckpointedGradingRun(
+            _CountingCalculator(), tmp_path / "checkpoints.db", checkpoint_interval=100
+        ) as run:
+            monkeypatch.setattr(run, "_checkpoint", failing_checkpoint)
+            with pytest.raises(ValueError, match="al menos una evaluación"):
+                run.run(students)
+
+    def test_shouldResumeFromLastBlockWhenFinalCheckpointWasLost(
+        self, tmp_path, monkeypatch
+    ):
+        """Debería recalcular desde el último bloque si la caída perdió el checkpoint final."""
+        students = _section()
+        path = tmp_path / "checkpoints.db"
+
+        with CheckpointedGradingRun(_CountingCalculator(), path, checkpoint_interval=2) as run:
+            save_block = run._checkpoint
+
+            def lose_emergency_checkpoint(connection, job_id, offset, pending, checksum):
+                if offset == 2:
+                    raise sqlite3.OperationalError("proceso terminado")
+                return save_block(connection, job_id, offset, pending, checksum)
+
+            monkeypatch.setattr(run, "_checkpoint", lose_emergency_checkpoint)
+            with pytest.raises(RuntimeError):
+                run.run(_interrupted(students, 3))
+            assert run.completed_count("default") == 2
+
+        calculator = _CountingCalculator()
+        with CheckpointedGradingRun(calculator, path, checkpoint_interval=2) as run:
+            results = run.run(students)
+
+        expected = GradeCalculator(
+            AttendancePolicy(), ExtraPointsPolicy([True], 1.0)
+        ).calculate_final_grades(students)
+        assert calculator.calculated == ["A003", "A004", "A005", "A006"]
+        assert [detail.final_grade for detail in results] == list(expected.final_grades)
+
+    @pytest.mark.parametrize("changed_input", [
+        lambda students: [students[1], students[0]] + students[2:],
+        lambda students: students[:1],
+    ])
+    def test_shouldRejectResumeWhenStudentSequenceChanged(self, tmp_path, changed_input):
+        """Debería impedir reanudar si cambió la secuencia de estudiantes ya calculada."""
+        students = _section()
+        path = tmp_path / "checkpoints.db"
+        with CheckpointedGradingRun(_CountingCalculator(), path, checkpoint_interval=2) as run:
+            with pytest.raises(RuntimeError):
+                run.run(_interrupted(students, 4))
+
+        calculator = _CountingCalculator()
+        with CheckpointedGradingRun(calculator, path, checkpoint_interval=2) as run:
+            with pytest.raises(ValueError, match="secuencia de estudiantes .* cambió"):
+                run.run(changed_input(students))
+
+            assert run.completed_count("default") == 4
+        assert calculator.calculated == []
+
+    def test_shouldRejectResumeWithDifferentPolicies(self, build_students, tmp_path):
+        """Debería impedir reanudar un trabajo con otras políticas."""
+        path = tmp_path / "checkpoints.db"
+        with CheckpointedGradingRun(_CountingCalculator(1.0), path) as run:
+            run.run(build_students(3))
+
+        with CheckpointedGradingRun(_CountingCalculator(2.0), path) as run:
+            with pytest.raises(ValueError, match="otras políticas"):
+                run.run(build_students(3))
+
+    def test_shouldStartOverAfterClear(self, build_students, tmp_path):
+        """Debería recalcular todo tras eliminar el checkpoint."""
+        calculator = _CountingCalculator()
+        with CheckpointedGradingRun(calculator, tmp_path / "checkpoints.db") as run:
+            run.run(build_students(3))
+            run.clear("default")
+
+            assert run.completed_count("default") == 0
+            assert len(run.run(build_students(3))) == 3
+        assert len(calculator.calculated) == 6
+
+    def test_shouldRaiseErrorWhenIntervalIsNotPositive(self, tmp_path):
+        """Debería lanzar error si el intervalo no es positivo."""
+        with pytest.raises(ValueError, match="intervalo de checkpoint"):
+            CheckpointedGradingRun(
+                _CountingCalculator(), tmp_path / "checkpoints.db", checkpoint_interval=0
+            )
@@ -0,0 +1,81 @@
+"""Tests unitarios para CompactStudent."""
+
+import pytest
+from src.models.compact_student import CompactStudent
+from src.models.evaluation import Evaluation
+from src.models.student import Student
+from src.services.grade_calculator import GradeCalculator
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+
+
+class TestCompactStudent:
+    """Tests para la clase CompactStudent."""
+
+    def test_shouldExposeSamePropertiesAsStudent(self):
+        """Debería exponer las mismas propiedades públicas que Student."""
+        evaluations = [
+            Evaluation(grade=15.0, weight=50.0),
+            Evaluation(grade=16.5, weight=50.0)
+        ]
+
+        student = CompactStudent(
+            student_id="S001",
+            evaluations=evaluations,
+            has_reached_minimum_classes=True
+        )
+
+        assert isinstance(student, Student)
+        assert student.student_id == "S001"
+        assert student.evaluations == evaluations
+        assert student.evaluation_count == 2
+        assert student.has_reached_minimum_classes is True
+
+    def test_shouldNotHaveInstanceDict(self):
+        """No debería reservar un __dict__ por instancia."""
+        student = CompactStudent(student_id="S001")
+
+        assert not hasattr(student, "__dict__")
+
+    def test_shouldRaiseErrorWhenExceedingMaxEvaluations(self):
+        """Debería lanzar error al exceder el máximo de evaluaciones (RNF01)."""
+        student = CompactStudent(student_id="S001")
+
+        for i in range(10):
+            student.add_evaluation(Evaluation(grade=10.0 + i, weight=10.0))
+
+        with pytest.raises(ValueError, match="No se pueden agregar más de 10"):
+            student.add_evaluation(Evaluation(grade=15.0, weight=10.0))
+
+    def test_shouldRaiseErrorWhenCreatingWithTooManyEvaluations(self):
+        """Debería lanzar error al crear con más de 10 evaluaciones."""
+        evaluations = [Evaluation(grade=15.0, weight=10.0) for _ in range(11)]
+
+        with pytest.raises(ValueError, match="No se pueden tener más de 10"):
+            CompactStudent(student_id="S001", evaluations=evaluations)
+
+    def test_shouldRaiseErrorWhenStudentIdIsEmpty(self):
+        """Debería validar el ID igual que Student."""
+        with pytest.raises(ValueError, match="no puede estar vacío"):
+            CompactStudent(student_id="")
+
+    def test_shouldCalculateSameGradeAsStudent(self):
+        """Debería producir la misma nota final que Student."""
+        calculator = GradeCalculator(
+            AttendancePolicy(), ExtraPointsPolicy(all_years_teachers=[True])
+        )
+        student = Student(student_id="S001", has_reached_minimum_classes=True)
+        compact = CompactStudent(student_id="S001", has_reached_minimum_classes=True)
+        for grade, weight in [(15.5, 60.0), (17.3, 40.0)]:
+            calculator.register_evaluation(student, grade=grade, weight=weight)
+            calculator.register_evaluation(compact, grade=grade, weight=weight)
+
+        expected = calculator.calculate_final_grade(student)
+        detail = calculator.calculate_final_grade(compact)
+
+        assert detail.weighted_average == expected.weighted_average
+        assert detail.final_grade == expected.final_grade
+        assert compact.weighted_sum == student.weighted_sum
+        assert calculator.calculate_final_grade_incremental(compact).final_grade == (
+            expected.final_grade
+        )
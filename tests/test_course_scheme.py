@@ -0,0 +1,116 @@
+"""Tests unitarios para la clase CourseScheme."""
+
+import pytest
+from array import array
+from src.models.evaluation import Evaluation
+from src.models.student import Student
+from src.services import CourseScheme
+from src.services.grade_calculator import GradeCalculator
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+
+WEIGHTS = [10.0, 15.0, 20.0, 25.0, 30.0]
+
+
+def _build_calculator():
+    """Crea un calculador con acuerdo docente."""
+    return GradeCalculator(AttendancePolicy(), ExtraPointsPolicy(all_years_teachers=[True]))
+
+
+class TestCourseScheme:
+    """Tests para la validación y el promedio ponderado del esquema."""
+
+    def test_shouldPrecomputeCoefficients(self):
+        """Debería precalcular weight / 100 para cada evaluación."""
+        scheme = CourseScheme([30, 30, 40], name="Cálculo I")
+
+        assert scheme.coefficients == (0.3, 0.3, 0.4)
+        assert scheme.evaluation_count == 3
+        assert scheme == CourseScheme([30.0, 30.0, 40.0])
+
+    def test_shouldRejectInvalidWeightSumAtConstruction(self):
+        """Debería validar la suma de pesos una sola vez al construir."""
+        with pytest.raises(ValueError, match="deben sumar 100.0%"):
+            CourseScheme([30.0, 30.0])
+
+    def test_shouldRejectWeightOutOfRange(self):
+        """Debería aplicar las validaciones de peso de Evaluation."""
+        with pytest.raises(ValueError, match="El peso debe estar entre"):
+            CourseScheme([150.0, -50.0])
+
+    def test_shouldRejectWrongGradeCount(self):
+        """Debería fallar si el vector de notas no coincide con el esquema."""
+        with pytest.raises(ValueError, match="Se esperaban 5 notas, pero hay 2"):
+            CourseScheme(WEIGHTS).weighted_average([15.0, 16.0])
+
+    def test_shouldComputeBatchLikeSingleStudent(self):
+        """Debería obtener en lote el mismo promedio que por estudiante."""
+        scheme = CourseScheme(WEIGHTS)
+        rows = [[15.5, 17.3, 12.1, 8.0, 19.9], [0.0, 20.0, 10.5, 13.7, 11.1]]
+
+        averages = scheme.weighted_averages(array("d", rows[0] + rows[1]))
+
+        assert list(averages) == [scheme.weighted_average(row) for row in rows]
+
+
+class TestGradeCalculatorWithScheme:
+    """Tests para el cálculo de notas con un esquema fijo."""
+
+    def test_shouldMatchCalculateFinalGradeExactly(self):
+        """Debería ser idéntico bit a bit a calculate_final_grade (RNF03)."""
+        calculator = _build_calculator()
+        scheme = CourseScheme(WEIGHTS)
+        grades = [15.5, 17.3, 12.1, 8.0, 19.9]
+        student = Student(
+            student_id="S001",
+            evaluations=[Evaluation(grade=g, weight=w) for g, w in zip(grades, WEIGHTS)],
+            has_reached_minimum_classes=False
+        )
+
+        expected = calculator.calculate_final_grade(student)
+        detail = calculator.calculate_with_scheme(scheme, grades, False)
+
+        assert detail.to_dict() == expected.to_dict()
+
+    def test_shouldCalculateCourseLikeSingleStudents(self):
+        """Debería calcular el curso igual que estudiante por estudiante."""
+        calculator = _build_calculator()
+        scheme = CourseScheme(WEIGHTS)
+        rows = [[15.5, 17.3, 12.1, 8.0, 19.9], [0.0, 20.0, 10.5, 13.7, 11.1]]
+        attendance = [True, False]
+
+        result = calculator.calculate_course(
+            scheme, ["S001", "S002"], array("d", rows[0] + rows[1]), attendance
+        )
+
+        for index, row in enumerate(rows):
+            expected = calculator.calculate_with_scheme(scheme, row, attendance[index])
+            assert result[index].to_dict() == expected.to_dict()
+
+    def test_shouldReportStudentWithGradeOutOfRange(self):
+        """Debería indicar el estudiante con la nota fuera de rango."""
+        calculator = _build_calculator()
+        scheme = CourseScheme([50.0, 50.0])
+
+        with pytest.raises(ValueError, match="Estudiante S002: La nota debe estar entre"):
+            calculator.calculate_course(
+                scheme, ["S001", "S002"], [15.0, 16.0, 12.0, 25.0], [True, True]
+            )
+
+    @pytest.mark.parametrize("invalid_grade", ["x", None])
+    def test_shouldRaiseValueErrorWhenCourseGradeIsNotNumeric(self, invalid_grade):
+        """Debería indicar el estudiante cuya nota no es numérica."""
+        calculator = _build_calculator()
+        scheme = CourseScheme([50.0, 50.0])
+
+        with pytest.raises(ValueError, match="Estudiante S002: La nota debe ser un número"):
+            calculator.calculate_course(
+                scheme, ["S001", "S002"], [15.0, 16.0, 10.0, invalid_grade], [True, True]
+            )
+
+    def test_shouldRejectMismatchedShapes(self):
+        """Debería fallar si las notas no forman una matriz n x k."""
+        with pytest.raises(ValueError, match="n \\* 2 elementos"):
+            _build_calculator().calculate_course(
+                CourseScheme([50.0, 50.0]), ["S001"], [15.0], [True]
+            )
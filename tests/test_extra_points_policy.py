@@ -71,3 +71,52 @@ class TestExtraPointsPolicy:
         teachers_copy[0] = False
 
         assert policy.all_years_teachers == original_list
+
+    def test_shouldPrecomputeGrantedExtraPoints(self):
+        """Debería precalcular los puntos extra a otorgar."""
+        agreed = ExtraPointsPolicy(all_years_teachers=[True, True], extra_points_amount=2.0)
+        not_agreed = ExtraPointsPolicy(all_years_teachers=[True, False])
+
+        assert agreed.granted_extra_points == 2.0
+        assert agreed.all_teachers_agree is True
+        assert not_agreed.granted_extra_points == 0.0
+        assert not_agreed.all_teachers_agree is False
+
+    def test_shouldInvalidateAgreementWhenTeacherVoteChanges(self):
+        """Debería recalcular el acuerdo cuando cambia el voto de un docente."""
+        policy = ExtraPointsPolicy(all_years_teachers=[True, False, True])
+
+        policy.set_teacher_vote(1, True)
+
+        assert policy.should_apply_extra_points() is True
+        assert policy.granted_extra_points == 1.0
+
+        policy.set_teacher_vote(0, False)
+
+        assert policy.calculate_extra_points() == 0.0
+        assert policy.granted_extra_points == 0.0
+
+    def test_shouldNotAllowAssigningGrantedExtraPoints(self):
+        """No debería permitir modificar los puntos extra precalculados."""
+        policy = ExtraPointsPolicy(all_years_teachers=[True])
+
+        with pytest.raises(AttributeError):
+            policy.granted_extra_points = 5.0
+
+        assert policy.granted_extra_points == 1.0
+
+    def test_shouldNotBeAffectedByExternalListMutation(self):
+        """No debería verse afectada si se modifica la lista original."""
+        original_list = [True, True]
+        policy = ExtraPointsPolicy(all_years_teachers=original_list)
+
+        original_list[0] = False
+
+        assert policy.should_apply_extra_points() is True
+
+    def test_shouldRaiseErrorWhenTeacherIndexIsInvalid(self):
+        """Debería lanzar error al votar con un índice inexistente."""
+        policy = ExtraPointsPolicy(all_years_teachers=[True])
+
+        with pytest.raises(ValueError, match="índice de docente"):
+            policy.set_teacher_vote(3, True)
@@ -1,5 +1,7 @@
 """Tests unitarios para GradeCalculator."""
 
+from array import array
+
 import pytest
 from src.models.student import Student
 from src.models.evaluation import Evaluation
@@ -224,3 +226,234 @@ class TestGradeCalculator:
         # Assert
         assert grade_detail.weighted_average == 20.0
         assert grade_detail.final_grade == 20.0
+
+    def test_shouldMatchSingleCalculationWhenGradingBatch(self):
+        """Debería producir los mismos resultados que el cálculo individual."""
+        # Arrange
+        attendance_policy = AttendancePolicy()
+        extra_points_policy = ExtraPointsPolicy(all_years_teachers=[True, True])
+        calculator = GradeCalculator(attendance_policy, extra_points_policy)
+
+        student_ids = ["S001", "S002", "S003"]
+        grades = [[15.5, 17.3], [19.5, 20.0, 18.0], [12.0]]
+        weights = [[60.0, 40.0], [20.0, 30.0, 50.0], [100.0]]
+        attendance = [True, True, False]
+
+        # Act
+        result = calculator.calculate_batch(student_ids, grades, weights, attendance)
+
+        # Assert
+        assert len(result) == 3
+        for index, student_id in enumerate(student_ids):
+            student = Student(
+                student_id=student_id,
+                has_reached_minimum_classes=attendance[index]
+            )
+            for grade, weight in zip(grades[index], weights[index]):
+                calculator.register_evaluation(student, grade=grade, weight=weight)
+            expected = calculator.calculate_final_grade(student)
+
+            detail = result.detail_at(index)
+            assert detail.weighted_average == expected.weighted_average
+            assert detail.attendance_penalty == expected.attendance_penalty
+            assert detail.extra_points == expected.extra_points
+            assert detail.final_grade == expected.final_grade
+
+    def test_shouldRaiseErrorWhenBatchWeightsDoNotSum100(self):
+        """Debería lanzar error en lote cuando los pesos no suman 100%."""
+        # Arrange
+        calculator = GradeCalculator(
+            AttendancePolicy(), ExtraPointsPolicy(all_years_teachers=[True])
+        )
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="S002: Los pesos .* deben sumar 100"):
+            calculator.calculate_batch(
+                ["S001", "S002"],
+                [[15.0], [15.0, 16.0]],
+                [[100.0], [50.0, 30.0]],
+                [True, True]
+            )
+
+    def test_shouldRaiseErrorWhenBatchGradeIsOutOfRange(self):
+        """Debería aplicar las validaciones de rango de Evaluation en lote."""
+        # Arrange
+        calculator = GradeCalculator(
+            AttendancePolicy(), ExtraPointsPolicy(all_years_teachers=[True])
+        )
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="La nota debe estar entre"):
+            calculator.calculate_batch(["S001"], [[21.0]], [[100.0]], [True])
+
+    def test_shouldRaiseValueErrorWhenBatchCellIsNotNumeric(self):
+        """Debería informar el ID cuando una nota o un peso no es numérico."""
+        # Arrange
+        calculator = GradeCalculator(
+            AttendancePolicy(), ExtraPointsPolicy(all_years_teachers=[True])
+        )
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="S002: La nota debe ser un número"):
+            calculator.calculate_batch(
+                ["S001", "S002"], [[15.0], ["15"]], [[100.0], [100.0]], [True, True]
+            )
+        with pytest.raises(ValueError, match="S001: El peso debe ser un número"):
+            calculator.calculate_batch_flat(
+                ["S001"], [15.0], [None], [True], 1
+            )
+
+    def test_shouldRaiseErrorWhenBatchRowHasNoEvaluations(self):
+        """Debería lanzar error en lote cuando una fila no tiene evaluaciones."""
+        # Arrange
+        calculator = GradeCalculator(
+            AttendancePolicy(), ExtraPointsPolicy(all_years_teachers=[True])
+        )
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="al menos una evaluación"):
+            calculator.calculate_batch(
+                ["S001", "S002"], [[15.0], []], [[100.0], []], [True, True]
+            )
+
+    def test_shouldGradeFlatColumnsWithEvaluationCounts(self):
+        """Debería calcular columnas planas usando solo las evaluaciones indicadas."""
+        # Arrange
+        calculator = GradeCalculator(
+            AttendancePolicy(), ExtraPointsPolicy(all_years_teachers=[False])
+        )
+        grades = array("d", [16.0, 14.0, 0.0, 20.0, 0.0, 0.0])
+        weights = array("d", [50.0, 50.0, 0.0, 100.0, 0.0, 0.0])
+
+        # Act
+        result = calculator.calculate_batch_flat(
+            ["S001", "S002"], grades, weights, [True, True], 3, [2, 1]
+        )
+
+        # Assert
+        assert list(result.final_grades) == [15.0, 20.0]
+        assert list(result.extra_points) == [0.0, 0.0]
+
+    def test_shouldUseUpdatedTeacherVoteInNextCalculation(self):
+        """Debería reflejar en el cálculo un cambio de voto docente."""
+        # Arrange
+        extra_points_policy = ExtraPointsPolicy(all_years_teachers=[True, False])
+        calculator = GradeCalculator(AttendancePolicy(), extra_points_policy)
+        student = Student(student_id="S001", has_reached_minimum_classes=True)
+        calculator.register_evaluation(student, grade=15.0, weight=100.0)
+
+        # Act
+        before = calculator.calculate_final_grade(student)
+        extra_points_policy.set_teacher_vote(1, True)
+        after = calculator.calculate_final_grade(student)
+
+        # Assert
+        assert before.final_grade == 15.0
+        assert after.final_grade == 16.0
+
+    def test_shouldMatchFullCalculationWhenUsingIncrementalPath(self):
+        """Debería dar el mismo resultado con los totales acumulados."""
+        # Arrange
+        calculator = GradeCalculator(
+            AttendancePolicy(), ExtraPointsPolicy(all_years_teachers=[True])
+        )
+        student = Student(student_id="S001", has_reached_minimum_classes=True)
+        for grade, weight in [(15.5, 20.0), (17.3, 30.0), (12.1, 50.0)]:
+            calculator.register_evaluation(student, grade=grade, weight=weight)
+
+        # Act
+        full = calculator.calculate_final_grade(student)
+        incremental = calculator.calculate_final_grade_incremental(student)
+
+        # Assert
+        assert incremental.weighted_average == full.weighted_average
+        assert incremental.final_grade == full.final_grade
+
+    def test_shouldValidateWeightsInIncrementalPath(self):
+        """Debería validar los pesos también en el cálculo incremental."""
+        # Arrange
+        calculator = GradeCalculator(
+            AttendancePolicy(), ExtraPointsPolicy(all_years_teachers=[True])
+        )
+        student = Student(student_id="S001")
+        calculator.register_evaluation(student, grade=15.0, weight=50.0)
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="deben sumar 100"):
+            calculator.calculate_final_grade_incremental(student)
+        with pytest.raises(ValueError, match="al menos una evaluación"):
+            calculator.calculate_final_grade_incremental(Student(student_id="S002"))
+
+    def test_shouldMatchSingleCalculationWhenGradingStudentsIntoColumns(self):
+        """Debería devolver en columnas lo mismo que el cálculo individual."""
+        # Arrange
+        calculator = GradeCalculator(
+            AttendancePolicy(), ExtraPointsPolicy(all_years_teachers=[True])
+        )
+        students = [
+            Student("S001", [Evaluation(15.5, 60.0), Evaluation(17.3, 40.0)], True),
+            Student("S002", [Evaluation(12.0, 100.0)], False),
+        ]
+
+        # Act
+        result = calculator.calculate_final_grades(students)
+
+        # Assert
+        assert list(result.student_ids) == ["S001", "S002"]
+        for detail, student in zip(result, students):
+            expected = calculator.calculate_final_grade(student)
+            assert detail.weighted_average == expected.weighted_average
+            assert detail.attendance_penalty == expected.attendance_penalty
+            assert detail.final_grade == expected.final_grade
+
+    def test_shouldMatchSingleCalculationWhenGradingBuffers(self):
+        """Debería calcular desde buffers crudos igual que el cálculo individual."""
+        # Arrange
+        calculator = GradeCalculator(
+            AttendancePolicy(), ExtraPointsPolicy(all_years_teachers=[True])
+        )
+        students = [
+            Student("S001", [Evaluation(15.5, 60.0), Evaluation(17.3, 40.0)], True),
+            Student("S002", [Evaluation(12.0, 30.0), Evaluation(8.5, 70.0)], False),
+        ]
+        grades = bytearray(array("d", [15.5, 17.3, 12.0, 8.5]).tobytes())
+        weights = memoryview(array("d", [60.0, 40.0, 30.0, 70.0])).cast("B").cast(
+            "d", shape=[2, 2]
+        )
+
+        # Act
+        result = calculator.calculate_buffers(
+            ["S001", "S002"], grades, weights, bytes([1, 0]), 2
+        )
+
+        # Assert
+        for detail, student in zip(result, students):
+            assert detail.to_dict() == calculator.calculate_final_grade(student).to_dict()
+        grades.append(0)  # Las vistas se liberaron: el buffer puede crecer
+
+    def test_shouldValidateRangeWhenGradingBuffers(self):
+        """Debería validar el rango de las notas leídas desde un buffer."""
+        # Arrange
+        calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([False]))
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Estudiante S002: La nota debe estar entre"):
+            calculator.calculate_buffers(
+                ["S001", "S002"], array("d", [15.0, 21.0]), array("d", [100.0, 100.0]),
+                [True, True], 1
+            )
+
+    def test_shouldRejectBuffersThatAreNotFloat64(self):
+        """Debería rechazar buffers de otro formato o no contiguos."""
+        # Arrange
+        calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([False]))
+        weights = array("d", [100.0])
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="flotantes de 64 bits"):
+            calculator.calculate_buffers(["S001"], array("f", [15.0, 0.0]), weights, [True], 1)
+        with pytest.raises(ValueError, match="debe ser contiguo"):
+            calculator.calculate_buffers(
+                ["S001"], memoryview(array("d", [15.0, 0.0])).cast("B")[::2], weights,
+                [True], 1
+            )
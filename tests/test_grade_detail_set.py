@@ -0,0 +1,99 @@
+"""Tests unitarios para GradeDetailSet y su exportación en bloque."""
+
+import csv
+import json
+from array import array
+
+import pytest
+from src.models.grade_detail import GradeDetail
+from src.models.grade_detail_set import GradeDetailSet, GradeDetailView
+from src.streaming.result_set_file import read_result_set, write_result_set
+from src.streaming.result_writer import ResultWriter
+
+
+@pytest.fixture
+def detail_set():
+    """Conjunto de dos estudiantes con valores que requieren redondeo."""
+    return GradeDetailSet(
+        student_ids=["S001", "Ñandú"],
+        weighted_averages=array("d", [16.22, 10.005]),
+        attendance_penalties=array("d", [0.0, -9.005]),
+        extra_points=array("d", [1.0, 1.0]),
+        final_grades=array("d", [17.22, 2.0])
+    )
+
+
+class TestGradeDetailSet:
+    """Tests para la clase GradeDetailSet."""
+
+    def test_shouldExposeLazyRowViews(self, detail_set):
+        """Debería devolver vistas que leen las columnas sin copiarlas."""
+        view = detail_set[-1]
+
+        assert isinstance(view, GradeDetailView)
+        assert isinstance(view, GradeDetail)
+        assert view.final_grade == 2.0
+
+        detail_set.final_grades[1] = 3.5
+        assert view.final_grade == 3.5
+        assert view.to_dict() == detail_set.detail_at(1).to_dict()
+
+    def test_shouldRoundColumnsLikeToDict(self, detail_set):
+        """Debería redondear en bloque igual que GradeDetail.to_dict."""
+        rounded = detail_set.rounded()
+
+        for index, detail in enumerate(detail_set.to_details()):
+            expected = detail.to_dict()
+            assert rounded.weighted_averages[index] == expected["weighted_average"]
+            assert rounded.attendance_penalties[index] == expected["attendance_penalty"]
+
+    def test_shouldExportColumnsForJson(self, detail_set):
+        """Debería exportar un diccionario de columnas redondeadas."""
+        columns = detail_set.to_columns()
+
+        assert columns["student_id"] == ["S001", "Ñandú"]
+        assert columns["final_grade"] == [17.22, 2.0]
+        assert json.loads(json.dumps(columns)) == columns
+
+    def test_shouldRaiseErrorWhenIndexIsOutOfRange(self, detail_set):
+        """Debería lanzar IndexError fuera del rango."""
+        with pytest.raises(IndexError):
+            detail_set[2]
+
+
+class TestGradeDetailSetExport:
+    """Tests para la exportación en bloque de GradeDetailSet."""
+
+    @pytest.mark.parametrize("file_name", ["resultados.csv", "resultados.jsonl"])
+    def test_shouldWriteSameOutputAsRowByRow(self, detail_set, tmp_path, file_name):
+        """write_set debería producir el mismo archivo que write por fila."""
+        bulk_path = tmp_path / f"bulk_{file_name}"
+        rows_path = tmp_path / f"rows_{file_name}"
+
+        with ResultWriter(bulk_path) as writer:
+            writer.write_set(detail_set)
+        with ResultWriter(rows_path) as writer:
+            for index, detail in enumerate(detail_set.to_details()):
+                writer.write(detail_set.student_ids[index], detail)
+
+        assert bulk_path.read_text(encoding="utf-8") == rows_path.read_text(encoding="utf-8")
+
+    def test_shouldRoundTripBinaryResultSet(self, detail_set, tmp_path):
+        """Debería leer exactamente los valores escritos en binario."""
+        path = tmp_path / "resultados.grdr"
+
+        write_result_set(path, detail_set)
+        loaded = read_result_set(path)
+
+        assert list(loaded.student_ids) == ["S001", "Ñandú"]
+        assert loaded.weighted_averages == detail_set.weighted_averages
+        assert loaded.final_grades == detail_set.final_grades
+
+    def test_shouldRaiseErrorWhenBinaryFileIsInvalid(self, tmp_path):
+        """Debería rechazar archivos que no son de resultados."""
+        path = tmp_path / "resultados.csv"
+        with open(path, "w", newline="", encoding="utf-8") as target:
+            csv.writer(target).writerows([["student_id"]] * 20)
+
+        with pytest.raises(ValueError, match="no es un archivo binario de resultados"):
+            read_result_set(path)
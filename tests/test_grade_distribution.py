@@ -0,0 +1,136 @@
+"""Tests unitarios para GradeDistribution y RunningDistribution."""
+
+import statistics
+import pytest
+from src.analytics import GradeDistribution, RunningDistribution
+from src.models.evaluation import Evaluation
+from src.models.grade_detail import GradeDetail
+from src.models.student import Student
+from src.services.grade_calculator import GradeCalculator
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+
+VALUES = [15.5, 8.25, 20.0, 0.0, 12.75, 10.5, 17.3, 9.9, 13.1, 11.0]
+
+
+class TestRunningDistribution:
+    """Tests para la clase RunningDistribution."""
+
+    def test_shouldMatchStatisticsModule(self):
+        """Debería calcular media, varianza y extremos como statistics."""
+        distribution = RunningDistribution()
+        for value in VALUES:
+            distribution.add(value)
+
+        assert distribution.count == len(VALUES)
+        assert distribution.mean == pytest.approx(statistics.fmean(VALUES))
+        assert distribution.variance == pytest.approx(statistics.pvariance(VALUES))
+        assert distribution.sample_variance == pytest.approx(statistics.variance(VALUES))
+        assert (distribution.minimum, distribution.maximum) == (0.0, 20.0)
+
+    def test_shouldCountMaximumGradeInLastBin(self):
+        """Debería ubicar 20.0 en la última barra del histograma."""
+        distribution = RunningDistribution(bin_width=5.0)
+        for value in (0.0, 4.99, 5.0, 20.0):
+            distribution.add(value)
+
+        assert distribution.histogram == [2, 1, 0, 1]
+        assert distribution.bin_edges()[-1] == (15.0, 20.0)
+
+    def test_shouldEstimateQuantilesWithinOneBin(self):
+        """Debería estimar cuantiles con error menor a un ancho de barra."""
+        values = [index / 50 for index in range(1001)]
+        distribution = RunningDistribution(bin_width=0.5)
+        for value in values:
+            distribution.add(value)
+
+        percentiles = statistics.quantiles(values, n=100)
+        for percentile in (10, 25, 50, 90):
+            estimate = distribution.quantile(percentile / 100)
+            assert abs(estimate - percentiles[percentile - 1]) < 0.5
+        assert distribution.quantile(0.0) == 0.0
+        assert distribution.quantile(1.0) == 20.0
+
+    def test_shouldMergePartialsLikeSinglePass(self):
+        """Debería combinar agregados parciales como una sola pasada."""
+        whole = RunningDistribution()
+        left, right = RunningDistribution(), RunningDistribution()
+        for index, value in enumerate(VALUES):
+            whole.add(value)
+            (left if index % 3 else right).add(value)
+
+        merged = left.merge(right)
+
+        assert merged.count == whole.count
+        assert merged.mean == pytest.approx(whole.mean)
+        assert merged.variance == pytest.approx(whole.variance)
+        assert merged.histogram == whole.histogram
+        assert (merged.minimum, merged.maximum) == (whole.minimum, whole.maximum)
+
+    def test_shouldRejectMergeWithDifferentBinWidth(self):
+        """Debería impedir combinar histogramas incompatibles."""
+        with pytest.raises(ValueError, match="mismo ancho de barra"):
+            RunningDistribution(0.5).merge(RunningDistribution(1.0))
+
+    def test_shouldRejectBinWidthThatDoesNotDivideScale(self):
+        """Debería lanzar error si el ancho no divide la escala 0-20."""
+        with pytest.raises(ValueError, match="dividir la escala"):
+            RunningDistribution(bin_width=3.0)
+
+    def test_shouldRejectQuantileOfEmptyDistribution(self):
+        """Debería lanzar error al estimar cuantiles sin valores."""
+        with pytest.raises(ValueError, match="no tiene valores"):
+            RunningDistribution().quantile(0.5)
+
+
+class TestGradeDistribution:
+    """Tests para la clase GradeDistribution."""
+
+    def test_shouldAggregateGradeDetailsAndPassRate(self):
+        """Debería acumular ambas columnas y la tasa de aprobación."""
+        details = [GradeDetail(value, 0.0, 0.0, value) for value in VALUES]
+
+        distribution = GradeDistribution(passing_grade=10.5).update(details)
+
+        assert distribution.count == len(VALUES)
+        assert distribution.passed == 7
+        assert distribution.pass_rate == pytest.approx(0.7)
+        assert distribution.final_grade.mean == pytest.approx(statistics.fmean(VALUES))
+        assert distribution.to_dict()["final_grade"]["quantiles"][0.5] == pytest.approx(
+            distribution.final_grade.quantile(0.5)
+        )
+
+    def test_shouldReadGradeDetailSetColumns(self):
+        """Debería acumular un GradeDetailSet igual que sus GradeDetail."""
+        calculator = GradeCalculator(
+            AttendancePolicy(), ExtraPointsPolicy(all_years_teachers=[True])
+        )
+        students = [
+            Student(f"S{index:03d}", [Evaluation(value, 100.0)], index % 4 != 0)
+            for index, value in enumerate(VALUES)
+        ]
+        detail_set = calculator.calculate_final_grades(students)
+
+        from_set = GradeDistribution().update_set(detail_set)
+        from_details = GradeDistribution().update(
+            calculator.calculate_final_grade(student) for student in students
+        )
+
+        assert from_set.to_dict() == from_details.to_dict()
+
+    def test_shouldMergeWorkerPartials(self):
+        """Debería combinar los agregados de varios trabajadores."""
+        details = [GradeDetail(value, 0.0, 0.0, value) for value in VALUES]
+        partials = [GradeDistribution().update(details[start::3]) for start in range(3)]
+
+        merged = partials[0].merge(partials[1]).merge(partials[2])
+        whole = GradeDistribution().update(details)
+
+        assert merged.passed == whole.passed
+        assert merged.weighted_average.histogram == whole.weighted_average.histogram
+        assert merged.final_grade.variance == pytest.approx(whole.final_grade.variance)
+
+    def test_shouldRejectMergeWithDifferentPassingGrade(self):
+        """Debería impedir combinar secciones con otra nota aprobatoria."""
+        with pytest.raises(ValueError, match="misma nota aprobatoria"):
+            GradeDistribution(10.5).merge(GradeDistribution(11.0))
@@ -0,0 +1,200 @@
+"""Tests unitarios para GradePipeline y la lectura en streaming."""
+
+import csv
+import json
+
+import pytest
+from src.services.grade_calculator import GradeCalculator
+from src.services.grade_pipeline import GradePipeline
+from src.streaming.grade_reader import GradeReader
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+
+
+def _write_csv(path, rows):
+    """Escribe un CSV de notas con la cabecera esperada."""
+    with open(path, "w", newline="", encoding="utf-8") as target:
+        writer = csv.writer(target)
+        writer.writerow(["student_id", "grade", "weight", "has_reached_minimum_classes"])
+        writer.writerows(rows)
+
+
+def _read_csv(path):
+    """Lee un CSV como lista de diccionarios."""
+    with open(path, newline="", encoding="utf-8") as source:
+        return list(csv.DictReader(source))
+
+
+@pytest.fixture
+def pipeline():
+    """Pipeline con políticas por defecto y puntos extra acordados."""
+    calculator = GradeCalculator(
+        AttendancePolicy(), ExtraPointsPolicy(all_years_teachers=[True, True])
+    )
+    return GradePipeline(calculator)
+
+
+class TestGradePipeline:
+    """Tests para la clase GradePipeline."""
+
+    def test_shouldGroupRowsAndExportResultsToCsv(self, pipeline, tmp_path):
+        """Debería agrupar filas por estudiante y exportar to_dict() a CSV."""
+        input_path = tmp_path / "grades.csv"
+        _write_csv(input_path, [
+            ["S001", "15", "50", "true"],
+            ["S001", "17", "50", "true"],
+            ["S002", "18", "100", "false"],
+        ])
+
+        summary = pipeline.run(input_path, tmp_path / "out.csv", tmp_path / "rejects.csv")
+
+        results = _read_csv(tmp_path / "out.csv")
+        assert summary.students_graded == 2
+        assert summary.rows_rejected == 0
+        assert results[0] == {
+            "student_id": "S001",
+            "weighted_average": "16.0",
+            "attendance_penalty": "0.0",
+            "extra_points": "1.0",
+            "final_grade": "17.0",
+        }
+        assert results[1]["final_grade"] == "1.0"
+
+    def test_shouldSendInvalidRowsToRejectFile(self, pipeline, tmp_path):
+        """Debería registrar filas inválidas con el mensaje del ValueError."""
+        input_path = tmp_path / "grades.csv"
+        _write_csv(input_path, [
+            ["S001", "25", "50", "true"],
+            ["S001", "17", "50", "true"],
+            ["S002", "18", "100", "true"],
+        ])
+
+        summary = pipeline.run(input_path, tmp_path / "out.csv", tmp_path / "rejects.csv")
+
+        rejects = _read_csv(tmp_path / "rejects.csv")
+        assert summary.students_graded == 1
+        assert rejects[0]["line"] == "2"
+        assert "La nota debe estar entre" in rejects[0]["error"]
+        assert rejects[1]["student_id"] == "S001"
+        assert "deben sumar 100" in rejects[1]["error"]
+
+    def test_shouldRejectNonNumericGrade(self, pipeline, tmp_path):
+        """Debería rechazar notas no numéricas sin abortar la ejecución."""
+        input_path = tmp_path / "grades.csv"
+        _write_csv(input_path, [
+            ["S001", "abc", "100", "true"],
+            ["S002", "12", "100", "true"],
+        ])
+
+        summary = pipeline.run(input_path, tmp_path / "out.csv", tmp_path / "rejects.csv")
+
+        rejects = _read_csv(tmp_path / "rejects.csv")
+        assert summary.students_graded == 1
+        assert rejects[0]["error"] == "La nota debe ser un número"
+
+    def test_shouldRejectStudentLeftWithoutEvaluations(self, pipeline, tmp_path):
+        """Debería rechazar al estudiante cuyas filas fueron todas inválidas."""
+        input_path = tmp_path / "grades.csv"
+        _write_csv(input_path, [
+            ["S001", "20", "100", "true"],
+            ["S002", "25", "50", "true"],
+            ["S002", "abc", "50", "true"],
+            ["S003", "12", "25", "false"],
+            ["S003", "14", "25", "false"],
+            ["S003", "16", "50", "false"],
+        ])
+
+        summary = pipeline.run(input_path, tmp_path / "out.csv", tmp_path / "rejects.csv")
+
+        rejects = _read_csv(tmp_path / "rejects.csv")
+        results = _read_csv(tmp_path / "out.csv")
+        assert [row["student_id"] for row in results] == ["S001", "S003"]
+        assert summary.rows_rejected == 3
+        assert rejects[2]["student_id"] == "S002"
+        assert rejects[2]["error"] == "El estudiante debe tener al menos una evaluación"
+
+    def test_shouldRejectRowsWithConflictingAttendance(self, tmp_path):
+        """Debería informar la asistencia que contradice la primera fila."""
+        input_path = tmp_path / "grades.csv"
+        _write_csv(input_path, [
+            ["S001", "15", "50", "true"],
+            ["S001", "17", "50", "false"],
+            ["S001", "12", "50", "true"],
+        ])
+        rejected = []
+
+        students = list(GradeReader(input_path).iter_students(
+            lambda *row: rejected.append(row)
+        ))
+
+        assert [student.evaluation_count for _, student in students] == [2]
+        assert [line for line, _, _ in rejected] == [3]
+        assert "no coincide con su primera fila" in rejected[0][2]
+
+    def test_shouldKeepOnlyCurrentStudentWhenRowsAreNotConsecutive(self, tmp_path):
+        """Debería entregar cada tramo por separado sin recordar IDs anteriores."""
+        input_path = tmp_path / "grades.csv"
+        _write_csv(input_path, [
+            ["S001", "15", "50", "true"],
+            ["S002", "18", "100", "true"],
+            ["S001", "12", "50", "false"],
+        ])
+        rejected = []
+
+        students = list(GradeReader(input_path).iter_students(
+            lambda *row: rejected.append(row)
+        ))
+
+        assert [(line, student.student_id) for line, student in students] == [
+            (2, "S001"), (3, "S002"), (4, "S001")
+        ]
+        assert [student.has_reached_minimum_classes for _, student in students] == [
+            True, True, False
+        ]
+        assert rejected == []
+
+    def test_shouldReadAndWriteJsonl(self, pipeline, tmp_path):
+        """Debería soportar JSONL como entrada y salida."""
+        input_path = tmp_path / "grades.jsonl"
+        input_path.write_text(
+            '{"student_id": "S001", "grade": 14, "weight": 100, '
+            '"has_reached_minimum_classes": true}\n'
+            "{not json}\n",
+            encoding="utf-8"
+        )
+
+        summary = pipeline.run(
+            input_path, tmp_path / "out.jsonl", tmp_path / "rejects.csv"
+        )
+
+        lines = (tmp_path / "out.jsonl").read_text(encoding="utf-8").splitlines()
+        assert summary.students_graded == 1
+        assert summary.rows_rejected == 1
+        assert json.loads(lines[0]) == {
+            "student_id": "S001",
+            "weighted_average": 14.0,
+            "attendance_penalty": 0.0,
+            "extra_points": 1.0,
+            "final_grade": 15.0,
+        }
+
+    def test_shouldReadStudentsLazily(self, tmp_path):
+        """Debería entregar cada estudiante sin leer el archivo completo."""
+        input_path = tmp_path / "grades.csv"
+        _write_csv(input_path, [
+            ["S001", "15", "100", "true"],
+            ["S002", "16", "100", "true"],
+        ])
+        reader = GradeReader(input_path)
+
+        students = reader.iter_students(on_reject=lambda *args: None)
+        line_number, first_student = next(students)
+
+        assert line_number == 2
+        assert first_student.student_id == "S001"
+        assert first_student.has_reached_minimum_classes is True
+
+    def test_shouldRaiseErrorWhenFormatIsUnsupported(self, tmp_path):
+        """Debería lanzar error con un formato de archivo no soportado."""
+        with pytest.raises(ValueError, match="Formato de archivo no soportado"):
+            GradeReader(tmp_path / "grades.xlsx")
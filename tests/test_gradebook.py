@@ -0,0 +1,95 @@
+"""Tests unitarios para la clase Gradebook."""
+
+import pytest
+from src.models.evaluation import Evaluation
+from src.models.student import Student
+from src.services import Gradebook
+from src.services.grade_calculator import GradeCalculator
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+
+
+def _build_calculator():
+    """Crea un calculador con acuerdo docente."""
+    return GradeCalculator(AttendancePolicy(), ExtraPointsPolicy(all_years_teachers=[True]))
+
+
+def _build_student(student_id, evaluations, has_reached_minimum_classes=True):
+    """Crea un estudiante a partir de pares (nota, peso)."""
+    return Student(
+        student_id,
+        [Evaluation(grade=g, weight=w) for g, w in evaluations],
+        has_reached_minimum_classes
+    )
+
+
+@pytest.fixture
+def gradebook():
+    """Registro con dos secciones."""
+    book = Gradebook()
+    book.add_students([
+        _build_student("S001", [(15.5, 30.0), (17.3, 30.0), (12.1, 40.0)]),
+        _build_student("S002", [(8.0, 50.0), (11.0, 50.0)], False),
+    ], "CS1111-1")
+    book.add_student(_build_student("S003", [(19.0, 100.0)]), "CS1111-2")
+    return book
+
+
+class TestGradebook:
+    """Tests para la clase Gradebook."""
+
+    def test_shouldIndexStudentsByIdAndSection(self, gradebook):
+        """Debería encontrar cada estudiante y su sección sin recorrer listas."""
+        student = gradebook.get("S002")
+
+        assert len(gradebook) == 3
+        assert "S003" in gradebook
+        assert gradebook.sections == ["CS1111-1", "CS1111-2"]
+        assert gradebook.section_of("S003") == "CS1111-2"
+        assert gradebook.section_student_ids("CS1111-1") == ["S001", "S002"]
+        assert [(e.grade, e.weight) for e in student.evaluations] == [(8.0, 50.0), (11.0, 50.0)]
+        assert student.has_reached_minimum_classes is False
+
+    def test_shouldUpdateStudentInPlace(self, gradebook):
+        """Debería registrar evaluaciones y asistencia sobre el registro."""
+        gradebook.add_student(_build_student("S004", [(14.0, 60.0)], False), "CS1111-2")
+
+        gradebook.register_evaluation("S004", 16.0, 40.0)
+        gradebook.register_attendance("S004", True)
+
+        expected = _build_student("S004", [(14.0, 60.0), (16.0, 40.0)])
+        detail = gradebook.grade_student("S004", _build_calculator())
+        assert detail.to_dict() == _build_calculator().calculate_final_grade(expected).to_dict()
+
+    def test_shouldGradeSectionLikeSingleStudents(self, gradebook):
+        """Debería calcular la sección igual que estudiante por estudiante."""
+        calculator = _build_calculator()
+
+        result = gradebook.grade_section("CS1111-1", calculator)
+
+        assert result.student_ids == ["S001", "S002"]
+        for index, student_id in enumerate(result.student_ids):
+            expected = calculator.calculate_final_grade(gradebook.get(student_id))
+            assert result[index].final_grade == expected.final_grade
+            assert result[index].to_dict() == expected.to_dict()
+
+    def test_shouldRejectDuplicateStudent(self, gradebook):
+        """Debería impedir registrar dos veces el mismo ID."""
+        with pytest.raises(ValueError, match="S001 ya está registrado"):
+            gradebook.add_student(_build_student("S001", [(10.0, 100.0)]), "CS1111-2")
+
+    def test_shouldRejectUnknownStudentOrSection(self, gradebook):
+        """Debería lanzar error para IDs o secciones inexistentes."""
+        with pytest.raises(ValueError, match="Estudiante desconocido: 'S999'"):
+            gradebook.register_attendance("S999", True)
+        with pytest.raises(ValueError, match="Sección desconocida"):
+            gradebook.grade_section("CS9999", _build_calculator())
+
+    def test_shouldEnforceEvaluationLimit(self, gradebook):
+        """Debería respetar el máximo de evaluaciones (RNF01)."""
+        gradebook.add_student(
+            _build_student("S005", [(10.0, 10.0)] * Student.MAX_EVALUATIONS), "CS1111-2"
+        )
+
+        with pytest.raises(ValueError, match="más de 10 evaluaciones"):
+            gradebook.register_evaluation("S005", 10.0, 10.0)
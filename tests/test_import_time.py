@@ -0,0 +1,48 @@
+"""Tests de la carga perezosa de paquetes y del presupuesto de importación."""
+
+import pytest
+import src.services
+from benchmarks.import_time import FORBIDDEN_MODULES, loaded_modules, parse_importtime
+
+
+class TestLazyImports:
+    """Tests para la carga perezosa de los paquetes."""
+
+    def test_shouldNotLoadHeavyModulesWhenImportingCalculator(self):
+        """Importar GradeCalculator no debería cargar servicios pesados."""
+        modules = loaded_modules("src.services.grade_calculator")
+
+        assert "src.services.grade_calculator" in modules
+        assert not set(FORBIDDEN_MODULES) & modules
+        assert "src.services.async_grading_service" not in modules
+
+    def test_shouldResolveExportedNamesOnFirstAccess(self):
+        """Debería resolver los nombres exportados bajo demanda."""
+        from src.services.scenario_engine import ScenarioEngine
+
+        assert src.services.ScenarioEngine is ScenarioEngine
+        assert "ScenarioEngine" in dir(src.services)
+
+    def test_shouldRaiseAttributeErrorForUnknownName(self):
+        """Debería lanzar AttributeError para nombres no exportados."""
+        with pytest.raises(AttributeError, match="NoExiste"):
+            src.services.NoExiste
+
+
+class TestParseImportTime:
+    """Tests para parse_importtime."""
+
+    def test_shouldReturnCumulativeTimeOfModule(self):
+        """Debería devolver el tiempo acumulado del módulo pedido."""
+        output = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |     src.models.evaluation\n"
+            "import time:       300 |       4500 | src.services.grade_calculator\n"
+        )
+
+        assert parse_importtime(output, "src.services.grade_calculator") == 4500
+
+    def test_shouldRaiseErrorWhenModuleIsMissing(self):
+        """Debería lanzar error si el módulo no aparece en la salida."""
+        with pytest.raises(ValueError, match="no aparece"):
+            parse_importtime("", "src.services")
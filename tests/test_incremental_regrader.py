@@ -0,0 +1,83 @@
+"""Tests unitarios para IncrementalRegrader."""
+
+import pytest
+from src.models.compact_student import CompactStudent
+from src.models.evaluation import Evaluation
+from src.models.student import Student
+from src.services.grade_calculator import GradeCalculator
+from src.services.incremental_regrader import IncrementalRegrader
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+
+
+def _build_students(count, student_class=Student):
+    """Construye estudiantes con una evaluación parcial del 60%."""
+    return [
+        student_class(
+            f"S{index:03d}", [Evaluation(grade=(index * 3) % 21, weight=60.0)], True
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.fixture
+def setup():
+    """Políticas, calculador y recalculador compartidos."""
+    attendance_policy = AttendancePolicy()
+    extra_points_policy = ExtraPointsPolicy(all_years_teachers=[True, True])
+    calculator = GradeCalculator(attendance_policy, extra_points_policy)
+    return attendance_policy, extra_points_policy, calculator, IncrementalRegrader(calculator)
+
+
+class TestIncrementalRegrader:
+    """Tests para la clase IncrementalRegrader."""
+
+    @pytest.mark.parametrize("student_class", [Student, CompactStudent])
+    def test_shouldOnlyRecomputeChangedStudents(self, setup, student_class):
+        """Debería recalcular solo los estudiantes modificados."""
+        _, _, calculator, regrader = setup
+        students = _build_students(10, student_class)
+        for student in students:
+            student.add_evaluation(Evaluation(grade=12.0, weight=40.0))
+
+        first = regrader.regrade(students)
+        students[3].add_evaluation(Evaluation(grade=20.0, weight=0.0))
+        students[7].set_attendance_status(False)
+        second = regrader.regrade(students)
+
+        assert (first.recomputed, first.skipped, first.policies_changed) == (10, 0, False)
+        assert (second.recomputed, second.skipped, second.policies_changed) == (2, 8, False)
+        for student in students:
+            expected = calculator.calculate_final_grade(student)
+            assert regrader.grade_detail(student.student_id).to_dict() == expected.to_dict()
+
+    def test_shouldRecomputeEveryoneWhenPoliciesChange(self, setup):
+        """Debería invalidar todos los resultados al cambiar las políticas."""
+        attendance_policy, extra_points_policy, _, regrader = setup
+        students = _build_students(5)
+        for student in students:
+            student.add_evaluation(Evaluation(grade=12.0, weight=40.0))
+        regrader.regrade(students)
+
+        attendance_policy.set_penalty_grade(5.0)
+        after_penalty = regrader.regrade(students)
+        extra_points_policy.set_teacher_vote(0, False)
+        after_vote = regrader.regrade(students)
+        unchanged = regrader.regrade(students)
+
+        assert (after_penalty.recomputed, after_penalty.policies_changed) == (5, True)
+        assert (after_vote.recomputed, after_vote.policies_changed) == (5, True)
+        assert (unchanged.recomputed, unchanged.skipped) == (0, 5)
+        assert regrader.grade_detail("S001").extra_points == 0.0
+
+    def test_shouldKeepStudentDirtyWhenGradingFails(self, setup):
+        """Debería dejar pendiente al estudiante con datos inválidos."""
+        _, _, _, regrader = setup
+        students = _build_students(3)
+
+        with pytest.raises(ValueError, match="Estudiante S000: .*deben sumar"):
+            regrader.regrade(students)
+
+        assert students[0].is_dirty is True
+        with pytest.raises(ValueError, match="Estudiante desconocido"):
+            regrader.grade_detail("S000")
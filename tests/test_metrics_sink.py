@@ -0,0 +1,105 @@
+"""Tests unitarios para la instrumentación de GradeCalculator."""
+
+import logging
+import pytest
+from src.instrumentation import InMemoryMetricsSink, LoggingMetricsSink, PrometheusTextFileSink
+from src.instrumentation import logging_sink, metrics_sink as metrics
+from src.models.evaluation import Evaluation
+from src.models.student import Student
+from src.services.grade_calculator import GradeCalculator
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+
+
+def _build_calculator(sink=None):
+    """Crea un calculador con acuerdo docente y el destino indicado."""
+    return GradeCalculator(
+        AttendancePolicy(), ExtraPointsPolicy(all_years_teachers=[True]), metrics_sink=sink
+    )
+
+
+def _build_student(evaluations, has_reached_minimum_classes=True):
+    """Crea un estudiante a partir de pares (nota, peso)."""
+    return Student(
+        student_id="S001",
+        evaluations=[Evaluation(grade=g, weight=w) for g, w in evaluations],
+        has_reached_minimum_classes=has_reached_minimum_classes
+    )
+
+
+class TestGradeCalculatorInstrumentation:
+    """Tests para el cálculo instrumentado."""
+
+    def test_shouldProduceSameResultWithSinkAttached(self):
+        """Debería calcular exactamente lo mismo con o sin instrumentación."""
+        student = _build_student([(15.5, 30.0), (17.3, 30.0), (12.1, 40.0)], False)
+
+        expected = _build_calculator().calculate_final_grade(student)
+        detail = _build_calculator(InMemoryMetricsSink()).calculate_final_grade(student)
+
+        assert detail.to_dict() == expected.to_dict()
+
+    def test_shouldRecordEveryStageDuration(self):
+        """Debería registrar una duración por etapa y por cálculo."""
+        sink = InMemoryMetricsSink()
+        calculator = _build_calculator(sink)
+        student = _build_student([(15.0, 50.0), (16.0, 50.0)])
+
+        calculator.calculate_final_grade(student)
+        calculator.calculate_final_grade(student)
+
+        durations = sink.stage_durations()
+        assert set(durations) == {
+            metrics.STAGE_VALIDATION,
+            metrics.STAGE_WEIGHTED_AVERAGE,
+            metrics.STAGE_ATTENDANCE_POLICY,
+            metrics.STAGE_EXTRA_POINTS,
+            metrics.STAGE_CLAMP,
+        }
+        assert all(stats["count"] == 2 for stats in durations.values())
+        assert sink.histogram(metrics.EVALUATIONS_PER_STUDENT) == {2: 2}
+
+    def test_shouldCountValidationFailuresByReason(self):
+        """Debería contar los fallos de validación según su motivo."""
+        sink = InMemoryMetricsSink()
+        calculator = _build_calculator(sink)
+
+        with pytest.raises(ValueError, match="al menos una evaluación"):
+            calculator.calculate_final_grade(_build_student([]))
+        with pytest.raises(ValueError, match="deben sumar 100.0%"):
+            calculator.calculate_final_grade(_build_student([(15.0, 60.0)]))
+
+        assert sink.counter_value(metrics.VALIDATION_FAILURES, metrics.FAILURE_NO_EVALUATIONS) == 1
+        assert sink.counter_value(metrics.VALIDATION_FAILURES, metrics.FAILURE_WEIGHT_SUM) == 1
+        assert metrics.STAGE_WEIGHTED_AVERAGE not in sink.stage_durations()
+
+    def test_shouldEmitLogRecords(self, caplog):
+        """Debería emitir un registro por métrica con LoggingMetricsSink."""
+        calculator = _build_calculator(LoggingMetricsSink())
+
+        with caplog.at_level(logging.DEBUG, logger=logging_sink.__name__):
+            calculator.calculate_final_grade(_build_student([(15.0, 100.0)]))
+
+        assert any("stage=clamp" in record.getMessage() for record in caplog.records)
+
+
+class TestPrometheusTextFileSink:
+    """Tests para la clase PrometheusTextFileSink."""
+
+    def test_shouldDumpPrometheusTextFormat(self, tmp_path):
+        """Debería volcar etapas, contadores e histograma al archivo."""
+        path = tmp_path / "grades.prom"
+        sink = PrometheusTextFileSink(path, buckets=[1, 5, 10])
+        calculator = _build_calculator(sink)
+        calculator.calculate_final_grade(_build_student([(15.0, 50.0), (16.0, 50.0)]))
+        with pytest.raises(ValueError):
+            calculator.calculate_final_grade(_build_student([(15.0, 60.0)]))
+
+        sink.dump()
+        text = path.read_text(encoding="utf-8")
+
+        assert 'grade_calculator_stage_seconds_count{stage="clamp"} 1' in text
+        assert 'grade_calculator_validation_failures_total{reason="weight_sum"} 1' in text
+        assert 'grade_calculator_evaluations_per_student_bucket{le="1"} 1' in text
+        assert 'grade_calculator_evaluations_per_student_bucket{le="+Inf"} 2' in text
+        assert not (tmp_path / "grades.prom.tmp").exists()
@@ -0,0 +1,63 @@
+"""Tests unitarios para ParallelGradeCalculator."""
+
+import pytest
+from src.models.student import Student
+from src.services.grade_calculator import GradeCalculator
+from src.services.parallel_grade_calculator import ParallelGradeCalculator
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+
+
+class TestParallelGradeCalculator:
+    """Tests para la clase ParallelGradeCalculator."""
+
+    def test_shouldMatchSerialResultsInOriginalOrder(self, build_students):
+        """Debería devolver resultados idénticos al cálculo serial y en orden."""
+        attendance_policy = AttendancePolicy()
+        extra_points_policy = ExtraPointsPolicy(all_years_teachers=[True, True])
+        serial = GradeCalculator(attendance_policy, extra_points_policy)
+        students = build_students(25)
+
+        with ParallelGradeCalculator(
+            attendance_policy, extra_points_policy, max_workers=2, chunk_size=4
+        ) as parallel:
+            results = parallel.calculate_final_grades(students)
+
+        assert len(results) == len(students)
+        for student, detail in zip(students, results):
+            expected = serial.calculate_final_grade(student)
+            assert detail.weighted_average == expected.weighted_average
+            assert detail.attendance_penalty == expected.attendance_penalty
+            assert detail.extra_points == expected.extra_points
+            assert detail.final_grade == expected.final_grade
+
+    def test_shouldPropagateValidationErrorsFromWorkers(self, build_students):
+        """Debería propagar el ValueError de un estudiante inválido."""
+        students = build_students(3)
+        students.append(Student(student_id="S9999"))
+        parallel = ParallelGradeCalculator(
+            AttendancePolicy(),
+            ExtraPointsPolicy(all_years_teachers=[True]),
+            max_workers=1,
+            chunk_size=2
+        )
+
+        with pytest.raises(ValueError, match="al menos una evaluación"):
+            parallel.calculate_final_grades(students)
+
+    def test_shouldReturnEmptyListWhenNoStudents(self):
+        """Debería devolver una lista vacía sin iniciar procesos."""
+        parallel = ParallelGradeCalculator(
+            AttendancePolicy(), ExtraPointsPolicy(all_years_teachers=[True])
+        )
+
+        assert parallel.calculate_final_grades([]) == []
+
+    def test_shouldRaiseErrorWhenChunkSizeIsNotPositive(self):
+        """Debería lanzar error si el tamaño de bloque no es positivo."""
+        with pytest.raises(ValueError, match="tamaño de bloque"):
+            ParallelGradeCalculator(
+                AttendancePolicy(),
+                ExtraPointsPolicy(all_years_teachers=[True]),
+                chunk_size=0
+            )
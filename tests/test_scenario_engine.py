@@ -0,0 +1,85 @@
+"""Tests unitarios para ScenarioEngine."""
+
+import pytest
+from src.models.evaluation import Evaluation
+from src.models.student import Student
+from src.services.grade_calculator import GradeCalculator
+from src.services.scenario_engine import Scenario, ScenarioEngine, teacher_vote_scenarios
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+
+
+@pytest.fixture
+def students():
+    """Cohorte con un estudiante cerca del límite y uno sin asistencia."""
+    return [
+        Student("S001", [Evaluation(15.5, 60.0), Evaluation(17.3, 40.0)], True),
+        Student("S002", [Evaluation(10.0, 50.0), Evaluation(10.2, 50.0)], True),
+        Student("S003", [Evaluation(18.0, 100.0)], False),
+    ]
+
+
+@pytest.fixture
+def scenarios():
+    """Escenario base y variantes de penalización y puntos extra."""
+    return [
+        Scenario("base", AttendancePolicy(), ExtraPointsPolicy([True, True])),
+        Scenario("sin_extra", AttendancePolicy(), ExtraPointsPolicy([True, False])),
+        Scenario("penalidad_11", AttendancePolicy(11.0), ExtraPointsPolicy([True, True])),
+        Scenario("extra_3", AttendancePolicy(), ExtraPointsPolicy([True], 3.0)),
+    ]
+
+
+class TestScenarioEngine:
+    """Tests para la clase ScenarioEngine."""
+
+    def test_shouldMatchGradeCalculatorForEveryScenario(self, students, scenarios):
+        """Debería producir las mismas notas que un GradeCalculator por escenario."""
+        result = ScenarioEngine().run(students, scenarios)
+
+        for scenario in scenarios:
+            calculator = GradeCalculator(
+                scenario.attendance_policy, scenario.extra_points_policy
+            )
+            for index, student in enumerate(students):
+                expected = calculator.calculate_final_grade(student).final_grade
+                assert result.final_grade(index, scenario.name) == expected
+
+    def test_shouldReportPassRateDeltasAgainstBaseline(self, students, scenarios):
+        """Debería calcular la tasa de aprobación y su diferencia con la base."""
+        result = ScenarioEngine(passing_grade=10.5).run(students, scenarios)
+
+        assert result.pass_rate("base") == pytest.approx(2 / 3)
+        assert result.pass_rate_delta("sin_extra") == pytest.approx(-1 / 3)
+        assert result.pass_rate_delta("penalidad_11") == pytest.approx(1 / 3)
+        assert [row["scenario"] for row in result.summary()] == [
+            "base", "sin_extra", "penalidad_11", "extra_3"
+        ]
+
+    def test_shouldShareColumnsBetweenEquivalentScenarios(self, students):
+        """Debería reutilizar la columna de escenarios con los mismos parámetros."""
+        policy = ExtraPointsPolicy([True, True, True])
+        scenarios = [Scenario("base", AttendancePolicy(), policy)]
+        scenarios += teacher_vote_scenarios(AttendancePolicy(), policy)
+
+        result = ScenarioEngine().run(students, scenarios)
+
+        assert len(result) == 4
+        assert result.final_grades("docente_0") is result.final_grades("docente_2")
+        assert result.student_row(1) == [
+            result.final_grade(1, name) for name in result.scenario_names
+        ]
+
+    def test_shouldRaiseErrorWhenScenarioNamesRepeat(self, students):
+        """Debería rechazar escenarios con nombres repetidos."""
+        scenario = Scenario("base", AttendancePolicy(), ExtraPointsPolicy([True]))
+
+        with pytest.raises(ValueError, match="únicos"):
+            ScenarioEngine().run(students, [scenario, scenario])
+
+    def test_shouldRaiseErrorWhenScenarioIsUnknown(self, students, scenarios):
+        """Debería lanzar error al consultar un escenario inexistente."""
+        result = ScenarioEngine().run(students, scenarios)
+
+        with pytest.raises(ValueError, match="Escenario desconocido"):
+            result.pass_rate("otro")
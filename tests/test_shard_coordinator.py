@@ -0,0 +1,174 @@
+"""Tests unitarios para ShardCoordinator."""
+
+import os
+import pytest
+from src.models.evaluation import Evaluation
+from src.models.student import Student
+from src.services.grade_calculator import GradeCalculator
+from src.services.shard_coordinator import ShardCoordinator, shard_for
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+
+FAILURE_MARKER = "SHARD_TEST_FAILURE_MARKER"
+
+
+def _load_failing_id(value, crash):
+    """Reconstruye el ID en el trabajador fallando una sola vez.
+
+    Usa el archivo marcador del entorno para fallar solo en el primer
+    intento, ya sea con una excepción o terminando el proceso.
+    """
+    marker = os.environ[FAILURE_MARKER]
+    if not os.path.exists(marker):
+        open(marker, "w", encoding="utf-8").close()
+        if crash:
+            os._exit(1)
+        raise RuntimeError("fallo transitorio del nodo")
+    return value
+
+
+class _FailOnceId(str):
+    """ID cuya deserialización hace fallar al trabajador una vez."""
+
+    def __reduce__(self):
+        """Deserializa con _load_failing_id."""
+        return _load_failing_id, (str(self), False)
+
+
+class _CrashOnceId(str):
+    """ID cuya deserialización termina el proceso trabajador una vez."""
+
+    def __reduce__(self):
+        """Deserializa con _load_failing_id."""
+        return _load_failing_id, (str(self), True)
+
+
+def _exit_before_connecting(address, authkey):
+    """Simula un trabajador que muere antes de conectarse al coordinador."""
+    os._exit(3)
+
+
+def _build_policies():
+    """Crea las políticas con acuerdo docente."""
+    return AttendancePolicy(), ExtraPointsPolicy(all_years_teachers=[True, True])
+
+
+def _assert_matches_serial(students, results):
+    """Verifica que los resultados coincidan bit a bit con el cálculo serial."""
+    serial = GradeCalculator(*_build_policies())
+    assert len(results) == len(students)
+    for student, detail in zip(students, results):
+        expected = serial.calculate_final_grade(student)
+        assert detail.to_dict() == expected.to_dict()
+        assert detail.final_grade == expected.final_grade
+
+
+class TestShardFor:
+    """Tests para la asignación de shards."""
+
+    def test_shouldAssignStableShardFromCrc32(self):
+        """Debería asignar el mismo shard en cualquier proceso."""
+        assert shard_for("S0001", 16) == shard_for("S0001", 16)
+        assert 0 <= shard_for("S0001", 7) < 7
+
+    def test_shouldPartitionEveryStudentOnce(self, build_students):
+        """Debería repartir cada posición en exactamente un shard."""
+        coordinator = ShardCoordinator(*_build_policies(), shard_count=5)
+
+        shards = coordinator.partition(build_students(40))
+
+        assert sorted(row for rows in shards for row in rows) == list(range(40))
+        assert all(rows == sorted(rows) for rows in shards)
+
+
+class TestShardCoordinator:
+    """Tests para la clase ShardCoordinator."""
+
+    def test_shouldMatchSerialResultsInOriginalOrder(self, build_students):
+        """Debería unir los shards en el orden original, idéntico al serial."""
+        students = build_students(60)
+        coordinator = ShardCoordinator(*_build_policies(), shard_count=7, worker_count=3)
+
+        _assert_matches_serial(students, coordinator.calculate_final_grades(students))
+
+    def test_shouldRetryShardAfterWorkerFailure(self, build_students, tmp_path, monkeypatch):
+        """Debería reintentar un shard cuyo trabajador informó un fallo."""
+        monkeypatch.setenv(FAILURE_MARKER, str(tmp_path / "fallo"))
+        students = build_students(20, _FailOnceId)
+        coordinator = ShardCoordinator(*_build_policies(), shard_count=4, worker_count=2)
+
+        _assert_matches_serial(students, coordinator.calculate_final_grades(students))
+        assert (tmp_path / "fallo").exists()
+
+    def test_shouldRetryShardAfterWorkerCrash(self, build_students, tmp_path, monkeypatch):
+        """Debería reasignar el shard de un trabajador que terminó inesperadamente."""
+        monkeypatch.setenv(FAILURE_MARKER, str(tmp_path / "caida"))
+        students = build_students(20, _CrashOnceId)
+        coordinator = ShardCoordinator(*_build_policies(), shard_count=4, worker_count=2)
+
+        _assert_matches_serial(students, coordinator.calculate_final_grades(students))
+
+    def test_shouldFailWhenRetriesAreExhausted(self, build_students, tmp_path, monkeypatch):
+        """Debería abortar si un shard falla más veces que las permitidas."""
+        monkeypatch.setenv(FAILURE_MARKER, str(tmp_path / "fallo"))
+        students = build_students(5, _FailOnceId)
+        coordinator = ShardCoordinator(
+            *_build_policies(), shard_count=1, worker_count=1, max_retries=0
+        )
+
+        with pytest.raises(RuntimeError, match="El shard 0 falló 1 veces"):
+            coordinator.calculate_final_grades(students)
+
+    def test_shouldFailWhenWorkerDiesBeforeConnecting(self, build_students, monkeypatch):
+        """Debería abortar con un error claro en lugar de esperar para siempre."""
+        monkeypatch.setattr(
+            "src.services.shard_coordinator._serve_shards", _exit_before_connecting
+        )
+        coordinator = ShardCoordinator(*_build_policies(), shard_count=2, worker_count=2)
+
+        with pytest.raises(RuntimeError, match="terminó antes de conectarse"):
+            coordinator.calculate_final_grades(build_students(10))
+
+    def test_shouldPropagateValidationErrorsWithoutRetry(self, build_students):
+        """Debería propagar el ValueError de un estudiante inválido."""
+        students = build_students(3) + [Student(student_id="S9999")]
+        coordinator = ShardCoordinator(*_build_policies(), shard_count=2, worker_count=1)
+
+        with pytest.raises(ValueError, match="Estudiante S9999: .*al menos una evaluación"):
+            coordinator.calculate_final_grades(students)
+
+    def test_shouldReportShardWhoseStudentsHaveNoEvaluations(self):
+        """Debería informar el primer estudiante de un shard sin evaluaciones."""
+        students = [
+            Student("A001", [Evaluation(14.0, 100.0)], True),
+            Student("A002", [Evaluation(9.0, 50.0), Evaluation(13.0, 50.0)], False),
+            Student("A004"),
+            Student("Z004"),
+        ]
+        coordinator = ShardCoordinator(*_build_policies(), shard_count=2, worker_count=2)
+
+        assert coordinator.partition(students) == [[2, 3], [0, 1]]
+        with pytest.raises(ValueError, match="Estudiante A004: .*al menos una evaluación"):
+            coordinator.calculate_final_grades(students)
+
+    def test_shouldPadMixedEvaluationCountsInsideOneShard(self):
+        """Debería rellenar las filas cortas de un shard con cantidades distintas."""
+        students = [
+            Student("A001", [Evaluation(20.0, 10.0)] * 10, True),
+            Student("A002", [Evaluation(11.0, 100.0)], False),
+            Student("A003", [Evaluation(0.0, 30.0), Evaluation(17.5, 30.0),
+                             Evaluation(19.0, 40.0)], True),
+            Student("A005", [Evaluation(10.4, 50.0), Evaluation(10.6, 50.0)], True),
+        ]
+        coordinator = ShardCoordinator(*_build_policies(), shard_count=1, worker_count=1)
+
+        _assert_matches_serial(students, coordinator.calculate_final_grades(students))
+
+    def test_shouldReturnEmptyListWhenNoStudents(self):
+        """Debería devolver una lista vacía sin iniciar trabajadores."""
+        assert ShardCoordinator(*_build_policies()).calculate_final_grades([]) == []
+
+    def test_shouldRaiseErrorWhenShardCountIsNotPositive(self):
+        """Debería lanzar error si la cantidad de shards no es positiva."""
+        with pytest.raises(ValueError, match="cantidad de shards"):
+            ShardCoordinator(*_build_policies(), shard_count=0)
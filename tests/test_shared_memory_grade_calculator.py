@@ -0,0 +1,114 @@
+"""Tests unitarios para SharedMemoryGradeCalculator."""
+
+import os
+import pytest
+from src.models.evaluation import Evaluation
+from src.models.student import Student
+from src.services import SharedMemoryGradeCalculator
+from src.services.grade_calculator import GradeCalculator
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+
+
+def _shared_segments():
+    """Obtiene los segmentos de memoria compartida visibles en el sistema."""
+    return set(os.listdir("/dev/shm")) if os.path.isdir("/dev/shm") else set()
+
+
+class TestSharedMemoryGradeCalculator:
+    """Tests para la clase SharedMemoryGradeCalculator."""
+
+    def test_shouldMatchSerialResultsInOriginalOrder(self, build_students):
+        """Debería devolver columnas idénticas bit a bit al cálculo serial."""
+        attendance_policy = AttendancePolicy()
+        extra_points_policy = ExtraPointsPolicy(all_years_teachers=[True, True])
+        students = build_students(24)
+        # Una fila más corta obliga a rellenar hasta el ancho de la cohorte
+        students.append(Student("S0024", [Evaluation(13.0, 50.0), Evaluation(9.0, 50.0)], False))
+        expected = GradeCalculator(
+            attendance_policy, extra_points_policy
+        ).calculate_final_grades(students)
+
+        with SharedMemoryGradeCalculator(
+            attendance_policy, extra_points_policy, max_workers=2, chunk_size=4
+        ) as parallel:
+            result = parallel.calculate_final_grades(students)
+
+        assert result.student_ids == expected.student_ids
+        assert result.weighted_averages == expected.weighted_averages
+        assert result.attendance_penalties == expected.attendance_penalties
+        assert result.extra_points == expected.extra_points
+        assert result.final_grades == expected.final_grades
+
+    def test_shouldReportStudentIdAndReleaseSegmentsOnInvalidData(self, build_students):
+        """Debería informar el ID real y eliminar los segmentos si hay un error."""
+        students = build_students(6)
+        students.append(Student("S9999", [Evaluation(12.0, 60.0)], True))
+        segments_before = _shared_segments()
+
+        with SharedMemoryGradeCalculator(
+            AttendancePolicy(), ExtraPointsPolicy(all_years_teachers=[False]),
+            max_workers=1, chunk_size=3
+        ) as parallel:
+            with pytest.raises(ValueError, match="Estudiante S9999: Los pesos"):
+                parallel.calculate_final_grades(students)
+
+        assert _shared_segments() == segments_before
+
+    def test_shouldMatchSerialWithMixedEvaluationCountsInOneChunk(self):
+        """Debería leer solo las evaluaciones de cada fila dentro de un mismo bloque."""
+        attendance_policy = AttendancePolicy()
+        extra_points_policy = ExtraPointsPolicy(all_years_teachers=[True])
+        students = [
+            Student("A001", [Evaluation(11.0, 100.0)], True),
+            Student("A002", [Evaluation(20.0, 10.0)] * 10, False),
+            Student("A003", [Evaluation(0.0, 30.0), Evaluation(17.5, 70.0)], True),
+            Student("A004", [Evaluation(10.4, 25.0)] * 4, True),
+        ]
+        expected = GradeCalculator(
+            attendance_policy, extra_points_policy
+        ).calculate_final_grades(students)
+
+        with SharedMemoryGradeCalculator(
+            attendance_policy, extra_points_policy, max_workers=1, chunk_size=4
+        ) as parallel:
+            result = parallel.calculate_final_grades(students)
+
+        assert result.weighted_averages == expected.weighted_averages
+        assert result.final_grades == expected.final_grades
+
+    def test_shouldReportChunkWhoseStudentsHaveNoEvaluations(self):
+        """Debería informar el primer estudiante de un bloque sin evaluaciones."""
+        students = [
+            Student("A001", [Evaluation(14.0, 100.0)], True),
+            Student("A002", [Evaluation(9.0, 50.0), Evaluation(13.0, 50.0)], False),
+            Student("A003"),
+            Student("A004"),
+        ]
+        segments_before = _shared_segments()
+
+        with SharedMemoryGradeCalculator(
+            AttendancePolicy(), ExtraPointsPolicy(all_years_teachers=[False]),
+            max_workers=1, chunk_size=2
+        ) as parallel:
+            with pytest.raises(ValueError, match="Estudiante A003: .*al menos una evaluación"):
+                parallel.calculate_final_grades(students)
+
+        assert _shared_segments() == segments_before
+
+    def test_shouldReturnEmptySetWithoutStudents(self):
+        """Debería devolver un conjunto vacío sin crear procesos."""
+        calculator = SharedMemoryGradeCalculator(
+            AttendancePolicy(), ExtraPointsPolicy(all_years_teachers=[True])
+        )
+
+        assert len(calculator.calculate_final_grades([])) == 0
+
+    def test_shouldRejectInvalidConfiguration(self):
+        """Debería lanzar error si los procesos o el bloque no son positivos."""
+        policies = (AttendancePolicy(), ExtraPointsPolicy(all_years_teachers=[True]))
+
+        with pytest.raises(ValueError, match="procesos"):
+            SharedMemoryGradeCalculator(*policies, max_workers=0)
+        with pytest.raises(ValueError, match="bloque"):
+            SharedMemoryGradeCalculator(*policies, chunk_size=0)
@@ -0,0 +1,85 @@
+"""Tests unitarios para SqliteResultStore."""
+
+import sqlite3
+import pytest
+from src.models.evaluation import Evaluation
+from src.models.student import Student
+from src.services.grade_calculator import GradeCalculator
+from src.streaming import SqliteResultStore
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+
+
+def _grade_students(count, extra_points=1.0):
+    """Calcula un GradeDetailSet de prueba con las políticas indicadas."""
+    calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([True], extra_points))
+    students = [
+        Student(
+            f"S{index:03d}",
+            [Evaluation(grade=(index * 7) % 21 + 0.1, weight=100.0)],
+            index % 3 != 0
+        )
+        for index in range(count)
+    ]
+    return calculator, calculator.calculate_final_grades(students)
+
+
+class TestSqliteResultStore:
+    """Tests para la clase SqliteResultStore."""
+
+    def test_shouldRoundTripResultSetExactly(self, tmp_path):
+        """Debería cargar en columnas los mismos valores escritos."""
+        calculator, detail_set = _grade_students(25)
+
+        with SqliteResultStore(tmp_path / "results.db", batch_size=7) as store:
+            written = store.upsert_set(detail_set, calculator.policy_fingerprint, graded_at=1.0)
+            loaded = store.load_set()
+
+        assert written == 25
+        assert loaded.student_ids == detail_set.student_ids
+        for name in ("weighted_average", "attendance_penalty", "extra_points", "final_grade"):
+            assert loaded.column(name) == detail_set.column(name)
+
+    def test_shouldReplaceExistingResultsOnUpsert(self, tmp_path):
+        """Debería reemplazar el resultado anterior del mismo estudiante."""
+        old_calculator, old_set = _grade_students(5, extra_points=0.0)
+        new_calculator, new_set = _grade_students(3, extra_points=2.0)
+
+        with SqliteResultStore(tmp_path / "results.db") as store:
+            store.upsert_set(old_set, old_calculator.policy_fingerprint)
+            store.upsert_many(
+                zip(new_set.student_ids, new_set), new_calculator.policy_fingerprint
+            )
+
+            assert len(store) == 5
+            assert store.load("S001").to_dict() == new_set[1].to_dict()
+            assert store.policy_fingerprint_of("S004") == old_calculator.policy_fingerprint
+            current = store.load_set(new_calculator.policy_fingerprint)
+            assert current.student_ids == ["S000", "S001", "S002"]
+
+    def test_shouldUseWalAndStoreMetadata(self, tmp_path):
+        """Debería usar WAL y guardar huella y fecha de cálculo por fila."""
+        path = tmp_path / "results.db"
+        calculator, detail_set = _grade_students(1)
+        with SqliteResultStore(path) as store:
+            store.upsert("S000", detail_set[0], calculator.policy_fingerprint, graded_at=42.0)
+
+        connection = sqlite3.connect(str(path))
+        try:
+            assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert connection.execute(
+                "SELECT policy_fingerprint, graded_at FROM grade_results"
+            ).fetchone() == (calculator.policy_fingerprint, 42.0)
+        finally:
+            connection.close()
+
+    def test_shouldReturnEmptySetAndNoneWhenNothingStored(self, tmp_path):
+        """Debería devolver un conjunto vacío y None sin resultados."""
+        with SqliteResultStore(tmp_path / "results.db") as store:
+            assert len(store.load_set()) == 0
+            assert store.load("S999") is None
+
+    def test_shouldRaiseErrorWhenBatchSizeIsNotPositive(self, tmp_path):
+        """Debería lanzar error si el tamaño de lote no es positivo."""
+        with pytest.raises(ValueError, match="tamaño de lote"):
+            SqliteResultStore(tmp_path / "results.db", batch_size=0)
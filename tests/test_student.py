@@ -1,5 +1,7 @@
 """Tests unitarios para Student."""
 
+import pickle
+
 import pytest
 from src.models.student import Student
 from src.models.evaluation import Evaluation
@@ -85,3 +87,62 @@ class TestStudent:
         evaluations_copy.clear()
 
         assert len(student.evaluations) == 1
+
+    def test_shouldNotHaveInstanceDict(self):
+        """No debería reservar un __dict__ por instancia (__slots__)."""
+        student = Student(student_id="S001")
+
+        assert not hasattr(student, "__dict__")
+        assert not hasattr(Evaluation(grade=15.0, weight=100.0), "__dict__")
+
+    def test_shouldIterateEvaluationsWithoutCopying(self):
+        """Debería iterar las evaluaciones en orden sin exponer la lista interna."""
+        student = Student(student_id="S001")
+        first = Evaluation(grade=15.0, weight=40.0)
+        second = Evaluation(grade=17.0, weight=60.0)
+        student.add_evaluation(first)
+        student.add_evaluation(second)
+
+        iterated = list(student.iter_evaluations())
+
+        assert iterated == [first, second]
+        assert student.evaluation_count == 2
+
+    def test_shouldPreserveDataWhenPickled(self):
+        """Debería conservar sus datos al serializarse con pickle."""
+        student = Student(student_id="S001", has_reached_minimum_classes=True)
+        student.add_evaluation(Evaluation(grade=15.0, weight=100.0))
+
+        restored = pickle.loads(pickle.dumps(student))
+
+        assert restored.student_id == "S001"
+        assert restored.evaluations == student.evaluations
+        assert restored.has_reached_minimum_classes is True
+
+    def test_shouldKeepRunningTotalsWhenAddingEvaluations(self):
+        """Debería mantener la suma de pesos y la suma ponderada al agregar."""
+        student = Student(
+            student_id="S001",
+            evaluations=[Evaluation(grade=10.0, weight=40.0)]
+        )
+
+        student.add_evaluation(Evaluation(grade=20.0, weight=60.0))
+
+        assert student.weight_total == 100.0
+        assert student.weighted_sum == 10.0 * 0.4 + 20.0 * 0.6
+
+    def test_shouldTrackChangesUntilMarkedClean(self):
+        """Debería marcarse como modificado al cambiar sus datos."""
+        student = Student(student_id="S001", has_reached_minimum_classes=True)
+        assert student.is_dirty is True
+
+        student.mark_clean()
+        student.set_attendance_status(True)
+        assert student.is_dirty is False
+
+        student.set_attendance_status(False)
+        assert student.is_dirty is True
+
+        student.mark_clean()
+        student.add_evaluation(Evaluation(grade=15.0, weight=100.0))
+        assert student.is_dirty is True